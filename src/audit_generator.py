@@ -3,6 +3,7 @@ Audit page generator for BrokenSite-Weekly.
 Generates personalized HTML audit pages from lead data using Jinja2 templates.
 """
 
+import functools
 import json
 import re
 from datetime import datetime
@@ -139,9 +140,13 @@ NON_ISSUE_REASONS = {
 }
 
 
+_COPYRIGHT_REASON_RE = re.compile(r"copyright_(\d{4})")
+_SERVER_ERROR_REASON_RE = re.compile(r"server_error_(\d{3})")
+
+
 def _parse_copyright_year(reason: str) -> Optional[Dict[str, str]]:
     """Parse copyright_YYYY reason into issue dict."""
-    match = re.match(r"copyright_(\d{4})", reason)
+    match = _COPYRIGHT_REASON_RE.match(reason)
     if not match:
         return None
     year = match.group(1)
@@ -160,7 +165,7 @@ def _parse_copyright_year(reason: str) -> Optional[Dict[str, str]]:
 
 def _parse_server_error(reason: str) -> Optional[Dict[str, str]]:
     """Parse server_error_NNN reason into issue dict."""
-    match = re.match(r"server_error_(\d{3})", reason)
+    match = _SERVER_ERROR_REASON_RE.match(reason)
     if not match:
         return None
     status_code = match.group(1)
@@ -175,17 +180,19 @@ def _parse_server_error(reason: str) -> Optional[Dict[str, str]]:
     }
 
 
+DIY_BUILDER_NAMES = {
+    "diy_wix": "Wix",
+    "diy_squarespace": "Squarespace",
+    "diy_weebly": "Weebly",
+    "diy_godaddy": "GoDaddy Website Builder",
+}
+
+
 def _parse_diy_builder(reason: str) -> Optional[Dict[str, str]]:
     """Parse diy_* builder reasons into issue dict."""
-    builders = {
-        "diy_wix": "Wix",
-        "diy_squarespace": "Squarespace",
-        "diy_weebly": "Weebly",
-        "diy_godaddy": "GoDaddy Website Builder",
-    }
-    if reason not in builders:
+    name = DIY_BUILDER_NAMES.get(reason)
+    if name is None:
         return None
-    name = builders[reason]
     return {
         "title": f"Using {name}",
         "severity": "medium",
@@ -197,34 +204,74 @@ def _parse_diy_builder(reason: str) -> Optional[Dict[str, str]]:
     }
 
 
-def _parse_reasons(reasons_input: str | List[str]) -> List[Dict[str, str]]:
-    """Convert reasons into list of issue dicts."""
-    issues = []
-    for reason in parse_reasons(reasons_input):
-        if not reason:
-            continue
-        if reason in NON_ISSUE_REASONS:
+# Parameterized reasons whose issue text never changes, tried in order when
+# the static lookup misses. copyright_YYYY depends on the current year, so
+# it is resolved per call in _parse_reasons rather than cached.
+_PREFIX_PARSERS = (
+    ("server_error_", _parse_server_error),
+    ("diy_", _parse_diy_builder),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_reasons_cached(
+    reasons: str | Tuple[str, ...],
+) -> Tuple[Dict[str, str] | str, ...]:
+    """
+    Resolve the time-independent reasons of one reasons value; batches
+    repeat the same few. Copyright and unknown reasons stay as strings.
+    """
+    items: List[Dict[str, str] | str] = []
+    for reason in parse_reasons(reasons):
+        if not reason or reason in NON_ISSUE_REASONS:
             continue
         issue = ISSUE_DESCRIPTIONS.get(reason)
         if issue:
-            issues.append(issue.copy())
-        elif reason.startswith("copyright_"):
-            parsed = _parse_copyright_year(reason)
-            if parsed:
-                issues.append(parsed)
-        elif reason.startswith("server_error_"):
-            parsed = _parse_server_error(reason)
-            if parsed:
-                issues.append(parsed)
-        elif reason.startswith("diy_"):
-            parsed = _parse_diy_builder(reason)
+            items.append(issue)
+            continue
+        for prefix, parser in _PREFIX_PARSERS:
+            if reason.startswith(prefix):
+                parsed = parser(reason)
+                if parsed:
+                    items.append(parsed)
+                break
+        else:
+            items.append(reason)
+    return tuple(items)
+
+
+def _parse_reasons(reasons_input: str | List[str] | None) -> List[Dict[str, str]]:
+    """Convert reasons into list of issue dicts (fresh copies per call)."""
+    if not reasons_input:
+        reasons_input = ""
+    elif not isinstance(reasons_input, str):
+        reasons_input = tuple(reasons_input)
+    issues = []
+    for item in _parse_reasons_cached(reasons_input):
+        if isinstance(item, dict):
+            issues.append(dict(item))
+        elif item.startswith("copyright_"):
+            parsed = _parse_copyright_year(item)
             if parsed:
                 issues.append(parsed)
         else:
-            logger.warning(f"Unknown reason '{reason}' - skipping in audit")
+            logger.warning(f"Unknown reason '{item}' - skipping in audit")
     return issues
 
 
+@functools.lru_cache(maxsize=8)
+def _get_jinja_env(templates_dir: str) -> Environment:
+    """
+    One Jinja2 environment per templates directory. The environment caches
+    compiled templates, so audit.html is parsed once per process rather than
+    once per lead; it still stats the file and recompiles if it changes.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+
+
 def generate_audit_html(lead_data: Dict, tracking_base_url: str) -> Optional[str]:
     """
     Generate audit page HTML from lead data using Jinja2 template.
@@ -239,11 +286,7 @@ def generate_audit_html(lead_data: Dict, tracking_base_url: str) -> Optional[str
             )
             return None
 
-        env = Environment(
-            loader=FileSystemLoader(str(TEMPLATES_DIR)),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
-        template = env.get_template("audit.html")
+        template = _get_jinja_env(str(TEMPLATES_DIR)).get_template("audit.html")
 
         html = template.render(
             business_name=lead_data.get("name", "Unknown Business"),
@@ -10,7 +10,7 @@ from typing import List, Dict, Any, Optional
 
 from .config import Config
 from .maps_scraper import scrape_with_isolation
-from .scoring import evaluate_with_isolation
+from .scoring import evaluate_many
 from .logging_setup import get_logger
 
 logger = get_logger("competitor_analysis")
@@ -69,13 +69,13 @@ def score_competitor_websites(
     config: Config,
 ) -> List[Dict[str, Any]]:
     """Score each competitor's website and enrich the dict."""
+    results = evaluate_many(
+        [comp["website"] for comp in competitors],
+        config=config.scoring,
+        retry_config=config.retry,
+    )
     scored = []
-    for comp in competitors:
-        result = evaluate_with_isolation(
-            url=comp["website"],
-            config=config.scoring,
-            retry_config=config.retry,
-        )
+    for comp, result in zip(competitors, results):
         comp = dict(comp)
         comp["score"] = result.score
         comp["reasons"] = result.reasons
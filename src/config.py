@@ -201,12 +201,33 @@ class ScoringConfig:
     # Thresholds
     min_score_to_include: int = 40  # Only include leads scoring >= this
     request_timeout_seconds: int = 15
+    # Body read cap per page (0 = unlimited); every signal sits well inside it
+    max_response_bytes: int = field(
+        default_factory=lambda: int(os.environ.get("MAX_RESPONSE_BYTES", "262144"))
+    )
+    # HEAD before GET so dead/non-HTML sites skip the body download. Opt-in:
+    # healthy sites pay an extra round trip.
+    head_probe_enabled: bool = field(
+        default_factory=lambda: os.environ.get("HEAD_PROBE_ENABLED", "false").lower() == "true"
+    )
     max_redirects: int = 5
     allow_scheme_fallback: bool = True
     playwright_fallback_enabled: bool = True
     playwright_fallback_timeout_ms: int = 12000
+    # Fallback browsers that may run at once, one per worker thread. Defaults
+    # to the scoring pool size so every scoring worker can fall back together.
+    playwright_fallback_workers: int = field(
+        default_factory=lambda: int(os.environ.get(
+            "PLAYWRIGHT_FALLBACK_WORKERS", os.environ.get("SCRAPER_MAX_WORKERS", "5")
+        ))
+    )
     dns_check_enabled: bool = True
 
+    # Reuse scoring results for the same website across runs (0 = disabled)
+    cache_ttl_days: int = field(
+        default_factory=lambda: int(os.environ.get("SCORING_CACHE_TTL_DAYS", "7"))
+    )
+
 
 @dataclass
 class GumroadConfig:
@@ -230,6 +251,11 @@ class SMTPConfig:
     from_email: str = field(default_factory=lambda: os.environ.get("SMTP_FROM_EMAIL", ""))
     from_name: str = field(default_factory=lambda: os.environ.get("SMTP_FROM_NAME", "BrokenSite Weekly"))
     use_tls: bool = True
+    # Concurrent SMTP sessions when mailing the same batch to many subscribers.
+    # Kept low by default: Gmail and most relays throttle or reject parallel
+    # logins from one account. Raise SMTP_PARALLELISM only for a relay that
+    # allows it (e.g. an SES/SendGrid connection limit).
+    parallelism: int = field(default_factory=lambda: int(os.environ.get("SMTP_PARALLELISM", "2")))
 
 
 @dataclass
@@ -241,6 +267,10 @@ class PortalConfig:
     # Shared secret guarding the operator dashboard. When empty the dashboard
     # is disabled (returns 403) so lead data and logs are never public.
     dashboard_token: str = field(default_factory=lambda: os.environ.get("DASHBOARD_TOKEN", ""))
+    # The tracking server buffers engagement events and writes them in
+    # batches of up to this many, at least every EVENT_BATCH_MS.
+    event_batch_size: int = field(default_factory=lambda: int(os.environ.get("EVENT_BATCH_SIZE", "500")))
+    event_batch_ms: int = field(default_factory=lambda: int(os.environ.get("EVENT_BATCH_MS", "500")))
 
 
 @dataclass
@@ -260,7 +290,7 @@ class DatabaseConfig:
     dedupe_window_days: int = 90  # Don't re-contact leads within this window
 
 
-@dataclass
+@dataclass(slots=True)
 class OutreachConfig:
     """Outreach/warm lead configuration."""
     enabled: bool = field(default_factory=lambda: os.environ.get("OUTREACH_ENABLED", "false").lower() == "true")
@@ -278,6 +308,11 @@ class OutreachConfig:
     min_score_for_outreach: int = field(default_factory=lambda: int(os.environ.get("OUTREACH_MIN_SCORE", "50")))
     min_contact_confidence: float = field(default_factory=lambda: float(os.environ.get("OUTREACH_MIN_CONFIDENCE", "0.7")))
 
+    # Contact discovery fetches run concurrently across leads
+    contact_workers: int = field(default_factory=lambda: int(os.environ.get("OUTREACH_CONTACT_WORKERS", "8")))
+    # BeautifulSoup backend for contact pages: html.parser or lxml
+    contact_html_parser: str = field(default_factory=lambda: os.environ.get("CONTACT_HTML_PARSER", "html.parser").strip().lower())
+
     # Compliance (CAN-SPAM)
     physical_address: str = field(default_factory=lambda: os.environ.get("OUTREACH_PHYSICAL_ADDRESS", ""))
     company_name: str = field(default_factory=lambda: os.environ.get("OUTREACH_COMPANY_NAME", "BrokenSite Weekly"))
@@ -297,7 +332,7 @@ class OutreachConfig:
                 pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DeliveryConfig:
     """Delivery configuration for warm vs cold leads."""
     include_cold_leads: bool = field(default_factory=lambda: os.environ.get("DELIVERY_INCLUDE_COLD", "true").lower() == "true")
@@ -374,6 +409,11 @@ def validate_config(
             errors.append("TRACKING_BASE_URL environment variable not set (required for outreach)")
         if not config.outreach.physical_address:
             errors.append("OUTREACH_PHYSICAL_ADDRESS environment variable not set (required for CAN-SPAM compliance)")
+        if config.outreach.contact_html_parser not in ("html.parser", "lxml"):
+            errors.append(
+                f"CONTACT_HTML_PARSER must be html.parser or lxml, "
+                f"got {config.outreach.contact_html_parser!r}"
+            )
 
     if require_portal and not config.portal.secret:
         errors.append("PORTAL_SECRET environment variable not set (required for portal links)")
@@ -5,17 +5,47 @@ Extracts email addresses from business websites using multiple strategies.
 
 import json
 import re
+import threading
 from dataclasses import dataclass
-from typing import Optional
-from urllib.parse import urljoin
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
+from .config import OutreachConfig
 from .logging_setup import get_logger
 
+try:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # handlers below catch bad JSON-LD from either parser. It rejects str
+    # subclasses, so script.string (a NavigableString) is passed as str().
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger("contact_finder")
 
+
+def select_html_parser(requested: str = "html.parser") -> str:
+    """
+    BeautifulSoup backend for OutreachConfig.contact_html_parser.
+
+    html.parser unless lxml is asked for: lxml is several times faster on
+    full pages but builds different trees for broken markup, and the
+    extractors are tested against html.parser, so it is an explicit opt-in
+    rather than picked up whenever importable.
+    """
+    if requested.strip().lower() != "lxml":
+        return "html.parser"
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        logger.warning("CONTACT_HTML_PARSER=lxml but lxml is not installed; using html.parser")
+        return "html.parser"
+    return "lxml"
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -23,14 +53,33 @@ USER_AGENT = (
 )
 
 _SESSION: Optional[requests.Session] = None
+# Worker threads call _get_session() concurrently on their first lookup.
+_SESSION_LOCK = threading.Lock()
+
+# Each lead is a different site, so connection reuse is limited by how many
+# host pools the adapter keeps (requests' default is 10), not by connections
+# per host. Keep at least one host pool per worker, as the scoring session does.
+_POOL_HOSTS = 64
+
+
+def build_session(workers: int = 1) -> requests.Session:
+    """Build a session for `workers` concurrent lookups (OUTREACH_CONTACT_WORKERS)."""
+    workers = max(1, workers)
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max(_POOL_HOSTS, workers), pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
 
 
 def _get_session() -> requests.Session:
+    """Shared session for callers that don't pass their own."""
     global _SESSION
     if _SESSION is None:
-        session = requests.Session()
-        session.headers.update({"User-Agent": USER_AGENT})
-        _SESSION = session
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_session(OutreachConfig().contact_workers)
     return _SESSION
 
 # Domains/patterns that produce false positive emails
@@ -57,6 +106,9 @@ FALSE_POSITIVE_PATTERNS = [
     r"@babel\.",
 ]
 
+# All false-positive patterns in one case-insensitive pass per candidate
+_FALSE_POSITIVE_RE = re.compile("|".join(FALSE_POSITIVE_PATTERNS), re.IGNORECASE)
+
 EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 
 CONTACT_PAGE_PATTERNS = [
@@ -68,6 +120,12 @@ CONTACT_PAGE_PATTERNS = [
     "/get-in-touch",
 ]
 
+_MAILTO_HREF_RE = re.compile(r"^mailto:", re.IGNORECASE)
+
+_CONTACT_PAGE_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CONTACT_PAGE_PATTERNS), re.IGNORECASE
+)
+
 # Owner/decision-maker name extraction patterns
 # Ordered by confidence — earlier matches are stronger
 OWNER_ROLE_PATTERNS = [
@@ -85,6 +143,12 @@ OWNER_ROLE_PATTERNS = [
     # Author meta tag
     (r'<meta\s+name=["\']author["\'][^>]*content=["\']([^"\']+)["\']', 0.60),
 ]
+# Compiled once at import: (regex, confidence, also_search_raw_html)
+_OWNER_ROLE_RES = [
+    (re.compile(pattern, re.IGNORECASE), confidence, "meta" in pattern)
+    for pattern, confidence in OWNER_ROLE_PATTERNS
+]
+_WS_RE = re.compile(r"\s+")
 
 # Phrases that indicate we found a false positive (not a real person name)
 OWNER_FALSE_POSITIVES = [
@@ -127,6 +191,10 @@ ABOUT_PAGE_PATTERNS = [
     "/leadership",
 ]
 
+_ABOUT_PAGE_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in ABOUT_PAGE_PATTERNS), re.IGNORECASE
+)
+
 
 @dataclass
 class ContactInfo:
@@ -140,23 +208,23 @@ class ContactInfo:
 
 def _clean_email(email: str) -> str:
     """Normalize email: strip whitespace, lowercase, remove mailto: prefix."""
-    email = email.strip().lower()
-    if email.startswith("mailto:"):
+    email = email.strip()
+    if email[:7].lower() == "mailto:":
         email = email[7:]
-    return email.split("?")[0]  # Strip query params
+    # Strip query params before lowercasing so only the address is copied
+    return email.partition("?")[0].lower()
 
 
 def _is_valid_email(email: str) -> bool:
     """Check if email is valid and not a false positive."""
     if not EMAIL_REGEX.fullmatch(email):
         return False
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, email, re.IGNORECASE):
-            return False
     # Filter out very short local parts (likely noise)
-    local_part = email.split("@")[0]
+    local_part = email.partition("@")[0]
     if len(local_part) < 2:
         return False
+    if _FALSE_POSITIVE_RE.search(email):
+        return False
     return True
 
 
@@ -167,7 +235,7 @@ def _extract_from_jsonld(soup: BeautifulSoup) -> Optional[str]:
             text = script.string
             if not text:
                 continue
-            data = json.loads(text)
+            data = _json_loads(str(text))
             items = data if isinstance(data, list) else [data]
             for item in items:
                 if not isinstance(item, dict):
@@ -196,39 +264,80 @@ def _extract_from_jsonld(soup: BeautifulSoup) -> Optional[str]:
 
 def _extract_mailto(soup: BeautifulSoup) -> Optional[str]:
     """Extract email from mailto: links."""
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        if href.lower().startswith("mailto:"):
-            email = _clean_email(href)
-            if _is_valid_email(email):
-                return email
+    for link in soup.find_all("a", href=_MAILTO_HREF_RE):
+        email = _clean_email(link["href"])
+        if _is_valid_email(email):
+            return email
     return None
 
 
 def _find_contact_page_url(soup: BeautifulSoup, base_url: str) -> Optional[str]:
     """Find URL of contact page from navigation links."""
-    for link in soup.find_all("a", href=True):
-        href = link["href"].lower()
-        for pattern in CONTACT_PAGE_PATTERNS:
-            if pattern in href:
-                return urljoin(base_url, link["href"])
-    return None
+    link = soup.find("a", href=_CONTACT_PAGE_RE)
+    if link is None:
+        return None
+    return urljoin(base_url, link["href"])
 
 
-def _extract_via_regex(html: str) -> Optional[str]:
-    """Last resort: regex for email patterns with false positive filtering."""
-    matches = EMAIL_REGEX.findall(html)
-    for email in matches:
-        email = _clean_email(email)
-        if _is_valid_email(email):
+def _site_host(url: str) -> Optional[str]:
+    """Lowercase hostname of a site URL without a leading "www."."""
+    host = urlsplit(url).hostname
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+def _extract_via_regex(html: str, site_host: Optional[str] = None) -> Optional[str]:
+    """
+    Last resort: regex for email patterns with false positive filtering.
+
+    Returns the first valid address on the site's own domain when site_host
+    is given, otherwise the first valid address on the page.
+    """
+    # Without an "@" nothing can match, and the regex would still try a
+    # local part at every word of the page.
+    if "@" not in html:
+        return None
+    first_valid = None
+    for match in EMAIL_REGEX.finditer(html):
+        email = _clean_email(match.group())
+        if not _is_valid_email(email):
+            continue
+        if not site_host or email.partition("@")[2] == site_host:
             return email
-    return None
+        if first_valid is None:
+            first_valid = email
+    return first_valid
+
+
+def _fetch_page(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    pages: Optional[Dict[str, Tuple[str, BeautifulSoup]]] = None,
+    html_parser: str = "html.parser",
+) -> Tuple[str, BeautifulSoup]:
+    """
+    Fetch and parse a page, returning (html, soup).
+
+    `pages` memoizes parses within one lookup: the owner-name and email
+    strategies often both follow the same /about link.
+    """
+    if pages is not None and url in pages:
+        return pages[url]
+    response = session.get(url, timeout=timeout, allow_redirects=True)
+    response.raise_for_status()
+    page = (response.text, BeautifulSoup(response.text, html_parser))
+    if pages is not None:
+        pages[url] = page
+    return page
 
 
 def find_contact_email(
     website_url: str,
     timeout: int = 10,
     session: Optional[requests.Session] = None,
+    html_parser: str = "html.parser",
 ) -> Optional[ContactInfo]:
     """
     Attempt to find a contact email and owner name for the business.
@@ -246,18 +355,13 @@ def find_contact_email(
     try:
         logger.debug(f"Finding contact for {website_url}")
         session = session or _get_session()
-        response = session.get(
-            website_url,
-            timeout=timeout,
-            allow_redirects=True,
-        )
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        html = response.text
+        pages: Dict[str, Tuple[str, BeautifulSoup]] = {}
+        html, soup = _fetch_page(session, website_url, timeout, pages, html_parser)
 
         # Extract owner name in parallel with email search
         owner_result = find_owner_name(
-            website_url, html=html, soup=soup, timeout=timeout, session=session
+            website_url, html=html, soup=soup, timeout=timeout, session=session,
+            pages=pages, html_parser=html_parser,
         )
         owner_name = owner_result[0] if owner_result else None
 
@@ -279,17 +383,16 @@ def find_contact_email(
                 owner_name=owner_name,
             )
 
+        # Regex strategies prefer addresses on the business's own domain
+        site_host = _site_host(website_url)
+
         # Strategy 3: Contact page
         contact_url = _find_contact_page_url(soup, website_url)
         if contact_url:
             try:
-                contact_resp = session.get(
-                    contact_url,
-                    timeout=timeout,
-                    allow_redirects=True,
+                contact_html, contact_soup = _fetch_page(
+                    session, contact_url, timeout, pages, html_parser
                 )
-                contact_resp.raise_for_status()
-                contact_soup = BeautifulSoup(contact_resp.text, "html.parser")
 
                 email = _extract_from_jsonld(contact_soup)
                 if email:
@@ -303,7 +406,7 @@ def find_contact_email(
                         email=email, source="contact_page", confidence=0.85,
                         owner_name=owner_name,
                     )
-                email = _extract_via_regex(contact_resp.text)
+                email = _extract_via_regex(contact_html, site_host)
                 if email:
                     return ContactInfo(
                         email=email, source="contact_page", confidence=0.75,
@@ -313,7 +416,7 @@ def find_contact_email(
                 logger.debug(f"Contact page fetch failed for {contact_url}: {e}")
 
         # Strategy 4: Regex fallback on homepage
-        email = _extract_via_regex(response.text)
+        email = _extract_via_regex(html, site_host)
         if email:
             logger.debug(f"Found email via regex: {email}")
             return ContactInfo(
@@ -344,7 +447,7 @@ def _extract_owner_from_jsonld(soup: BeautifulSoup) -> Optional[tuple[str, float
             text = script.string
             if not text:
                 continue
-            data = json.loads(text)
+            data = _json_loads(str(text))
             items = data if isinstance(data, list) else [data]
             for item in items:
                 if not isinstance(item, dict):
@@ -404,20 +507,20 @@ def _extract_owner_from_patterns(html: str, soup: BeautifulSoup) -> Optional[tup
     """Extract owner name using regex patterns against visible text and HTML."""
     # Get visible text (strip tags for cleaner pattern matching)
     text = soup.get_text(separator=" ", strip=True) if soup else ""
-    text_clean = re.sub(r"\s+", " ", text)
+    text_clean = _WS_RE.sub(" ", text)
 
-    for pattern, confidence in OWNER_ROLE_PATTERNS:
+    for regex, confidence, search_html in _OWNER_ROLE_RES:
         # Try on visible text first (cleaner)
         if text_clean:
-            match = re.search(pattern, text_clean, re.IGNORECASE)
+            match = regex.search(text_clean)
             if match:
                 name = match.group(1).strip()
                 if _is_valid_person_name(name):
                     return (name, confidence)
 
         # Fall back to raw HTML for meta-tag patterns
-        if html and "meta" in pattern:
-            match = re.search(pattern, html, re.IGNORECASE)
+        if html and search_html:
+            match = regex.search(html)
             if match:
                 name = match.group(1).strip()
                 if _is_valid_person_name(name):
@@ -428,12 +531,10 @@ def _extract_owner_from_patterns(html: str, soup: BeautifulSoup) -> Optional[tup
 
 def _find_about_page_url(soup: BeautifulSoup, base_url: str) -> Optional[str]:
     """Find the URL of an About/Team page from navigation links."""
-    for link in soup.find_all("a", href=True):
-        href = link["href"].lower().strip()
-        for pattern in ABOUT_PAGE_PATTERNS:
-            if pattern in href:
-                return urljoin(base_url, link["href"])
-    return None
+    link = soup.find("a", href=_ABOUT_PAGE_RE)
+    if link is None:
+        return None
+    return urljoin(base_url, link["href"])
 
 
 def find_owner_name(
@@ -442,6 +543,8 @@ def find_owner_name(
     soup: Optional[BeautifulSoup] = None,
     timeout: int = 10,
     session: Optional[requests.Session] = None,
+    pages: Optional[Dict[str, Tuple[str, BeautifulSoup]]] = None,
+    html_parser: str = "html.parser",
 ) -> Optional[tuple[str, float]]:
     """
     Attempt to find the business owner / decision-maker name.
@@ -451,6 +554,7 @@ def find_owner_name(
     2. Regex patterns on homepage (0.60-0.85)
     3. About page discovery + extraction (0.55-0.70)
 
+    `pages` lets a caller share fetched pages (see _fetch_page).
     Returns (name, confidence) or None. Never raises.
     """
     try:
@@ -458,14 +562,7 @@ def find_owner_name(
 
         # If no soup provided, fetch the homepage
         if soup is None:
-            response = session.get(
-                website_url,
-                timeout=timeout,
-                allow_redirects=True,
-            )
-            response.raise_for_status()
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
+            html, soup = _fetch_page(session, website_url, timeout, pages, html_parser)
 
         # Strategy 1: JSON-LD
         result = _extract_owner_from_jsonld(soup)
@@ -481,13 +578,9 @@ def find_owner_name(
         about_url = _find_about_page_url(soup, website_url)
         if about_url and about_url != website_url:
             try:
-                about_resp = session.get(
-                    about_url,
-                    timeout=timeout,
-                    allow_redirects=True,
+                about_html, about_soup = _fetch_page(
+                    session, about_url, timeout, pages, html_parser
                 )
-                about_resp.raise_for_status()
-                about_soup = BeautifulSoup(about_resp.text, "html.parser")
 
                 # Try JSON-LD on about page
                 about_result = _extract_owner_from_jsonld(about_soup)
@@ -495,9 +588,7 @@ def find_owner_name(
                     return about_result
 
                 # Pattern match on about page (lower confidence threshold)
-                about_result = _extract_owner_from_patterns(
-                    about_resp.text, about_soup
-                )
+                about_result = _extract_owner_from_patterns(about_html, about_soup)
                 if about_result:
                     return about_result
 
@@ -519,10 +610,13 @@ def find_contact_with_isolation(
     website_url: str,
     timeout: int = 10,
     session: Optional[requests.Session] = None,
+    html_parser: str = "html.parser",
 ) -> tuple[Optional[ContactInfo], Optional[str]]:
     """Never raises - returns (contact_info, error_message)."""
     try:
-        result = find_contact_email(website_url, timeout, session=session)
+        result = find_contact_email(
+            website_url, timeout, session=session, html_parser=html_parser
+        )
         return result, None
     except Exception as e:
         logger.error(f"Contact finder isolation caught error for {website_url}: {e}")
@@ -4,11 +4,12 @@ Handles lead storage, deduplication, and run history.
 """
 
 import json
+import os
 import sqlite3
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Iterable
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass
 
@@ -149,8 +150,12 @@ CREATE TABLE IF NOT EXISTS engagement_events (
     timestamp TIMESTAMP
 );
 
-CREATE INDEX IF NOT EXISTS idx_engagement_place_id ON engagement_events(place_id);
 CREATE INDEX IF NOT EXISTS idx_engagement_type ON engagement_events(event_type);
+-- Covers get_engagement_score: the per-lead sum reads only the index
+CREATE INDEX IF NOT EXISTS idx_engagement_place_type ON engagement_events(place_id, event_type);
+-- Its place_id prefix serves every place_id lookup, so the old single-column
+-- index only cost an extra write per event.
+DROP INDEX IF EXISTS idx_engagement_place_id;
 
 -- Unsubscribe list
 CREATE TABLE IF NOT EXISTS unsubscribes (
@@ -176,6 +181,55 @@ CREATE TABLE IF NOT EXISTS lead_inquiries (
     notes TEXT,
     created_at TIMESTAMP
 );
+
+-- Website scoring results reused across runs (keyed by normalized URL)
+CREATE TABLE IF NOT EXISTS scoring_cache (
+    url TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    reasons TEXT,
+    http_status INTEGER,
+    response_time_ms INTEGER,
+    final_url TEXT,
+    expected_phone TEXT,
+    fetched_at TIMESTAMP NOT NULL
+);
+"""
+
+
+_UPSERT_LEAD_SQL = """
+    INSERT INTO leads (
+        place_id, cid, name, website, address, phone,
+        review_count, city, category, score, reasons, first_seen, last_seen,
+        exclusive_until, exclusive_tier, lead_tier, competitors_json, owner_name
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(place_id) DO UPDATE SET
+        name = excluded.name,
+        website = excluded.website,
+        address = excluded.address,
+        phone = excluded.phone,
+        review_count = excluded.review_count,
+        city = excluded.city,
+        category = excluded.category,
+        score = excluded.score,
+        reasons = excluded.reasons,
+        last_seen = excluded.last_seen,
+        cid = excluded.cid,
+        exclusive_until = excluded.exclusive_until,
+        exclusive_tier = excluded.exclusive_tier,
+        lead_tier = excluded.lead_tier,
+        competitors_json = excluded.competitors_json
+    WHERE leads.last_seen <= ?
+"""
+
+
+# Engagement weights, shared by the per-lead and warm-lead queries
+_ENGAGEMENT_SCORE_SQL = """
+    COALESCE(SUM(CASE event_type
+        WHEN 'email_opened' THEN 5
+        WHEN 'page_view' THEN 25
+        WHEN 'cta_click' THEN 50
+        ELSE 0
+    END), 0)
 """
 
 
@@ -187,12 +241,27 @@ class Database:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
         self.db_path = self.config.db_path
         self._lock = threading.RLock()
+        self._tx_depth = 0
+        # db_path may also be ":memory:" or a "file:...?mode=memory" URI,
+        # which suits throwaway databases that never need to hit disk.
+        target = os.fspath(self.db_path)
         self._conn = sqlite3.connect(
-            self.db_path,
+            target,
             detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
             check_same_thread=False,
+            uri=target.startswith("file:"),
         )
         self._conn.row_factory = sqlite3.Row
+        # WAL lets the tracking server read while a weekly run writes, and
+        # with synchronous=NORMAL a commit no longer waits on an fsync (the
+        # WAL is synced at checkpoints). The trade-off: a power loss or OS
+        # crash can drop the last few commits (an application crash cannot).
+        # That is fine for re-derivable rows such as audits and contacts, but
+        # not for outreach or suppression records, so those writes go through
+        # _connect(durable=True), which syncs the WAL on commit
+        # (synchronous=FULL). In-memory databases ignore all of this.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._init_schema()
 
     def _init_schema(self):
@@ -288,15 +357,62 @@ class Database:
         )
 
     @contextmanager
-    def _connect(self):
-        """Context manager for database connections."""
+    def _connect(self, durable: bool = False):
+        """Context manager for database connections.
+
+        Commits on exit, unless inside transaction(), which owns the commit.
+        With durable=True the commit is fsynced (synchronous=FULL) so that a
+        power loss cannot undo it; use it for records of emails already sent
+        and of addresses that must never be mailed again.
+        """
         with self._lock:
+            if self._tx_depth:
+                yield self._conn
+                return
+            if durable:
+                self._conn.execute("PRAGMA synchronous=FULL")
             try:
                 yield self._conn
                 self._conn.commit()
-            except Exception:
+            except BaseException:
                 self._conn.rollback()
                 raise
+            finally:
+                if durable:
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into one commit.
+        Method calls inside the block skip their own commit; everything is
+        committed on exit, or rolled back if the block raises (including
+        KeyboardInterrupt/SystemExit). Other threads wait on the connection
+        lock until the transaction finishes. upsert_lead()/upsert_leads()
+        may run inside it; they reuse the open transaction's write lock.
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self
+                if self._tx_depth == 1:
+                    self._conn.commit()
+            except BaseException:
+                if self._tx_depth == 1:
+                    self._conn.rollback()
+                raise
+            finally:
+                self._tx_depth -= 1
+
+    @staticmethod
+    def _begin_immediate(conn: sqlite3.Connection) -> None:
+        """
+        Take the write lock before a check-then-write. Inside transaction()
+        after an earlier write, sqlite3 has already begun a transaction that
+        holds the lock, and a nested BEGIN would fail.
+        """
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
 
     def close(self) -> None:
         """Close the shared database connection."""
@@ -355,6 +471,47 @@ class Database:
 
         return False
 
+    def _is_window_duplicate(
+        self,
+        conn: sqlite3.Connection,
+        lead: Lead,
+        cutoff: datetime,
+    ) -> bool:
+        """Check place_id, then website, against leads seen since cutoff."""
+        place_duplicate = conn.execute(
+            "SELECT 1 FROM leads WHERE place_id = ? AND last_seen > ?",
+            (lead.place_id, cutoff),
+        ).fetchone()
+        if place_duplicate:
+            return True
+
+        if lead.website:
+            website_duplicate = conn.execute(
+                """
+                SELECT 1
+                FROM leads
+                WHERE website = ?
+                  AND place_id != ?
+                  AND last_seen > ?
+                LIMIT 1
+                """,
+                (lead.website, lead.place_id, cutoff),
+            ).fetchone()
+            if website_duplicate:
+                return True
+
+        return False
+
+    def _lead_params(self, lead: Lead, now: datetime, cutoff: datetime) -> tuple:
+        """Build the parameter tuple for _UPSERT_LEAD_SQL."""
+        return (
+            lead.place_id, lead.cid, lead.name, lead.website,
+            lead.address, lead.phone, lead.review_count, lead.city, lead.category,
+            lead.score, self._serialize_reasons(lead.reasons), now, now,
+            lead.exclusive_until, lead.exclusive_tier, lead.lead_tier,
+            lead.competitors_json, lead.owner_name, cutoff
+        )
+
     def upsert_lead(self, lead: Lead) -> bool:
         """
         Insert or update a lead atomically.
@@ -362,67 +519,62 @@ class Database:
         """
         now = datetime.utcnow()
         cutoff = now - timedelta(days=self.config.dedupe_window_days)
-        reasons_json = self._serialize_reasons(lead.reasons)
 
         with self._connect() as conn:
             # Serialize dedupe check + write to avoid check-then-insert races.
-            conn.execute("BEGIN IMMEDIATE")
+            self._begin_immediate(conn)
 
-            place_duplicate = conn.execute(
-                "SELECT 1 FROM leads WHERE place_id = ? AND last_seen > ?",
-                (lead.place_id, cutoff),
-            ).fetchone()
-            if place_duplicate:
+            if self._is_window_duplicate(conn, lead, cutoff):
                 return False
 
-            if lead.website:
-                website_duplicate = conn.execute(
-                    """
-                    SELECT 1
-                    FROM leads
-                    WHERE website = ?
-                      AND place_id != ?
-                      AND last_seen > ?
-                    LIMIT 1
-                    """,
-                    (lead.website, lead.place_id, cutoff),
-                ).fetchone()
-                if website_duplicate:
-                    return False
-
-            row = conn.execute("""
-                INSERT INTO leads (
-                    place_id, cid, name, website, address, phone,
-                    review_count, city, category, score, reasons, first_seen, last_seen,
-                    exclusive_until, exclusive_tier, lead_tier, competitors_json, owner_name
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(place_id) DO UPDATE SET
-                    name = excluded.name,
-                    website = excluded.website,
-                    address = excluded.address,
-                    phone = excluded.phone,
-                    review_count = excluded.review_count,
-                    city = excluded.city,
-                    category = excluded.category,
-                    score = excluded.score,
-                    reasons = excluded.reasons,
-                    last_seen = excluded.last_seen,
-                    cid = excluded.cid,
-                    exclusive_until = excluded.exclusive_until,
-                    exclusive_tier = excluded.exclusive_tier,
-                    lead_tier = excluded.lead_tier,
-                    competitors_json = excluded.competitors_json
-                WHERE leads.last_seen <= ?
-                RETURNING place_id
-            """, (
-                lead.place_id, lead.cid, lead.name, lead.website,
-                lead.address, lead.phone, lead.review_count, lead.city, lead.category,
-                lead.score, reasons_json, now, now,
-                lead.exclusive_until, lead.exclusive_tier, lead.lead_tier,
-                lead.competitors_json, lead.owner_name, cutoff
-            )).fetchone()
+            row = conn.execute(
+                _UPSERT_LEAD_SQL + " RETURNING place_id",
+                self._lead_params(lead, now, cutoff),
+            ).fetchone()
             return row is not None
 
+    def upsert_leads(self, leads: Iterable[Lead]) -> List[bool]:
+        """
+        Insert or update a batch of leads in a single transaction.
+
+        Returns one flag per lead with the same meaning as `upsert_lead()`.
+        Leads earlier in the batch count toward dedupe for later ones, so a
+        repeated place_id or a shared website within the batch is skipped
+        exactly as sequential `upsert_lead()` calls would skip it.
+        """
+        leads = list(leads)
+        if not leads:
+            return []
+
+        now = datetime.utcnow()
+        cutoff = now - timedelta(days=self.config.dedupe_window_days)
+        results: List[bool] = []
+        rows = []
+        batch_place_ids: set = set()
+        batch_websites: Dict[str, str] = {}
+
+        with self._connect() as conn:
+            self._begin_immediate(conn)
+
+            for lead in leads:
+                is_new = (
+                    lead.place_id not in batch_place_ids
+                    and batch_websites.get(lead.website, lead.place_id) == lead.place_id
+                    and not self._is_window_duplicate(conn, lead, cutoff)
+                )
+                results.append(is_new)
+                if not is_new:
+                    continue
+                batch_place_ids.add(lead.place_id)
+                if lead.website:
+                    batch_websites.setdefault(lead.website, lead.place_id)
+                rows.append(self._lead_params(lead, now, cutoff))
+
+            if rows:
+                conn.executemany(_UPSERT_LEAD_SQL, rows)
+
+        return results
+
     def update_lead_competitors(self, place_id: str, competitors_json: str) -> None:
         """Update competitor data for an existing lead."""
         with self._connect() as conn:
@@ -589,11 +741,35 @@ class Database:
         export_type: str = None,
     ):
         """Record an export to a subscriber."""
+        self.record_exports(
+            run_id,
+            [(subscriber_email, lead_count, csv_path)],
+            tier=tier,
+            export_type=export_type,
+        )
+
+    def record_exports(
+        self,
+        run_id: str,
+        records: List[Tuple[str, int, str]],
+        tier: str = None,
+        export_type: str = None,
+    ):
+        """
+        Record exports to several subscribers in one transaction.
+        Each record is (subscriber_email, lead_count, csv_path).
+        """
+        if not records:
+            return
+        now = datetime.utcnow()
         with self._connect() as conn:
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO exports (run_id, subscriber_email, lead_count, csv_path, sent_at, tier, export_type)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (run_id, subscriber_email, lead_count, csv_path, datetime.utcnow(), tier, export_type))
+            """, [
+                (run_id, email, lead_count, csv_path, now, tier, export_type)
+                for email, lead_count, csv_path in records
+            ])
 
 
     def get_top_yield_city_categories(
@@ -660,6 +836,78 @@ class Database:
             )
             logger.info(f"Cleaned up {result.rowcount} old unexported leads")
 
+    # ---- Scoring Cache Methods ----
+
+    def get_cached_score(self, url: str, max_age_days: int) -> Optional[Dict[str, Any]]:
+        """Get a cached scoring result for a URL if it is newer than max_age_days."""
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        with self._connect() as conn:
+            row = conn.execute("""
+                SELECT url, score, reasons, http_status, response_time_ms,
+                       final_url, expected_phone, fetched_at
+                FROM scoring_cache
+                WHERE url = ? AND fetched_at > ?
+            """, (url, cutoff)).fetchone()
+            if not row:
+                return None
+            cached = dict(row)
+            cached["reasons"] = json.loads(cached["reasons"] or "[]")
+            return cached
+
+    def cache_score(
+        self,
+        url: str,
+        score: int,
+        reasons: Iterable[str],
+        http_status: Optional[int],
+        response_time_ms: Optional[int],
+        final_url: Optional[str],
+        expected_phone: Optional[str] = None,
+    ) -> None:
+        """Store a scoring result for reuse by later runs."""
+        self.cache_scores([
+            (url, score, reasons, http_status, response_time_ms, final_url, expected_phone),
+        ])
+
+    def cache_scores(
+        self,
+        rows: Iterable[Tuple[str, int, Iterable[str], Optional[int], Optional[int], Optional[str], Optional[str]]],
+    ) -> int:
+        """
+        Store many scoring results in one statement.
+        Each row is (url, score, reasons, http_status, response_time_ms,
+        final_url, expected_phone). Returns the number of rows written.
+        """
+        now = datetime.utcnow()
+        params = [
+            (
+                url, score, self._serialize_reasons(list(reasons)), http_status,
+                response_time_ms, final_url, expected_phone, now,
+            )
+            for url, score, reasons, http_status, response_time_ms, final_url, expected_phone in rows
+        ]
+        if not params:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO scoring_cache (
+                    url, score, reasons, http_status, response_time_ms,
+                    final_url, expected_phone, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, params)
+        return len(params)
+
+    def cleanup_scoring_cache(self, max_age_days: int) -> int:
+        """Delete cached scoring results older than max_age_days. Returns rows removed."""
+        cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+        with self._connect() as conn:
+            result = conn.execute(
+                "DELETE FROM scoring_cache WHERE fetched_at <= ?", (cutoff,)
+            )
+        if result.rowcount:
+            logger.info(f"Cleaned up {result.rowcount} expired scoring cache rows")
+        return result.rowcount
+
     # ---- Audit Methods ----
 
     def record_audit(self, place_id: str, audit_url: str, audit_html_path: str, issues_json: str):
@@ -735,7 +983,7 @@ class Database:
 
     def record_outreach(self, place_id: str, email: str, audit_url: str, success: bool, error: str = None):
         """Record an outreach attempt."""
-        with self._connect() as conn:
+        with self._connect(durable=True) as conn:
             conn.execute("""
                 INSERT INTO outreach (place_id, email, audit_url, sent_at, success, error)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -743,7 +991,7 @@ class Database:
 
     def record_followup(self, place_id: str, success: bool, error: str = None):
         """Record follow-up attempt for an outreach row."""
-        with self._connect() as conn:
+        with self._connect(durable=True) as conn:
             conn.execute("""
                 UPDATE outreach SET followup_sent_at = ?, followup_success = ?, followup_error = ?
                 WHERE place_id = ?
@@ -815,7 +1063,7 @@ class Database:
         """Check if a lead has been contacted."""
         with self._connect() as conn:
             row = conn.execute(
-                "SELECT 1 FROM outreach WHERE place_id = ?",
+                "SELECT 1 FROM outreach WHERE place_id = ? LIMIT 1",
                 (place_id,)
             ).fetchone()
             return row is not None
@@ -830,6 +1078,25 @@ class Database:
                 VALUES (?, ?, ?, ?, ?)
             """, (place_id, event_type, ip_address, user_agent, datetime.utcnow()))
 
+    def record_events_bulk(
+        self,
+        events: Iterable[Tuple[str, str, Optional[str], Optional[str], datetime]],
+    ) -> int:
+        """
+        Record many engagement events in one transaction.
+        Each event is (place_id, event_type, ip_address, user_agent, timestamp).
+        Returns the number of events written.
+        """
+        events = list(events)
+        if not events:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO engagement_events (place_id, event_type, ip_address, user_agent, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            """, events)
+        return len(events)
+
     def get_events_for_lead(self, place_id: str) -> List[Dict[str, Any]]:
         """Get all engagement events for a lead."""
         with self._connect() as conn:
@@ -869,37 +1136,47 @@ class Database:
             if unsubscribed:
                 return -100
 
-            # Count event types
-            rows = conn.execute("""
-                SELECT event_type, COUNT(*) as count
+            row = conn.execute(f"""
+                SELECT {_ENGAGEMENT_SCORE_SQL} AS score
                 FROM engagement_events
                 WHERE place_id = ?
-                GROUP BY event_type
-            """, (place_id,)).fetchall()
-
-            score = 0
-            for row in rows:
-                event_type = row["event_type"]
-                count = row["count"]
-                if event_type == "email_opened":
-                    score += 5 * count
-                elif event_type == "page_view":
-                    score += 25 * count
-                elif event_type == "cta_click":
-                    score += 50 * count
-
-            return score
+            """, (place_id,)).fetchone()
+            return row["score"]
 
     # ---- Unsubscribe Methods ----
 
     def add_unsubscribe(self, place_id: str, email: str):
         """Add a lead to the unsubscribe list."""
-        with self._connect() as conn:
+        with self._connect(durable=True) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO unsubscribes (place_id, email, unsubscribed_at)
                 VALUES (?, ?, ?)
             """, (place_id, email, datetime.utcnow()))
 
+    def unsubscribe_place(self, place_id: str) -> str:
+        """
+        Unsubscribe a lead and suppress its contact email in one transaction.
+        Suppressing by email (not just place_id) stops outreach to other
+        Place IDs that share the contact. Returns the email ("" if none).
+        """
+        now = datetime.utcnow()
+        with self._connect(durable=True) as conn:
+            row = conn.execute(
+                "SELECT email FROM contacts WHERE place_id = ?", (place_id,)
+            ).fetchone()
+            email = (row["email"] if row else "") or ""
+            conn.execute("""
+                INSERT OR REPLACE INTO unsubscribes (place_id, email, unsubscribed_at)
+                VALUES (?, ?, ?)
+            """, (place_id, email, now))
+            normalized = email.strip().lower()
+            if normalized:
+                conn.execute("""
+                    INSERT OR REPLACE INTO suppression (email, reason, suppressed_at)
+                    VALUES (?, ?, ?)
+                """, (normalized, "unsubscribed", now))
+        return email
+
     def is_unsubscribed(self, place_id: str) -> bool:
         """Check if a lead is unsubscribed."""
         with self._connect() as conn:
@@ -918,7 +1195,7 @@ class Database:
         email = email.strip().lower()
         if not email:
             return
-        with self._connect() as conn:
+        with self._connect(durable=True) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO suppression (email, reason, suppressed_at)
                 VALUES (?, ?, ?)
@@ -993,33 +1270,32 @@ class Database:
         location/place_id isn't re-delivered via another sharing its email.
         """
         with self._connect() as conn:
-            # Get all leads that have been contacted and have events
-            rows = conn.execute("""
-                SELECT DISTINCT l.place_id, l.name, l.website, l.address, l.phone,
-                       l.review_count, l.city, l.category, l.score, l.reasons, l.lead_tier,
-                       l.exclusive_until,
-                       c.email, a.audit_url
-                FROM leads l
-                INNER JOIN outreach o ON l.place_id = o.place_id
-                INNER JOIN contacts c ON l.place_id = c.place_id
-                INNER JOIN audits a ON l.place_id = a.place_id
-                LEFT JOIN unsubscribes u ON l.place_id = u.place_id
-                LEFT JOIN suppression s ON s.email = c.email
-                WHERE o.success = 1
-                  AND u.place_id IS NULL
-                  AND s.email IS NULL
-            """).fetchall()
+            # Score every contacted lead in the same statement rather than
+            # calling get_engagement_score() once per row. The suppression
+            # join normalizes the contact email the way that method does.
+            rows = conn.execute(f"""
+                SELECT * FROM (
+                    SELECT l.place_id, l.name, l.website, l.address, l.phone,
+                           l.review_count, l.city, l.category, l.score, l.reasons,
+                           l.lead_tier, l.exclusive_until,
+                           c.email, a.audit_url,
+                           (SELECT {_ENGAGEMENT_SCORE_SQL}
+                            FROM engagement_events
+                            WHERE place_id = l.place_id) AS engagement_score
+                    FROM leads l
+                    INNER JOIN contacts c ON l.place_id = c.place_id
+                    INNER JOIN audits a ON l.place_id = a.place_id
+                    LEFT JOIN unsubscribes u ON l.place_id = u.place_id
+                    LEFT JOIN suppression s ON s.email = lower(trim(c.email))
+                    WHERE EXISTS (
+                        SELECT 1 FROM outreach o
+                        WHERE o.place_id = l.place_id AND o.success = 1
+                    )
+                      AND u.place_id IS NULL
+                      AND s.email IS NULL
+                )
+                WHERE engagement_score >= ?
+                ORDER BY engagement_score DESC
+            """, (min_engagement_score,)).fetchall()
 
-            # Calculate engagement scores and filter
-            warm_leads = []
-            for row in rows:
-                place_id = row["place_id"]
-                engagement_score = self.get_engagement_score(place_id)
-                if engagement_score >= min_engagement_score:
-                    lead_dict = dict(row)
-                    lead_dict["engagement_score"] = engagement_score
-                    warm_leads.append(lead_dict)
-
-            # Sort by engagement score descending
-            warm_leads.sort(key=lambda x: x["engagement_score"], reverse=True)
-            return warm_leads
+            return [dict(row) for row in rows]
@@ -6,6 +6,7 @@ Sends weekly CSV attachments to subscribers via SMTP.
 import csv
 import smtplib
 import ssl
+from contextlib import contextmanager
 from io import StringIO
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -13,7 +14,7 @@ from email.mime.base import MIMEBase
 from email import encoders
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from dataclasses import dataclass
 
 from .config import SMTPConfig, RetryConfig, OUTPUT_DIR, PortalConfig
@@ -173,8 +174,13 @@ def create_email(
     lead_count: int,
     config: SMTPConfig,
     portal_url: Optional[str] = None,
+    attachment: Optional[MIMEBase] = None,
 ) -> MIMEMultipart:
-    """Create email message with CSV attachment."""
+    """
+    Create email message with CSV attachment.
+    Pass a prebuilt ``attachment`` from build_csv_attachment() to share one
+    encoded part across many recipients instead of re-encoding the CSV.
+    """
     msg = MIMEMultipart()
     msg["From"] = f"{config.from_name} <{config.from_email}>"
     msg["To"] = subscriber.email
@@ -208,6 +214,15 @@ Unsubscribe anytime from your Gumroad account.
     msg.attach(MIMEText(body, "plain"))
 
     # Attach CSV
+    if attachment is None:
+        attachment = build_csv_attachment(csv_content, csv_filename)
+    msg.attach(attachment)
+
+    return msg
+
+
+def build_csv_attachment(csv_content: str, csv_filename: str) -> MIMEBase:
+    """Base64-encode a CSV into a MIME part that messages can share."""
     attachment = MIMEBase("application", "octet-stream")
     attachment.set_payload(csv_content.encode("utf-8"))
     encoders.encode_base64(attachment)
@@ -215,9 +230,22 @@ Unsubscribe anytime from your Gumroad account.
         "Content-Disposition",
         f'attachment; filename="{csv_filename}"',
     )
-    msg.attach(attachment)
-
-    return msg
+    return attachment
+
+
+@contextmanager
+def _smtp_session(config: SMTPConfig) -> Iterator[smtplib.SMTP]:
+    """Open an authenticated SMTP connection."""
+    context = ssl.create_default_context()
+    if config.use_tls:
+        with smtplib.SMTP(config.host, config.port) as server:
+            server.starttls(context=context)
+            server.login(config.username, config.password)
+            yield server
+    else:
+        with smtplib.SMTP_SSL(config.host, config.port, context=context) as server:
+            server.login(config.username, config.password)
+            yield server
 
 
 def send_email(
@@ -226,19 +254,29 @@ def send_email(
     retry_config: RetryConfig = None,
 ) -> None:
     """Send email via SMTP with retry logic."""
+    send_emails([msg], config, retry_config, operation_name=f"send_to_{msg['To']}")
+
+
+def send_emails(
+    messages: List[MIMEMultipart],
+    config: SMTPConfig,
+    retry_config: RetryConfig = None,
+    operation_name: str = "send_batch",
+) -> None:
+    """
+    Send several emails over one SMTP session with retry logic.
+    A retry reconnects and resumes after the last message that went out, so
+    a dropped connection never re-sends what was already delivered.
+    """
+    pending = list(messages)
+    if not pending:
+        return
 
     def do_send():
-        context = ssl.create_default_context()
-
-        if config.use_tls:
-            with smtplib.SMTP(config.host, config.port) as server:
-                server.starttls(context=context)
-                server.login(config.username, config.password)
-                server.send_message(msg)
-        else:
-            with smtplib.SMTP_SSL(config.host, config.port, context=context) as server:
-                server.login(config.username, config.password)
-                server.send_message(msg)
+        with _smtp_session(config) as server:
+            while pending:
+                server.send_message(pending[0])
+                pending.pop(0)
 
     if retry_config:
         retry_with_backoff(
@@ -246,7 +284,7 @@ def send_email(
             config=retry_config,
             exceptions=(smtplib.SMTPException, ConnectionError, TimeoutError),
             logger=logger,
-            operation_name=f"send_to_{msg['To']}",
+            operation_name=operation_name,
         )
     else:
         do_send()
@@ -282,6 +320,8 @@ def deliver_to_subscribers(
     csv_filename = f"broken_site_leads_{date_str}{label}.csv"
     csv_content, csv_path = generate_csv(leads, output_path=OUTPUT_DIR / csv_filename)
 
+    attachment = build_csv_attachment(csv_content, csv_filename)
+
     logger.info(f"Delivering {len(leads)} leads to {len(subscribers)} subscribers")
 
     for subscriber in subscribers:
@@ -294,6 +334,7 @@ def deliver_to_subscribers(
                 lead_count=len(leads),
                 config=config,
                 portal_url=portal_url,
+                attachment=attachment,
             )
 
             send_email(msg, config, retry_config)
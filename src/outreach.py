@@ -342,7 +342,10 @@ def run_outreach(
         low = min(outreach_config.delay_between_emails_min_seconds, outreach_config.delay_between_emails_max_seconds)
         high = max(outreach_config.delay_between_emails_min_seconds, outreach_config.delay_between_emails_max_seconds)
         delay = random.uniform(low, high)
-        time.sleep(delay)
+        if shutdown:
+            shutdown.wait(delay)
+        else:
+            time.sleep(delay)
 
     for lead in leads:
         # Check shutdown
@@ -449,7 +452,10 @@ def run_followups(
         low = min(outreach_config.delay_between_emails_min_seconds, outreach_config.delay_between_emails_max_seconds)
         high = max(outreach_config.delay_between_emails_min_seconds, outreach_config.delay_between_emails_max_seconds)
         delay = random.uniform(low, high)
-        time.sleep(delay)
+        if shutdown:
+            shutdown.wait(delay)
+        else:
+            time.sleep(delay)
 
     for lead in leads:
         if shutdown and shutdown.check():
@@ -10,11 +10,12 @@ from __future__ import annotations
 
 import sys
 import signal
+import threading
 import argparse
 import json
 import concurrent.futures
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from dataclasses import asdict
 
 from .config import load_config, validate_config, Config, OUTPUT_DIR
@@ -23,7 +24,11 @@ from .db import Database, Lead
 from .gumroad import get_subscribers_with_isolation
 from .delivery import deliver_with_isolation, generate_csv, generate_manual_review_csv
 from .audit_generator import generate_audit_page, get_issues_json
-from .contact_finder import find_contact_with_isolation
+from .contact_finder import (
+    build_session as build_contact_session,
+    find_contact_with_isolation,
+    select_html_parser,
+)
 from .outreach import run_outreach, run_followups
 from .warm_delivery import deliver_warm_leads_with_isolation
 from .lead_utils import compute_lead_tier, compute_exclusive_until
@@ -34,23 +39,40 @@ from .weekly_summary import generate_weekly_summary
 from .change_detection import take_snapshot, detect_changes
 from .yelp_scraper import cross_reference_with_isolation, apply_yelp_scoring
 
+if TYPE_CHECKING:
+    # Annotations only; both modules are imported lazily inside the phases.
+    from .maps_scraper import Business
+    from .scoring import BufferedScoringCache, ScoringCache, ScoringResult
+
 logger = get_logger("orchestrator")
 
 
 class GracefulShutdown:
-    """Handle graceful shutdown on SIGTERM/SIGINT."""
+    """
+    Handle graceful shutdown on SIGTERM/SIGINT.
+    Backed by a threading.Event so scoring workers see the request
+    immediately and waits can be interrupted.
+    """
 
     def __init__(self):
-        self.shutdown_requested = False
+        self._event = threading.Event()
         signal.signal(signal.SIGTERM, self._handler)
         signal.signal(signal.SIGINT, self._handler)
 
     def _handler(self, signum, frame):
         logger.warning(f"Shutdown requested (signal {signum})")
-        self.shutdown_requested = True
+        self._event.set()
+
+    @property
+    def shutdown_requested(self) -> bool:
+        return self._event.is_set()
 
     def check(self) -> bool:
-        return self.shutdown_requested
+        return self._event.is_set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to `timeout` seconds, returning early (True) on shutdown."""
+        return self._event.wait(timeout)
 
 
 def _build_validation_requirements(
@@ -139,29 +161,39 @@ def _emit_run_kpis(run_ctx: RunContext, *, dry_run: bool) -> None:
         logger.warning(f"Failed to save KPI baseline snapshot: {e}")
 
 
-def process_business(
+LEAD_WRITE_BATCH_SIZE = 100
+
+
+def score_business(
     business: Business,
-    db: Database,
+    cache: Optional[ScoringCache],
     config: Config,
     run_ctx: RunContext,
-    dry_run: bool = False,
+    site_results: Optional[Dict[str, ScoringResult]] = None,
+    shutdown: Optional[GracefulShutdown] = None,
 ) -> Optional[Lead]:
     """
-    Process a single business: check website, score, store.
-    Returns Lead if it qualifies, None otherwise.
+    Check and score a single business website and build its Lead.
+    Returns None if the business is skipped. Leads are not written; `cache`
+    is the cross-run scoring cache, usually the Database or a
+    BufferedScoringCache over it (pass None to always re-fetch).
+    `site_results` is a per-run map of results already computed this run;
+    a business whose website was scored earlier reuses that result.
+    Returns None without fetching once `shutdown` has been requested.
     Fully isolated - never raises exceptions.
-
-    Args:
-        dry_run: If True, skip database writes (scoring still happens).
     """
     try:
+        if shutdown is not None and shutdown.check():
+            return None
+
         # Handle no-website leads (optional)
         if not business.website:
             if not config.scoring.include_no_website_leads:
                 logger.debug(f"Skipping {business.name}: no website")
                 return None
 
-            lead = Lead(
+            now = datetime.utcnow()
+            return Lead(
                 place_id=business.place_id,
                 cid=business.cid,
                 name=business.name,
@@ -173,35 +205,29 @@ def process_business(
                 category=business.category,
                 score=config.scoring.weight_no_website,
                 reasons=["no_website"],
-                first_seen=datetime.utcnow(),
-                last_seen=datetime.utcnow(),
+                first_seen=now,
+                last_seen=now,
                 lead_tier=compute_lead_tier(config.scoring.weight_no_website),
             )
-            if not dry_run:
-                is_new = db.upsert_lead(lead)
-                if not is_new:
-                    logger.debug(f"Skipping {business.name}: duplicate within window")
-                    return None
-
-            if lead.score >= config.scoring.min_score_to_include:
-                run_ctx.increment("qualifying_leads")
-                logger.info(
-                    f"Lead: {business.name} | no website | "
-                    f"Score: {lead.score} | Reasons: {','.join(lead.reasons)}"
-                )
-            return lead
-
-        run_ctx.increment("websites_checked")
 
         # Score the website
-        from .scoring import evaluate_with_isolation
+        from .scoring import evaluate_with_isolation, site_result_key
 
-        result = evaluate_with_isolation(
-            url=business.website,
-            config=config.scoring,
-            retry_config=config.retry,
-            expected_phone=business.phone,
-        )
+        key = site_result_key(business.website, business.phone)
+        result = site_results.get(key) if site_results is not None else None
+        if result is not None:
+            run_ctx.increment("urls_deduped")
+        else:
+            run_ctx.increment("websites_checked")
+            result = evaluate_with_isolation(
+                url=business.website,
+                config=config.scoring,
+                retry_config=config.retry,
+                expected_phone=business.phone,
+                cache=cache,
+            )
+            if site_results is not None:
+                site_results[key] = result
         run_ctx.count_reasons(result.reasons)
 
         reasons_list = list(result.reasons)
@@ -218,8 +244,8 @@ def process_business(
             exclusive_until = compute_exclusive_until(days=7)
             exclusive_tier = "pro"
 
-        # Create lead record
-        lead = Lead(
+        now = datetime.utcnow()
+        return Lead(
             place_id=business.place_id,
             cid=business.cid,
             name=business.name,
@@ -231,35 +257,112 @@ def process_business(
             category=business.category,
             score=result.score,
             reasons=reasons_list,
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
+            first_seen=now,
+            last_seen=now,
             exclusive_until=exclusive_until,
             exclusive_tier=exclusive_tier,
             lead_tier=lead_tier,
         )
 
-        # Store in database (skip in dry-run mode)
-        if dry_run:
-            is_new = True  # Assume new in dry-run
-        else:
-            is_new = db.upsert_lead(lead)
-            if not is_new:
-                logger.debug(f"Skipping {business.name}: duplicate within window")
-                return None
+    except Exception as e:
+        logger.error(f"Error processing {business.name}: {e}")
+        run_ctx.increment("errors")
+        return None
+
+
+def _log_if_qualifying(lead: Lead, config: Config, run_ctx: RunContext) -> None:
+    """Count and log a new lead that meets the export threshold."""
+    if lead.score >= config.scoring.min_score_to_include:
+        run_ctx.increment("qualifying_leads")
+        logger.info(
+            f"Lead: {lead.name} | {lead.website or 'no website'} | "
+            f"Score: {lead.score} | Reasons: {','.join(lead.reasons)}"
+        )
 
-        if result.score >= config.scoring.min_score_to_include:
-            run_ctx.increment("qualifying_leads")
-            logger.info(
-                f"Lead: {business.name} | {business.website} | "
-                f"Score: {result.score} | Reasons: {','.join(result.reasons)}"
-            )
-        return lead
 
+def process_business(
+    business: Business,
+    db: Database,
+    config: Config,
+    run_ctx: RunContext,
+    dry_run: bool = False,
+) -> Optional[Lead]:
+    """
+    Process a single business: check website, score, store.
+    Returns Lead if it qualifies, None otherwise.
+    Fully isolated - never raises exceptions.
+
+    Args:
+        dry_run: If True, skip database writes (scoring still happens).
+    """
+    lead = score_business(business, None if dry_run else db, config, run_ctx)
+    if lead is None:
+        return None
+
+    try:
+        # Store in database (skip in dry-run mode)
+        if not dry_run and not db.upsert_lead(lead):
+            logger.debug(f"Skipping {business.name}: duplicate within window")
+            return None
     except Exception as e:
         logger.error(f"Error processing {business.name}: {e}")
         run_ctx.increment("errors")
         return None
 
+    _log_if_qualifying(lead, config, run_ctx)
+    return lead
+
+
+def persist_lead_batch(
+    leads: list[Lead],
+    db: Database,
+    config: Config,
+    run_ctx: RunContext,
+    dry_run: bool = False,
+    score_cache: Optional[BufferedScoringCache] = None,
+) -> list[Lead]:
+    """
+    Write a batch of scored leads in one transaction.
+    Returns the leads that are new for this run; duplicates within the
+    dedupe window are dropped. Fully isolated - never raises exceptions.
+
+    Args:
+        dry_run: If True, skip database writes and treat every lead as new.
+        score_cache: Scoring results buffered by the workers; they are
+            written in the same transaction as the leads.
+    """
+    cache_rows = score_cache.drain() if score_cache is not None else []
+    if not leads and not cache_rows:
+        return []
+
+    if dry_run:
+        new_leads = list(leads)
+    else:
+        try:
+            with db.transaction():
+                flags = db.upsert_leads(leads)
+                if cache_rows:
+                    try:
+                        db.cache_scores(cache_rows)
+                    except Exception as e:
+                        # The cache only saves re-fetches; never lose leads over it.
+                        logger.warning(f"Failed to cache {len(cache_rows)} scoring results: {e}")
+        except Exception as e:
+            logger.error(f"Failed to store batch of {len(leads)} leads: {e}")
+            run_ctx.increment("errors")
+            return []
+
+        new_leads = []
+        for lead, is_new in zip(leads, flags):
+            if is_new:
+                new_leads.append(lead)
+            else:
+                logger.debug(f"Skipping {lead.name}: duplicate within window")
+
+    for lead in new_leads:
+        _log_if_qualifying(lead, config, run_ctx)
+    return new_leads
+
 
 def run_scraping_phase(
     config: Config,
@@ -277,8 +380,14 @@ def run_scraping_phase(
     """
     qualifying_leads = []
     market_report_paths = []
-
+    # Chains and multi-category listings repeat websites across queries;
+    # score each site once per run.
+    site_results: Dict[str, ScoringResult] = {}
     from .maps_scraper import scrape_with_isolation
+    from .scoring import BufferedScoringCache
+
+    # Workers buffer their scoring-cache writes; each lead batch flushes them.
+    score_cache = None if dry_run else BufferedScoringCache(db)
 
     for city in config.target_cities:
         if shutdown.check():
@@ -306,12 +415,22 @@ def run_scraping_phase(
             run_ctx.increment("queries_succeeded")
             run_ctx.increment("businesses_found", len(businesses))
 
-            # Process each business concurrently
+            # Score each business concurrently; buffer leads and write them
+            # in batches so each flush is a single transaction.
             batch_leads = []
+            pending: list[Lead] = []
             max_workers = getattr(config.scraper, 'max_workers', 5)
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = {
-                    executor.submit(process_business, business, db, config, run_ctx, dry_run): business
+                    executor.submit(
+                        score_business,
+                        business,
+                        score_cache,
+                        config,
+                        run_ctx,
+                        site_results,
+                        shutdown,
+                    ): business
                     for business in businesses
                 }
                 for future in concurrent.futures.as_completed(futures):
@@ -321,9 +440,21 @@ def run_scraping_phase(
                     try:
                         lead = future.result()
                         if lead:
-                            batch_leads.append(lead)
+                            pending.append(lead)
                     except Exception as e:
                         logger.error(f"Error processing business concurrently: {e}")
+                    if len(pending) >= LEAD_WRITE_BATCH_SIZE:
+                        batch_leads.extend(
+                            persist_lead_batch(
+                                pending, db, config, run_ctx,
+                                dry_run=dry_run, score_cache=score_cache,
+                            )
+                        )
+                        pending = []
+
+            batch_leads.extend(persist_lead_batch(
+                pending, db, config, run_ctx, dry_run=dry_run, score_cache=score_cache,
+            ))
 
             # Filter qualifying leads from batch
             batch_qualifying = [
@@ -538,16 +669,16 @@ def run_delivery_phase(
                 place_ids = [lead["place_id"] for lead in leads_pro]
                 db.mark_exported(place_ids, tier="pro")
                 logger.info(f"Marked {len(place_ids)} pro leads as exported")
-            for result in results:
-                if result.success:
-                    db.record_export(
-                        run_id=run_ctx.run_id,
-                        subscriber_email=result.subscriber_email,
-                        lead_count=len(leads_pro),
-                        csv_path=result.csv_path or "",
-                        tier="pro",
-                        export_type="cold",
-                    )
+            db.record_exports(
+                run_ctx.run_id,
+                [
+                    (result.subscriber_email, len(leads_pro), result.csv_path or "")
+                    for result in results
+                    if result.success
+                ],
+                tier="pro",
+                export_type="cold",
+            )
 
     # Deliver to Basic tier
     if basic_subs and leads_basic:
@@ -570,16 +701,16 @@ def run_delivery_phase(
                 place_ids = [lead["place_id"] for lead in leads_basic]
                 db.mark_exported(place_ids, tier="basic")
                 logger.info(f"Marked {len(place_ids)} basic leads as exported")
-            for result in results:
-                if result.success:
-                    db.record_export(
-                        run_id=run_ctx.run_id,
-                        subscriber_email=result.subscriber_email,
-                        lead_count=len(leads_basic),
-                        csv_path=result.csv_path or "",
-                        tier="basic",
-                        export_type="cold",
-                    )
+            db.record_exports(
+                run_ctx.run_id,
+                [
+                    (result.subscriber_email, len(leads_basic), result.csv_path or "")
+                    for result in results
+                    if result.success
+                ],
+                tier="basic",
+                export_type="cold",
+            )
 
     run_ctx.stats["emails_sent"] = total_emails_sent
     run_ctx.stats["leads_exported"] = total_leads_exported
@@ -665,27 +796,40 @@ def run_contact_finding_phase(
     logger.info(f"Finding contacts for {len(leads)} leads")
     found = 0
 
-    for lead in leads:
-        if shutdown.check():
-            logger.warning("Shutdown requested, stopping contact finding")
-            break
+    # Lookups are network-bound, so fetch concurrently and record results
+    # from this thread as they arrive.
+    leads = [lead for lead in leads if lead.get("website")]
+    max_workers = max(1, min(config.outreach.contact_workers, len(leads)))
+    html_parser = select_html_parser(config.outreach.contact_html_parser)
+    # One session for the phase, with its connection pools sized for the workers.
+    with build_contact_session(max_workers) as session, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                find_contact_with_isolation, lead["website"],
+                session=session, html_parser=html_parser,
+            ): lead
+            for lead in leads
+        }
+        for future in concurrent.futures.as_completed(futures):
+            if shutdown.check():
+                logger.warning("Shutdown requested, stopping contact finding")
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
 
-        website = lead.get("website")
-        if not website:
-            continue
-
-        contact, error = find_contact_with_isolation(website)
-        if contact:
-            db.record_contact(
-                lead["place_id"],
-                contact.email,
-                contact.source,
-                contact.confidence,
-                owner_name=contact.owner_name,
-            )
-            if contact.owner_name:
-                db.update_lead_owner_name(lead["place_id"], contact.owner_name)
-            found += 1
+            lead = futures[future]
+            contact, error = future.result()
+            if contact:
+                db.record_contact(
+                    lead["place_id"],
+                    contact.email,
+                    contact.source,
+                    contact.confidence,
+                    owner_name=contact.owner_name,
+                )
+                if contact.owner_name:
+                    db.update_lead_owner_name(lead["place_id"], contact.owner_name)
+                found += 1
 
     logger.info(f"Found contacts for {found} leads")
     run_ctx.increment("contacts_found", found)
@@ -795,16 +939,16 @@ def run_warm_delivery_phase(
     logger.info(f"Delivered warm leads to {success_count}/{len(pro_subs)} subscribers")
 
     # Record exports for warm leads
-    for result in results:
-        if result.get("success"):
-            db.record_export(
-                run_id=run_ctx.run_id,
-                subscriber_email=result.get("subscriber_email"),
-                lead_count=len(warm_leads),
-                csv_path=result.get("csv_path", ""),
-                tier="pro",
-                export_type="warm",
-            )
+    db.record_exports(
+        run_ctx.run_id,
+        [
+            (result.get("subscriber_email"), len(warm_leads), result.get("csv_path", ""))
+            for result in results
+            if result.get("success")
+        ],
+        tier="pro",
+        export_type="warm",
+    )
     return success_count > 0
 
 
@@ -858,6 +1002,12 @@ def run_weekly(
     with RunContext(logger) as run_ctx:
         if not dry_run:
             db.start_run(run_ctx.run_id)
+            # Expired rows are never read again (get_cached_score skips them).
+            # Housekeeping only: a failure here must not abort the run.
+            try:
+                db.cleanup_scoring_cache(max(config.scoring.cache_ttl_days, 0))
+            except Exception as e:
+                logger.warning(f"Scoring cache cleanup failed: {e}")
 
         try:
             scraped_qualifying_leads: Optional[list[Lead]] = None
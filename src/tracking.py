@@ -4,28 +4,75 @@ FastAPI app that serves audit pages and tracks opens, page views, CTA clicks,
 and unsubscribes.
 """
 
+import functools
+import gzip
 import hmac
+import json
 import os
-from datetime import datetime
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import quote
 
-from fastapi import FastAPI, Request, Form
+from anyio import to_thread
+from fastapi import BackgroundTasks, FastAPI, Request, Form
 from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape
 
-from .config import OUTPUT_DIR, PROJECT_ROOT, load_config
+from .config import OUTPUT_DIR, PROJECT_ROOT, Config, load_config
 from .db import Database
 from .gumroad import get_subscribers_with_isolation
-from .delivery import send_email
+from .delivery import send_emails
 from .portal_auth import verify_portal_token
 from .rate_limit import SlidingWindowLimiter
 from .logging_setup import get_logger
 
 logger = get_logger("tracking")
 
-app = FastAPI(title="BrokenSite Tracking", docs_url=None, redoc_url=None)
+
+# Endpoints touch SQLite and the filesystem synchronously, so they are
+# declared with plain def and run off the event loop.
+THREADPOOL_TOKENS = 100
+
+
+# Config read once by the lifespan. load_config() re-reads .env and creates
+# the output directories, which every request used to pay for.
+_config: Config | None = None
+
+
+def _get_config() -> Config:
+    """Return the server's config, loading it fresh outside the lifespan."""
+    return _config if _config is not None else load_config()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database before serving and close it on shutdown.
+
+    Schema setup and migrations run here rather than inside whichever pixel
+    or audit request happens to arrive first.
+    """
+    # Handlers are plain defs that FastAPI runs in anyio's worker threads;
+    # the default 40 tokens queue requests behind a burst of pixel hits.
+    global _config
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+    _config = load_config()
+    _get_db()
+    portal = _config.portal
+    _event_buffer.start(portal.event_batch_size, portal.event_batch_ms / 1000)
+    try:
+        yield
+    finally:
+        _event_buffer.stop()
+        _close_db()
+        _config = None
+
+
+app = FastAPI(title="BrokenSite Tracking", docs_url=None, redoc_url=None, lifespan=lifespan)
 
 AUDITS_DIR = OUTPUT_DIR / "audits"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
@@ -79,6 +126,54 @@ def _render_error_page(title: str, message: str, from_email: str, status_code: i
         html = f"<!doctype html><html><body><h1>{title}</h1><p>{message}</p></body></html>"
     return HTMLResponse(content=html, status_code=status_code)
 
+
+# Pages whose render depends only on config (thank-you, unsubscribe) are
+# rendered and gzipped once per process rather than on every hit.
+_static_pages: dict[tuple, tuple[bytes, bytes]] = {}
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip. Codings are matched as
+    tokens, so "gzip;q=0" refuses it, and "*" covers gzip unless gzip is
+    listed on its own.
+    """
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            pname, _, value = param.partition("=")
+            if pname.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == "*":
+            wildcard = quality > 0
+        else:
+            return quality > 0
+    return wildcard
+
+
+def _static_html_response(request: Request, name: str, **context) -> Response:
+    """Serve a cached template render, gzipped when the client accepts it."""
+    key = (name, tuple(sorted(context.items())))
+    page = _static_pages.get(key)
+    if page is None:
+        body = _render_template(name, **context).encode("utf-8")
+        page = _static_pages[key] = (body, gzip.compress(body, 9))
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            content=page[1],
+            media_type="text/html",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return HTMLResponse(content=page[0], headers={"Vary": "Accept-Encoding"})
+
 # 1x1 transparent GIF
 TRACKING_PIXEL = (
     b"GIF89a\x01\x00\x01\x00\x80\x00\x00\xff\xff\xff"
@@ -86,19 +181,109 @@ TRACKING_PIXEL = (
     b"\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
 )
 
-# Lazy-initialized database
+# Immutable pixel response shared by every open. Starlette's Response holds
+# no per-request state, so it can be returned as-is; do not add
+# BackgroundTasks to track_open, since FastAPI would attach them to it.
+_PIXEL_RESPONSE = Response(
+    content=TRACKING_PIXEL,
+    media_type="image/gif",
+    headers={"Cache-Control": "no-cache, no-store, must-revalidate"},
+)
+
+# Process-wide database, opened by the app lifespan (or lazily outside it)
 _db = None
+_db_lock = threading.Lock()
 
 
 def _get_db() -> Database:
     """Get or create database connection."""
     global _db
     if _db is None:
-        config = load_config()
-        _db = Database(config.database)
+        with _db_lock:
+            if _db is None:
+                config = _get_config()
+                _db = Database(config.database)
     return _db
 
 
+def _close_db() -> None:
+    """Close the shared database connection, if open."""
+    global _db
+    with _db_lock:
+        if _db is not None:
+            _db.close()
+            _db = None
+
+
+class _EventBuffer:
+    """Collects engagement events and writes them to the database in batches.
+
+    Pixel opens arrive in bursts after each send; one executemany per batch
+    replaces a transaction per hit. Until start() is called (scripts, tests)
+    events are written immediately.
+    """
+
+    def __init__(self):
+        self._events: list[tuple] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._batch_size = 500
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, batch_size: int, interval_seconds: float) -> None:
+        if self._thread is not None:
+            return
+        self._batch_size = max(1, batch_size)
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(max(0.01, interval_seconds),), name="event-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        thread.join(timeout=10)
+        self._thread = None
+        self.flush()
+
+    def add(self, event: tuple) -> None:
+        with self._lock:
+            self._events.append(event)
+            full = len(self._events) >= self._batch_size
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        with self._lock:
+            batch, self._events = self._events, []
+        if not batch:
+            return 0
+        try:
+            return _get_db().record_events_bulk(batch)
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} engagement events: {e}")
+            return 0
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(interval_seconds)
+            self._wake.clear()
+            self.flush()
+
+
+_event_buffer = _EventBuffer()
+
+
 def _record_event(place_id: str, event_type: str, request: Request):
     """Record a tracking event to the database.
 
@@ -115,27 +300,49 @@ def _record_event(place_id: str, event_type: str, request: Request):
             logger.debug(f"Deduped {event_type} for {place_id} from {ip_address}")
             return
 
-        db = _get_db()
         user_agent = request.headers.get("user-agent", "")
-        db.record_event(
-            place_id=place_id,
-            event_type=event_type,
-            ip_address=ip_address,
-            user_agent=user_agent,
-        )
+        if _event_buffer.running:
+            _event_buffer.add((place_id, event_type, ip_address, user_agent, datetime.utcnow()))
+        else:
+            _get_db().record_event(
+                place_id=place_id,
+                event_type=event_type,
+                ip_address=ip_address,
+                user_agent=user_agent,
+            )
         logger.debug(f"Recorded {event_type} for {place_id}")
     except Exception as e:
         logger.error(f"Failed to record event {event_type} for {place_id}: {e}")
 
 
+# Pro subscribers are fetched from Gumroad at most every
+# PRO_SUBSCRIBERS_TTL_SECONDS, so a burst of inquiries shares one API call.
+PRO_SUBSCRIBERS_TTL_SECONDS = 60
+_pro_subscribers_cache: tuple[float, list] = (0.0, [])
+_pro_subscribers_lock = threading.Lock()
+
+
+def _pro_subscribers(config: Config) -> list:
+    """Active Pro subscribers, from a short-lived cache. Failures are not cached."""
+    global _pro_subscribers_cache
+    with _pro_subscribers_lock:
+        fetched_at, pro_subs = _pro_subscribers_cache
+        now = time.monotonic()
+        if fetched_at and now - fetched_at < PRO_SUBSCRIBERS_TTL_SECONDS:
+            return pro_subs
+        subscribers, err = get_subscribers_with_isolation(config.gumroad, config.retry)
+        if err:
+            return []
+        pro_subs = [s for s in subscribers or [] if s.tier == "pro"]
+        _pro_subscribers_cache = (now, pro_subs)
+        return pro_subs
+
+
 def _send_inquiry_notifications(place_id: str, name: str, email: str, phone: str, notes: str):
     """Notify Pro subscribers of a CTA inquiry submission."""
     try:
-        config = load_config()
-        subscribers, err = get_subscribers_with_isolation(config.gumroad, config.retry)
-        if err or not subscribers:
-            return
-        pro_subs = [s for s in subscribers if s.tier == "pro"]
+        config = _get_config()
+        pro_subs = _pro_subscribers(config)
         if not pro_subs:
             return
 
@@ -157,58 +364,112 @@ Contact Email: {email}
 Contact Phone: {phone}
 Notes: {notes}
 """
+        messages = []
         for sub in pro_subs:
             msg = MIMEMultipart()
             msg["Subject"] = subject
             msg["From"] = f"{config.smtp.from_name} <{config.smtp.from_email}>"
             msg["To"] = sub.email
             msg.attach(MIMEText(body, "plain"))
-            send_email(msg, config.smtp, config.retry)
+            messages.append(msg)
+        # One SMTP session for every pro subscriber instead of a TLS
+        # handshake and login per recipient.
+        send_emails(messages, config.smtp, config.retry, operation_name=f"inquiry_{place_id}")
     except Exception as e:
         logger.error(f"Failed to send inquiry notifications: {e}")
 
 
 def _build_portal_exports(exports: list[dict], token: str) -> list[dict]:
-    """Build export list with rendered links for the portal template."""
+    """Build export list with rendered links for the portal template.
+
+    The template autoescapes every field; links are URL-quoted here so a
+    filename or token can't break out of the query string.
+    """
+    query = f"?token={quote(token, safe='')}"
     result = []
     for exp in exports:
-        csv_path = exp.get("csv_path") or ""
-        filename = Path(csv_path).name if csv_path else ""
-        link = f"/portal/download/{filename}?token={token}" if filename else ""
+        filename = os.path.basename(exp.get("csv_path") or "")
         result.append({
             "sent_at": exp.get("sent_at", ""),
             "export_type": exp.get("export_type", ""),
             "tier": exp.get("tier", ""),
             "lead_count": exp.get("lead_count", ""),
             "filename": filename or "n/a",
-            "link": link,
+            "link": f"/portal/download/{quote(filename)}{query}" if filename else "",
         })
     return result
 
 
 @app.get("/track/{place_id}/open.gif")
-async def track_open(place_id: str, request: Request):
-    """Track email open via tracking pixel."""
+def track_open(place_id: str, request: Request):
+    """Track email open via tracking pixel.
+
+    With the event buffer running, recording is an in-memory append, so the
+    pixel goes back without waiting on SQLite.
+    """
     _record_event(place_id, "email_opened", request)
-    return Response(
-        content=TRACKING_PIXEL,
-        media_type="image/gif",
-        headers={"Cache-Control": "no-cache, no-store, must-revalidate"},
-    )
+    return _PIXEL_RESPONSE
+
+
+AUDIT_CACHE_CONTROL = "private, max-age=60"
+CTA_FORM_CACHE_CONTROL = "private, max-age=300"
+EXPORT_CACHE_CONTROL = "private, max-age=60"
+
+# Audit filenames are listed at most every AUDIT_LISTING_TTL_SECONDS, so
+# requests for unknown place_ids are answered without touching the disk. A
+# report written by the weekly run becomes visible within one TTL.
+AUDIT_LISTING_TTL_SECONDS = 30
+_audit_listing: tuple[Path | None, float, frozenset[str]] = (None, 0.0, frozenset())
+_audit_listing_lock = threading.Lock()
+
+
+def _audit_names() -> frozenset[str]:
+    """Filenames currently in AUDITS_DIR, from a short-lived cache."""
+    global _audit_listing
+    directory, listed_at, names = _audit_listing
+    now = time.monotonic()
+    if directory == AUDITS_DIR and now - listed_at < AUDIT_LISTING_TTL_SECONDS:
+        return names
+    with _audit_listing_lock:
+        try:
+            names = frozenset(entry.name for entry in os.scandir(AUDITS_DIR))
+        except OSError:
+            names = frozenset()
+        _audit_listing = (AUDITS_DIR, now, names)
+    return names
+
+
+def _if_none_match(request: Request) -> set[str]:
+    """ETags listed in the request's If-None-Match header, weak prefixes dropped."""
+    header = request.headers.get("if-none-match", "")
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
 
 
 @app.get("/audit/{place_id}")
-async def view_audit(place_id: str, request: Request):
+def view_audit(place_id: str, request: Request):
     """Serve audit page and track view."""
     _record_event(place_id, "page_view", request)
 
-    audit_path = AUDITS_DIR / f"{place_id}.html"
-    if audit_path.exists():
+    filename = f"{place_id}.html"
+    stat_result = None
+    if filename in _audit_names():
+        audit_path = AUDITS_DIR / filename
+        try:
+            stat_result = audit_path.stat()
+        except OSError:
+            pass
+    if stat_result is not None:
+        # Audits are rewritten only by the weekly run, so size+mtime is a
+        # stable validator; a revisit costs a 304 instead of the whole page.
+        etag = f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        headers = {"ETag": etag, "Cache-Control": AUDIT_CACHE_CONTROL}
+        if etag in _if_none_match(request):
+            return Response(status_code=304, headers=headers)
         return FileResponse(
-            audit_path, media_type="text/html", headers={"Cache-Control": "no-cache"}
+            audit_path, media_type="text/html", headers=headers, stat_result=stat_result
         )
 
-    config = load_config()
+    config = _get_config()
     return _render_error_page(
         title="Report not found",
         message="This checkup report is no longer available. It may have expired or been removed.",
@@ -218,24 +479,34 @@ async def view_audit(place_id: str, request: Request):
 
 
 @app.get("/track/{place_id}/cta")
-async def track_cta_form(place_id: str, request: Request):
+def track_cta_form(place_id: str, request: Request):
     """Show CTA form and track view."""
     db = _get_db()
     lead = db.get_lead_summary(place_id)
     business_name = lead.get("name") if lead else ""
 
-    html = _render_template(
+    return HTMLResponse(
+        content=_cta_form_html(place_id, business_name),
+        status_code=200,
+        headers={"Cache-Control": CTA_FORM_CACHE_CONTROL},
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _cta_form_html(place_id: str, business_name: str) -> bytes:
+    """Render the CTA form; keyed on the name so a renamed lead re-renders."""
+    return _render_template(
         "cta_form.html",
         business_name=business_name,
         action_url=f"/track/{place_id}/cta",
-    )
-    return HTMLResponse(content=html, status_code=200)
+    ).encode("utf-8")
 
 
 @app.post("/track/{place_id}/cta")
-async def track_cta_submit(
+def track_cta_submit(
     place_id: str,
     request: Request,
+    background_tasks: BackgroundTasks,
     name: str = Form(""),
     email: str = Form(""),
     phone: str = Form(""),
@@ -245,7 +516,8 @@ async def track_cta_submit(
 
     Unauthenticated and fans out an email to every pro subscriber per
     submission, so it carries its own tighter, IP-scoped rate limit beyond
-    the general engagement-event dedupe in _record_event().
+    the general engagement-event dedupe in _record_event(). The fan-out runs
+    as a background task once the thank-you page has been sent.
     """
     _record_event(place_id, "cta_click", request)
 
@@ -254,7 +526,7 @@ async def track_cta_submit(
         f"cta_submit:{ip_address}", CTA_SUBMIT_MAX_PER_WINDOW, CTA_SUBMIT_WINDOW_SECONDS
     ):
         logger.warning(f"CTA submission rate limit exceeded for {ip_address}")
-        config = load_config()
+        config = _get_config()
         return _render_error_page(
             title="Too many requests",
             message="You've submitted this form a few times recently. Please try again later.",
@@ -269,43 +541,51 @@ async def track_cta_submit(
         phone = phone[:CTA_FIELD_MAX_LENGTH]
         notes = notes[:CTA_NOTES_MAX_LENGTH]
         db.record_lead_inquiry(place_id, name, email, phone, notes)
-        _send_inquiry_notifications(place_id, name, email, phone, notes)
+        background_tasks.add_task(_send_inquiry_notifications, place_id, name, email, phone, notes)
     except Exception as e:
         logger.error(f"Failed to record CTA inquiry: {e}")
 
-    html = _render_template("thank_you.html")
-    return HTMLResponse(content=html, status_code=200)
+    return _static_html_response(request, "thank_you.html")
 
 
 @app.get("/unsubscribe/{place_id}")
-async def unsubscribe(place_id: str, request: Request):
+def unsubscribe(place_id: str, request: Request):
     """Handle unsubscribe requests."""
     _record_event(place_id, "unsubscribe", request)
 
     try:
-        db = _get_db()
-        # Get the email for this place_id from contacts or outreach
-        contact = db.get_contact(place_id)
-        email = contact["email"] if contact else ""
-        db.add_unsubscribe(place_id, email)
-        if email:
-            # Suppress by email (not just place_id) so a business with
-            # multiple Google Place IDs/locations sharing one contact email
-            # can't keep receiving outreach after unsubscribing once.
-            db.add_suppression(email, "unsubscribed")
+        # Contact lookup, unsubscribe and email suppression share one
+        # transaction instead of three separate commits.
+        _get_db().unsubscribe_place(place_id)
         logger.info(f"Unsubscribed {place_id}")
     except Exception as e:
         logger.error(f"Error processing unsubscribe for {place_id}: {e}")
 
-    config = load_config()
-    html = _render_template("unsubscribe.html", from_email=config.smtp.from_email)
-    return HTMLResponse(content=html, status_code=200)
+    config = _get_config()
+    return _static_html_response(request, "unsubscribe.html", from_email=config.smtp.from_email)
+
+
+@functools.lru_cache(maxsize=1024)
+def _verify_portal_token_cached(token: str, secret: str):
+    return verify_portal_token(token, secret)
+
+
+def _verify_portal_token(token: str, secret: str):
+    """verify_portal_token() memoized per (token, secret).
+
+    A portal visit and its downloads reuse one token, so the HMAC and decode
+    run once. Expiry is re-checked on every hit since cached entries outlive it.
+    """
+    verified = _verify_portal_token_cached(token, secret)
+    if verified and datetime.now(timezone.utc) > verified[1]:
+        return None
+    return verified
 
 
 @app.get("/portal")
-async def portal(token: str = ""):
+def portal(token: str = ""):
     """Subscriber portal with token auth."""
-    config = load_config()
+    config = _get_config()
     if not config.portal.secret:
         return _render_error_page(
             title="Portal not configured",
@@ -313,7 +593,7 @@ async def portal(token: str = ""):
             from_email=config.smtp.from_email,
             status_code=403,
         )
-    verified = verify_portal_token(token, config.portal.secret)
+    verified = _verify_portal_token(token, config.portal.secret)
     if not verified:
         return _render_error_page(
             title="Link expired",
@@ -338,9 +618,9 @@ async def portal(token: str = ""):
 
 
 @app.get("/portal/download/{filename}")
-async def portal_download(filename: str, token: str = ""):
+def portal_download(filename: str, token: str = ""):
     """Download export CSV with token auth."""
-    config = load_config()
+    config = _get_config()
     if not config.portal.secret:
         return _render_error_page(
             title="Portal not configured",
@@ -348,7 +628,7 @@ async def portal_download(filename: str, token: str = ""):
             from_email=config.smtp.from_email,
             status_code=403,
         )
-    verified = verify_portal_token(token, config.portal.secret)
+    verified = _verify_portal_token(token, config.portal.secret)
     if not verified:
         return _render_error_page(
             title="Link expired",
@@ -358,50 +638,61 @@ async def portal_download(filename: str, token: str = ""):
         )
 
     email, _ = verified
-    output_dir = OUTPUT_DIR.resolve()
-    requested = (output_dir / filename).resolve()
-    try:
-        requested.relative_to(output_dir)
-    except ValueError:
+    # Exports live directly in OUTPUT_DIR, so anything that is not a bare
+    # filename is rejected before touching the filesystem.
+    if not filename or filename.startswith(".") or "/" in filename or "\\" in filename:
         return _render_error_page(
             title="Invalid request",
             message="The file path you requested is not allowed.",
             from_email=config.smtp.from_email,
             status_code=400,
         )
+    requested = _resolved_dir(OUTPUT_DIR) / filename
     exports = _get_db().get_recent_exports(email, limit=50)
-    allowed_paths = {
-        Path(export["csv_path"]).resolve()
+    # Only exports with a matching basename can be this file; resolve just those.
+    allowed = any(
+        Path(export["csv_path"]).name == filename
+        and Path(export["csv_path"]).resolve() == requested
         for export in exports
         if export.get("csv_path")
-    }
-    if requested not in allowed_paths:
+    )
+    if not allowed:
         return _render_error_page(
             title="File not found",
             message="The file you requested is not available for this account.",
             from_email=config.smtp.from_email,
             status_code=404,
         )
-    if not requested.exists():
+    if not requested.is_file():
         return _render_error_page(
             title="File not found",
             message="The file you requested no longer exists or may have been moved.",
             from_email=config.smtp.from_email,
             status_code=404,
         )
-    return FileResponse(requested, media_type="text/csv")
+    return FileResponse(
+        requested,
+        media_type="text/csv",
+        headers={"Cache-Control": EXPORT_CACHE_CONTROL},
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_dir(path: Path) -> Path:
+    """Resolve a configured directory once instead of per request."""
+    return path.resolve()
 
 
 @app.get("/")
 @app.get("/dashboard")
-async def dashboard(request: Request, token: str = ""):
+def dashboard(request: Request, token: str = ""):
     """Operator dashboard showing run status, leads, and log tail.
 
     Gated behind DASHBOARD_TOKEN. The dashboard exposes the lead database and
     a tail of the server log, so it must never be reachable without the shared
     secret. When the token is unset the dashboard is disabled entirely.
     """
-    config = load_config()
+    config = _get_config()
     expected = config.portal.dashboard_token
     if not expected:
         return _render_error_page(
@@ -527,7 +818,21 @@ async def dashboard(request: Request, token: str = ""):
     return HTMLResponse(content=html, status_code=200)
 
 
+# Probes poll /health constantly; the body is serialized at most once a
+# second and the same Response is returned in between, which also skips
+# FastAPI's jsonable_encoder pass over a returned dict.
+_health_snapshot: tuple[float, Response | None] = (0.0, None)
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
+    global _health_snapshot
+    now = time.monotonic()
+    if now - _health_snapshot[0] >= 1.0 or _health_snapshot[1] is None:
+        body = json.dumps(
+            {"status": "ok", "timestamp": datetime.utcnow().isoformat()},
+            separators=(",", ":"),
+        )
+        _health_snapshot = (now, Response(content=body, media_type="application/json"))
+    return _health_snapshot[1]
@@ -5,12 +5,14 @@ Identifies engaged leads and delivers them to subscribers.
 
 import csv
 import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from email.mime.base import MIMEBase
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from .config import Config, OUTPUT_DIR, SMTPConfig, PortalConfig
-from .delivery import create_email, send_email, _sanitize_csv_value
+from .delivery import build_csv_attachment, create_email, send_email, _sanitize_csv_value
 from .portal_auth import generate_portal_token
 from .lead_utils import compute_lead_tier, has_marketing_pixel, suggested_pitch_from_reasons, parse_reasons
 from .logging_setup import get_logger
@@ -45,6 +47,30 @@ WARM_CSV_COLUMNS = [
 ]
 
 
+def _warm_lead_row(lead: Dict) -> list:
+    """Build one CSV row (in WARM_CSV_COLUMNS order) for a warm lead."""
+    reasons = lead.get("reasons", "")
+    reasons_list = parse_reasons(reasons)
+    return [
+        _sanitize_csv_value(lead.get("name", "")),
+        _sanitize_csv_value(lead.get("website", "")),
+        _sanitize_csv_value(lead.get("phone", "")),
+        _sanitize_csv_value(lead.get("address", "")),
+        _sanitize_csv_value(lead.get("city", "")),
+        _sanitize_csv_value(lead.get("category", "")),
+        _sanitize_csv_value(lead.get("review_count", "")),
+        lead.get("score", 0),
+        lead.get("engagement_score", 0),
+        _sanitize_csv_value(lead.get("email", "")),
+        _sanitize_csv_value(lead.get("audit_url", "")),
+        _sanitize_csv_value(",".join(reasons_list)),
+        lead.get("lead_tier") or compute_lead_tier(int(lead.get("score") or 0), reasons),
+        suggested_pitch_from_reasons(reasons),
+        "yes" if has_marketing_pixel(reasons) else "no",
+        _sanitize_csv_value(lead.get("exclusive_until", "")),
+    ]
+
+
 def generate_warm_lead_csv(
     warm_leads: List[Dict], output_path: Path = None
 ) -> Tuple[str, Path]:
@@ -61,29 +87,7 @@ def generate_warm_lead_csv(
     output = io.StringIO()
     writer = csv.writer(output)
     writer.writerow(WARM_CSV_COLUMNS)
-
-    for lead in warm_leads:
-        reasons = lead.get("reasons", "")
-        reasons_list = parse_reasons(reasons)
-        writer.writerow([
-            _sanitize_csv_value(lead.get("name", "")),
-            _sanitize_csv_value(lead.get("website", "")),
-            _sanitize_csv_value(lead.get("phone", "")),
-            _sanitize_csv_value(lead.get("address", "")),
-            _sanitize_csv_value(lead.get("city", "")),
-            _sanitize_csv_value(lead.get("category", "")),
-            _sanitize_csv_value(lead.get("review_count", "")),
-            lead.get("score", 0),
-            lead.get("engagement_score", 0),
-            _sanitize_csv_value(lead.get("email", "")),
-            _sanitize_csv_value(lead.get("audit_url", "")),
-            _sanitize_csv_value(",".join(reasons_list)),
-            lead.get("lead_tier") or compute_lead_tier(int(lead.get("score") or 0), reasons),
-            suggested_pitch_from_reasons(reasons),
-            "yes" if has_marketing_pixel(reasons) else "no",
-            _sanitize_csv_value(lead.get("exclusive_until", "")),
-        ])
-
+    writer.writerows(_warm_lead_row(lead) for lead in warm_leads)
     csv_content = output.getvalue()
 
     # Write to file
@@ -115,9 +119,10 @@ def deliver_warm_leads(
     # Generate CSV
     csv_content, csv_path = generate_warm_lead_csv(warm_leads)
     csv_filename = csv_path.name
+    # Encode the attachment once; every subscriber's message shares the part.
+    attachment = build_csv_attachment(csv_content, csv_filename)
 
-    results = []
-    for subscriber in subscribers:
+    def deliver_one(subscriber) -> Dict:
         try:
             msg = _create_warm_lead_email(
                 subscriber=subscriber,
@@ -126,31 +131,37 @@ def deliver_warm_leads(
                 lead_count=len(warm_leads),
                 config=config.smtp,
                 portal_config=portal_config,
+                attachment=attachment,
             )
 
             send_email(msg, config.smtp, config.retry)
             logger.info(f"Sent warm leads to {subscriber.email}")
-            results.append({
+            return {
                 "subscriber_email": subscriber.email,
                 "success": True,
                 "lead_count": len(warm_leads),
                 "csv_path": str(csv_path),
-            })
+            }
 
         except Exception as e:
             logger.error(f"Failed to deliver warm leads to {subscriber.email}: {e}")
-            results.append({
+            return {
                 "subscriber_email": subscriber.email,
                 "success": False,
                 "error": str(e),
                 "csv_path": str(csv_path),
-            })
+            }
 
-    return results
+    # Sends are network-bound, so overlap them; map() keeps results in
+    # subscriber order.
+    workers = max(1, min(config.smtp.parallelism, len(subscribers)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(deliver_one, subscribers))
 
 
 def _create_warm_lead_email(
-    subscriber, csv_content: str, csv_filename: str, lead_count: int, config: SMTPConfig, portal_config: PortalConfig = None
+    subscriber, csv_content: str, csv_filename: str, lead_count: int, config: SMTPConfig, portal_config: PortalConfig = None,
+    attachment: Optional[MIMEBase] = None,
 ):
     """Create warm lead delivery email using existing create_email pattern."""
     portal_url = None
@@ -172,6 +183,7 @@ def _create_warm_lead_email(
         lead_count=lead_count,
         config=config,
         portal_url=portal_url,
+        attachment=attachment,
     )
     # Override subject to indicate warm leads
     del msg["Subject"]
@@ -90,9 +90,9 @@ class TestFindCompetitors:
 
 
 class TestScoreCompetitorWebsites:
-    @patch("src.competitor_analysis.evaluate_with_isolation")
+    @patch("src.competitor_analysis.evaluate_many")
     def test_scores_each_competitor(self, mock_eval):
-        mock_eval.side_effect = [
+        mock_eval.return_value = [
             Mock(score=45, reasons=["no_https"]),
             Mock(score=10, reasons=[]),
         ]
@@ -108,6 +108,7 @@ class TestScoreCompetitorWebsites:
         assert result[0]["score"] == 45
         assert result[0]["reasons"] == ["no_https"]
         assert result[1]["score"] == 10
+        assert mock_eval.call_args[0][0] == ["https://a.com", "https://b.com"]
 
 
 class TestBuildCompetitorSummary:
@@ -3,14 +3,70 @@ Tests for the database module.
 """
 
 import sqlite3
+from pathlib import Path
 
 import pytest
 from datetime import datetime, timedelta
+from typing import List
 
 from src.config import DatabaseConfig
 from src.db import Database, Lead
 
 
+# Bypasses upsert_lead's dedupe window so tests can seed rows with
+# arbitrary timestamps. One statement, bound per row via executemany.
+LEAD_INSERT_SQL = """
+    INSERT INTO leads (
+        place_id, cid, name, website, address, phone,
+        city, category, score, reasons, first_seen, last_seen
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _insert_raw_leads(db: Database, leads: List[Lead]) -> None:
+    """Insert leads as-is in one statement and one commit, however many."""
+    with db._connect() as conn:
+        conn.executemany(LEAD_INSERT_SQL, [
+            (
+                lead.place_id, lead.cid, lead.name, lead.website,
+                lead.address, lead.phone, lead.city, lead.category,
+                lead.score, lead.reasons, lead.first_seen, lead.last_seen,
+            )
+            for lead in leads
+        ])
+
+
+# One day past the 90-day dedupe window pinned by the database_config fixture.
+OLD_TIME_OFFSET = timedelta(days=91)
+
+
+@pytest.fixture
+def old_time(now):
+    """A last_seen just outside the dedupe window, fixed for the whole test."""
+    return now - OLD_TIME_OFFSET
+
+
+@pytest.fixture(scope="module")
+def schema(template_db_path):
+    """Tables, indexes and per-table columns of a fresh database, read once."""
+    conn = sqlite3.connect(template_db_path)
+    try:
+        snapshot = {"tables": set(), "indexes": set(), "columns": {}}
+        for kind, name in conn.execute(
+            "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')"
+        ):
+            snapshot["tables" if kind == "table" else "indexes"].add(name)
+        for table, column in conn.execute("""
+            SELECT m.name, p.name
+            FROM sqlite_master m JOIN pragma_table_info(m.name) p
+            WHERE m.type = 'table'
+        """):
+            snapshot["columns"].setdefault(table, set()).add(column)
+        return snapshot
+    finally:
+        conn.close()
+
+
 class TestDatabaseInitialization:
     """Tests for database initialization."""
 
@@ -18,53 +74,73 @@ class TestDatabaseInitialization:
         """Database file should be created."""
         assert test_db_path.exists()
 
-    def test_creates_leads_table(self, test_database):
-        """Leads table should exist."""
-        with test_database._connect() as conn:
-            result = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='leads'"
-            ).fetchone()
-            assert result is not None
-
-    def test_creates_runs_table(self, test_database):
-        """Runs table should exist."""
-        with test_database._connect() as conn:
-            result = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='runs'"
-            ).fetchone()
-            assert result is not None
+    @pytest.mark.parametrize(
+        "table", ["leads", "runs", "exports", "suppression", "lead_inquiries"]
+    )
+    def test_creates_table(self, schema, table):
+        """Core tables should exist."""
+        assert table in schema["tables"]
 
-    def test_creates_exports_table(self, test_database):
-        """Exports table should exist."""
-        with test_database._connect() as conn:
-            result = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='exports'"
-            ).fetchone()
-            assert result is not None
+    def test_file_database_uses_wal(self, tmp_path):
+        """File databases open in WAL mode with relaxed commit syncing."""
+        db = Database(DatabaseConfig(db_path=tmp_path / "wal.db"))
+        try:
+            with db._connect() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            db.close()
 
-    def test_creates_suppression_and_inquiries_tables(self, test_database):
-        """Suppression and lead inquiries tables should exist."""
-        with test_database._connect() as conn:
-            suppression = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='suppression'"
-            ).fetchone()
-            inquiries = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='lead_inquiries'"
-            ).fetchone()
-            assert suppression is not None
-            assert inquiries is not None
+    def test_durable_writes_sync_on_commit(self, tmp_path):
+        """Outreach/suppression writes commit with synchronous=FULL, then relax."""
+        db = Database(DatabaseConfig(db_path=tmp_path / "wal.db"))
+        try:
+            with db._connect(durable=True) as conn:
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+            db.record_outreach("p1", "owner@example.com", "https://x/audit", True)
+            db.add_suppression("owner@example.com", "bounced")
+            with db._connect() as conn:
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert db.is_suppressed("owner@example.com")
+        finally:
+            db.close()
 
-    def test_leads_has_exclusive_columns(self, test_database):
+    def test_supports_in_memory_databases(self):
+        """":memory:" and shared-cache memory URIs never touch disk."""
+        for db_path in (":memory:", "file:brokensite_mem?mode=memory&cache=shared"):
+            db = Database(DatabaseConfig(db_path=db_path))
+            try:
+                db.record_contact("p1", "owner@example.com", "mailto", 0.9)
+                assert db.get_contact("p1")["email"] == "owner@example.com"
+            finally:
+                db.close()
+        assert not Path("file:brokensite_mem?mode=memory&cache=shared").exists()
+
+    @pytest.mark.parametrize(
+        "column",
+        ["exclusive_until", "exclusive_tier", "lead_tier", "exported_basic_at", "exported_pro_at"],
+    )
+    def test_leads_has_exclusive_columns(self, schema, column):
         """Leads table should include exclusive and tier columns."""
-        with test_database._connect() as conn:
-            cols = {row["name"] for row in conn.execute("PRAGMA table_info(leads)").fetchall()}
-            assert "exclusive_until" in cols
-            assert "exclusive_tier" in cols
-            assert "lead_tier" in cols
-            assert "exported_basic_at" in cols
-            assert "exported_pro_at" in cols
-
-    def test_migrates_existing_leads_table_for_competitor_metadata(self, tmp_path):
+        assert column in schema["columns"]["leads"]
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            "idx_leads_website",
+            "idx_leads_last_seen",
+            "idx_leads_score",
+            "idx_leads_exported_pro_score",
+            "idx_leads_exported_basic_score",
+            "idx_exports_subscriber",
+            "idx_engagement_place_type",
+        ],
+    )
+    def test_creates_index(self, schema, index):
+        """Lookup indexes should exist."""
+        assert index in schema["indexes"]
+
+    def test_migrates_existing_leads_table_for_competitor_metadata(self, tmp_path, now):
         """Older databases should gain competitor metadata before writes use it."""
         db_path = tmp_path / "legacy_leads.db"
         with sqlite3.connect(db_path) as conn:
@@ -109,8 +185,8 @@ class TestDatabaseInitialization:
                 category="plumber",
                 score=80,
                 reasons=["ssl_error"],
-                first_seen=datetime.utcnow(),
-                last_seen=datetime.utcnow(),
+                first_seen=now,
+                last_seen=now,
                 competitors_json='{"gap_text": "test"}',
             )
 
@@ -199,31 +275,18 @@ class TestDatabaseInitialization:
 class TestLeadUpsert:
     """Tests for lead upsert operations."""
 
-    def test_inserts_new_lead(self, test_database):
+    def test_inserts_new_lead(self, test_database, lead_factory):
         """Should insert a new lead and return True."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead = lead_factory()
 
         is_new = test_database.upsert_lead(lead)
 
         assert is_new is True
 
-    def test_update_lead_score_persists_same_run_adjustment(self, test_database):
+    def test_update_lead_score_persists_same_run_adjustment(self, test_database, lead_factory):
         """update_lead_score must overwrite score/reasons even within the dedupe
         window, where upsert_lead intentionally skips the write."""
-        lead = Lead(
+        lead = lead_factory(
             place_id="yelp_place_1",
             cid=None,
             name="Yelp Biz",
@@ -231,11 +294,8 @@ class TestLeadUpsert:
             address=None,
             phone=None,
             city="Austin, TX",
-            category="plumber",
             score=50,
             reasons=["no_https"],
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
         )
         assert test_database.upsert_lead(lead) is True
         # A second upsert in the same run is a no-op (duplicate within window).
@@ -249,52 +309,20 @@ class TestLeadUpsert:
         assert summary["score"] == 70
         assert "yelp_low_rating" in summary["reasons"]
 
-    def test_updates_existing_lead_outside_window(self, test_database, database_config):
+    def test_updates_existing_lead_outside_window(self, test_database, lead_factory, old_time):
         """Should update lead if last_seen is outside dedupe window."""
-        old_time = datetime.utcnow() - timedelta(days=database_config.dedupe_window_days + 1)
-
         # Insert old lead
-        lead1 = Lead(
-            place_id="test_place_123",
-            cid="12345",
+        lead1 = lead_factory(
             name="Old Name",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
             score=50,
             reasons="old_reason",
             first_seen=old_time,
             last_seen=old_time,
         )
-        with test_database._connect() as conn:
-            conn.execute("""
-                INSERT INTO leads (
-                    place_id, cid, name, website, address, phone,
-                    city, category, score, reasons, first_seen, last_seen
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                lead1.place_id, lead1.cid, lead1.name, lead1.website,
-                lead1.address, lead1.phone, lead1.city, lead1.category,
-                lead1.score, lead1.reasons, lead1.first_seen, lead1.last_seen,
-            ))
+        _insert_raw_leads(test_database, [lead1])
 
         # Upsert with new data
-        lead2 = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="New Name",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead2 = lead_factory(name="New Name")
         is_new = test_database.upsert_lead(lead2)
 
         assert is_new is True
@@ -308,38 +336,21 @@ class TestLeadUpsert:
             assert row["name"] == "New Name"
             assert row["score"] == 75
 
-    def test_does_not_update_within_window(self, test_database, database_config):
+    def test_does_not_update_within_window(self, test_database, lead_factory, now):
         """Should not update lead if last_seen is within dedupe window."""
-        recent_time = datetime.utcnow() - timedelta(days=1)
+        recent_time = now - timedelta(days=1)
 
         # Insert recent lead directly
-        with test_database._connect() as conn:
-            conn.execute("""
-                INSERT INTO leads (
-                    place_id, cid, name, website, address, phone,
-                    city, category, score, reasons, first_seen, last_seen
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                "test_place_123", "12345", "Original Name", "https://test.com",
-                "123 Test St", "555-1234", "Test City, TX", "plumber",
-                50, "original_reason", recent_time, recent_time,
-            ))
+        _insert_raw_leads(test_database, [lead_factory(
+            name="Original Name",
+            score=50,
+            reasons="original_reason",
+            first_seen=recent_time,
+            last_seen=recent_time,
+        )])
 
         # Try to upsert - should not update
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="New Name",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="new_reason",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead = lead_factory(name="New Name", reasons="new_reason")
         is_new = test_database.upsert_lead(lead)
 
         assert is_new is False
@@ -353,37 +364,28 @@ class TestLeadUpsert:
             assert row["name"] == "Original Name"
             assert row["score"] == 50
 
-    def test_rejects_new_place_with_recent_duplicate_website(self, test_database):
+    def test_rejects_new_place_with_recent_duplicate_website(self, test_database, lead_factory):
         """Should reject new place_id when website matches a recent lead."""
-        existing = Lead(
+        existing = lead_factory(
             place_id="place_a",
             cid="111",
             name="Original Business",
             website="https://duplicate.com",
             address="1 Main St",
             phone="555-0001",
-            city="Test City, TX",
-            category="plumber",
             score=70,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
         )
         assert test_database.upsert_lead(existing) is True
 
-        duplicate_site = Lead(
+        duplicate_site = lead_factory(
             place_id="place_b",
             cid="222",
             name="Different Place ID",
             website="https://duplicate.com",
             address="2 Main St",
             phone="555-0002",
-            city="Test City, TX",
-            category="plumber",
             score=80,
             reasons="ssl_error",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
         )
         assert test_database.upsert_lead(duplicate_site) is False
 
@@ -392,47 +394,125 @@ class TestLeadUpsert:
             assert count == 1
 
 
-class TestDuplicateDetection:
-    """Tests for duplicate detection."""
+class TestLeadBatchUpsert:
+    """Tests for batched lead upserts."""
 
-    def test_detects_duplicate_by_place_id(self, test_database):
-        """Should detect duplicate by place_id."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
+    def _lead(self, place_id: str, website: str) -> Lead:
+        now = datetime.utcnow()
+        return Lead(
+            place_id=place_id,
+            cid=None,
+            name=f"Business {place_id}",
+            website=website,
+            address=None,
+            phone=None,
             city="Test City, TX",
             category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
+            score=60,
+            reasons=["no_https"],
+            first_seen=now,
+            last_seen=now,
         )
+
+    def test_inserts_batch_and_flags_new(self, test_database):
+        leads = [self._lead("batch_1", "https://one.com"), self._lead("batch_2", "https://two.com")]
+
+        assert test_database.upsert_leads(leads) == [True, True]
+
+        with test_database._connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+            assert count == 2
+
+    def test_matches_sequential_dedupe_semantics(self, test_database):
+        """Repeats within the batch and against the DB are flagged as duplicates."""
+        assert test_database.upsert_lead(self._lead("existing", "https://existing.com")) is True
+
+        flags = test_database.upsert_leads([
+            self._lead("existing", "https://existing.com"),
+            self._lead("fresh", "https://shared.com"),
+            self._lead("fresh", "https://shared.com"),
+            self._lead("other", "https://shared.com"),
+            self._lead("no_site", None),
+        ])
+
+        assert flags == [False, True, False, False, True]
+        with test_database._connect() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM leads").fetchone()[0]
+            assert count == 3
+
+    def test_empty_batch(self, test_database):
+        assert test_database.upsert_leads([]) == []
+
+
+class TestTransaction:
+    """Tests for Database.transaction()."""
+
+    def _count_from_other_connection(self, db_path, table: str) -> int:
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_commits_once_on_exit(self, test_database, test_db_path):
+        with test_database.transaction() as db:
+            db.record_audit("p1", "https://example.com/audit/p1", "/tmp/p1.html", "[]")
+            db.record_contact("p1", "owner@example.com", "mailto", 0.9)
+            with db.transaction():
+                db.add_unsubscribe("p2", "gone@example.com")
+            # Nothing is visible to other connections until the outer block exits.
+            assert self._count_from_other_connection(test_db_path, "audits") == 0
+            assert db.get_contact("p1")["email"] == "owner@example.com"
+
+        assert self._count_from_other_connection(test_db_path, "audits") == 1
+        assert self._count_from_other_connection(test_db_path, "unsubscribes") == 1
+
+    def test_rolls_back_when_block_raises(self, test_database):
+        with pytest.raises(RuntimeError):
+            with test_database.transaction() as db:
+                db.record_contact("p1", "owner@example.com", "mailto", 0.9)
+                raise RuntimeError("boom")
+
+        assert test_database.get_contact("p1") is None
+        test_database.record_contact("p2", "next@example.com", "mailto", 0.9)
+        assert test_database.get_contact("p2") is not None
+
+
+    def test_interrupt_rolls_back_and_resets_depth(self, test_database):
+        with pytest.raises(KeyboardInterrupt):
+            with test_database.transaction() as db:
+                db.record_contact("p1", "owner@example.com", "mailto", 0.9)
+                raise KeyboardInterrupt
+
+        assert test_database._tx_depth == 0
+        assert test_database.get_contact("p1") is None
+
+    def test_upserts_inside_transaction(self, test_database, lead_factory, test_db_path):
+        with test_database.transaction() as db:
+            assert db.upsert_lead(lead_factory(place_id="p1", website="https://a.example"))
+            db.record_contact("p1", "owner@example.com", "mailto", 0.9)
+            assert db.upsert_leads([
+                lead_factory(place_id="p2", website="https://b.example"),
+            ]) == [True]
+            assert self._count_from_other_connection(test_db_path, "leads") == 0
+
+        assert self._count_from_other_connection(test_db_path, "leads") == 2
+
+class TestDuplicateDetection:
+    """Tests for duplicate detection."""
+
+    def test_detects_duplicate_by_place_id(self, test_database, lead_factory):
+        """Should detect duplicate by place_id."""
+        lead = lead_factory()
         test_database.upsert_lead(lead)
 
         is_dup = test_database.is_duplicate("test_place_123")
 
         assert is_dup is True
 
-    def test_detects_duplicate_by_website(self, test_database):
+    def test_detects_duplicate_by_website(self, test_database, lead_factory):
         """Should detect duplicate by website as fallback."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead = lead_factory()
         test_database.upsert_lead(lead)
 
         # Check with different place_id but same website
@@ -446,22 +526,18 @@ class TestDuplicateDetection:
 
         assert is_dup is False
 
-    def test_no_duplicate_outside_window(self, test_database, database_config):
+    def test_no_duplicate_outside_window(self, test_database, lead_factory, old_time):
         """Should not detect duplicate outside dedupe window."""
-        old_time = datetime.utcnow() - timedelta(days=database_config.dedupe_window_days + 1)
-
         # Insert old lead directly
-        with test_database._connect() as conn:
-            conn.execute("""
-                INSERT INTO leads (
-                    place_id, cid, name, website, address, phone,
-                    city, category, score, reasons, first_seen, last_seen
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                "old_place_123", "12345", "Old Business", "https://old.com",
-                "123 Test St", "555-1234", "Test City, TX", "plumber",
-                50, "old_reason", old_time, old_time,
-            ))
+        _insert_raw_leads(test_database, [lead_factory(
+            place_id="old_place_123",
+            name="Old Business",
+            website="https://old.com",
+            score=50,
+            reasons="old_reason",
+            first_seen=old_time,
+            last_seen=old_time,
+        )])
 
         is_dup = test_database.is_duplicate("old_place_123")
         assert is_dup is False
@@ -470,8 +546,8 @@ class TestDuplicateDetection:
 class TestExclusivityFiltering:
     """Tests for exclusive lead window filtering."""
 
-    def test_exclusive_lead_hidden_from_basic(self, test_database):
-        lead = Lead(
+    def test_exclusive_lead_hidden_from_basic(self, test_database, lead_factory, now):
+        lead = lead_factory(
             place_id="exclusive_place",
             cid="c1",
             name="Exclusive Biz",
@@ -479,13 +555,8 @@ class TestExclusivityFiltering:
             address="1 Exclusive Way",
             phone="555-0000",
             review_count=25,
-            city="Test City, TX",
-            category="plumber",
             score=80,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-            exclusive_until=datetime.utcnow() + timedelta(days=7),
+            exclusive_until=now + timedelta(days=7),
             exclusive_tier="pro",
             lead_tier="hot",
         )
@@ -501,89 +572,25 @@ class TestExclusivityFiltering:
 class TestExportTracking:
     """Tests for export tracking."""
 
-    def test_gets_unexported_leads(self, test_database):
-        """Should return leads that haven't been exported."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
-        test_database.upsert_lead(lead)
-
-        leads = test_database.get_unexported_leads(min_score=40)
-
-        assert len(leads) == 1
-        assert leads[0]["place_id"] == "test_place_123"
-
-    def test_excludes_low_score_leads(self, test_database):
-        """Should exclude leads below min_score."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=30,  # Below threshold
-            reasons="minor_issue",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
-        test_database.upsert_lead(lead)
+    @pytest.mark.parametrize(
+        "overrides, expected_ids",
+        [
+            pytest.param({}, ["test_place_123"], id="unexported"),
+            pytest.param({"score": 30, "reasons": "minor_issue"}, [], id="below_min_score"),
+            pytest.param({"website": None, "reasons": "no_website"}, [], id="no_website"),
+        ],
+    )
+    def test_unexported_leads_filter(self, test_database, lead_factory, overrides, expected_ids):
+        """Should return unexported leads, skipping low scores and missing websites."""
+        test_database.upsert_lead(lead_factory(**overrides))
 
         leads = test_database.get_unexported_leads(min_score=40)
 
-        assert len(leads) == 0
-
-    def test_excludes_leads_without_website(self, test_database):
-        """Should exclude leads without a website."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website=None,  # No website
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="no_website",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
-        test_database.upsert_lead(lead)
-
-        leads = test_database.get_unexported_leads(min_score=40)
+        assert [lead["place_id"] for lead in leads] == expected_ids
 
-        assert len(leads) == 0
-
-    def test_marks_leads_exported(self, test_database):
+    def test_marks_leads_exported(self, test_database, lead_factory):
         """Should mark leads as exported."""
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead = lead_factory()
         test_database.upsert_lead(lead)
 
         test_database.mark_exported(["test_place_123"])
@@ -601,6 +608,26 @@ class TestExportTracking:
             assert row["exported_count"] == 1
 
 
+    def test_records_exports_in_batch(self, test_database):
+        """Should insert one export row per subscriber record."""
+        test_database.record_exports(
+            "run_1",
+            [("a@example.com", 10, "/tmp/a.csv"), ("b@example.com", 10, "/tmp/b.csv")],
+            tier="pro",
+            export_type="cold",
+        )
+        test_database.record_exports("run_1", [])
+
+        with test_database._connect() as conn:
+            rows = conn.execute(
+                "SELECT subscriber_email, lead_count, tier, export_type FROM exports ORDER BY id"
+            ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ("a@example.com", 10, "pro", "cold"),
+            ("b@example.com", 10, "pro", "cold"),
+        ]
+
+
 class TestRunTracking:
     """Tests for run tracking."""
 
@@ -653,23 +680,10 @@ class TestRunTracking:
 class TestStats:
     """Tests for statistics."""
 
-    def test_returns_stats(self, test_database):
+    def test_returns_stats(self, test_database, lead_factory):
         """Should return database statistics."""
         # Add some data
-        lead = Lead(
-            place_id="test_place_123",
-            cid="12345",
-            name="Test Business",
-            website="https://test.com",
-            address="123 Test St",
-            phone="555-1234",
-            city="Test City, TX",
-            category="plumber",
-            score=75,
-            reasons="parked_domain",
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
-        )
+        lead = lead_factory()
         test_database.upsert_lead(lead)
         test_database.start_run("run_001")
         test_database.complete_run("run_001", {})
@@ -685,9 +699,8 @@ class TestStats:
 class TestOutreachReadiness:
     """Tests for outreach lead filtering."""
 
-    def test_filters_by_configured_min_confidence(self, test_database):
-        now = datetime.utcnow()
-        lead = Lead(
+    def test_filters_by_configured_min_confidence(self, test_database, lead_factory, now):
+        lead = lead_factory(
             place_id="outreach_place",
             cid="cid-1",
             name="Outreach Biz",
@@ -695,7 +708,6 @@ class TestOutreachReadiness:
             address="123 Main",
             phone="555-0100",
             city="Austin, TX",
-            category="plumber",
             score=80,
             reasons="ssl_error",
             first_seen=now,
@@ -0,0 +1,123 @@
+"""
+Tests for the warm-lead database extension: audit, contact, outreach,
+engagement and unsubscribe tables and their Database methods.
+"""
+
+import sqlite3
+
+from src.config import DatabaseConfig
+from src.db import Database
+
+EXPECTED_TABLES = [
+    "audits",
+    "contacts",
+    "outreach",
+    "engagement_events",
+    "unsubscribes",
+    "suppression",
+    "lead_inquiries",
+]
+EXPECTED_INDEXES = [
+    "idx_outreach_place_id",
+    "idx_engagement_type",
+    "idx_engagement_place_type",
+]
+
+
+class TestDatabaseExtension:
+    """Tests for the extension tables and methods."""
+
+    def test_creates_tables_and_indexes(self, test_database):
+        with test_database._connect() as conn:
+            present = {
+                (row["type"], row["name"])
+                for row in conn.execute(
+                    "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')"
+                ).fetchall()
+            }
+
+        assert {("table", t) for t in EXPECTED_TABLES} <= present
+        assert {("index", i) for i in EXPECTED_INDEXES} <= present
+        # Redundant with the (place_id, event_type) index; dropped on startup.
+        assert ("index", "idx_engagement_place_id") not in present
+
+    def test_drops_legacy_place_id_index(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE engagement_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, place_id TEXT, event_type TEXT,
+                ip_address TEXT, user_agent TEXT, timestamp TIMESTAMP
+            );
+            CREATE INDEX idx_engagement_place_id ON engagement_events(place_id);
+        """)
+        conn.close()
+
+        db = Database(DatabaseConfig(db_path=db_path))
+        try:
+            with db._connect() as conn:
+                names = {
+                    row["name"]
+                    for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+                }
+        finally:
+            db.close()
+
+        assert "idx_engagement_place_id" not in names
+        assert "idx_engagement_place_type" in names
+
+    def test_audit_methods(self, test_database):
+        test_database.record_audit(
+            "test_place_1", "https://example.com/audit/1", "/path/to/audit.html", '{"issues": []}'
+        )
+
+        assert test_database.get_audit_url("test_place_1") == "https://example.com/audit/1"
+        assert isinstance(test_database.get_leads_without_audits(min_score=40), list)
+
+    def test_contact_methods(self, test_database):
+        test_database.record_contact("test_place_1", "test@example.com", "json-ld", 0.95)
+
+        contact = test_database.get_contact("test_place_1")
+        assert contact is not None
+        assert contact["email"] == "test@example.com"
+        assert isinstance(test_database.get_leads_without_contacts(), list)
+
+    def test_outreach_methods(self, test_database):
+        test_database.record_outreach(
+            "test_place_1", "test@example.com", "https://example.com/audit/1", True
+        )
+
+        assert test_database.has_been_contacted("test_place_1") is True
+        assert isinstance(test_database.get_leads_ready_for_outreach(min_score=40), list)
+
+    def test_engagement_methods(self, test_database):
+        test_database.record_event("test_place_1", "page_view", "127.0.0.1", "Mozilla/5.0")
+
+        assert len(test_database.get_events_for_lead("test_place_1")) > 0
+        assert test_database.get_engagement_score("test_place_1") == 25
+
+    def test_bulk_events_score_like_single_inserts(self, test_database, now):
+        events = [
+            ("test_place_3", "page_view", "127.0.0.1", "Mozilla/5.0", now),
+            ("test_place_3", "cta_click", "127.0.0.1", "Mozilla/5.0", now),
+            ("test_place_3", "email_opened", "127.0.0.2", None, now),
+        ]
+
+        assert test_database.record_events_bulk(events) == 3
+        assert test_database.record_events_bulk([]) == 0
+        assert len(test_database.get_events_for_lead("test_place_3")) == 3
+
+        for _, event_type, ip, ua, _ in events:
+            test_database.record_event("test_place_4", event_type, ip, ua)
+        assert test_database.get_engagement_score("test_place_3") == 80
+        assert test_database.get_engagement_score("test_place_4") == 80
+
+    def test_unsubscribe_overrides_engagement(self, test_database):
+        test_database.add_unsubscribe("test_place_2", "unsubscribe@example.com")
+        test_database.record_event("test_place_2", "page_view", "127.0.0.1", "Mozilla/5.0")
+
+        assert test_database.is_unsubscribed("test_place_2") is True
+        assert test_database.get_engagement_score("test_place_2") == -100
+
+    def test_warm_leads_query(self, test_database):
+        assert isinstance(test_database.get_warm_leads(min_engagement_score=25), list)
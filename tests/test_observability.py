@@ -1,9 +1,14 @@
 import logging
 import time
 from datetime import datetime
+from unittest.mock import patch
 
+from src.config import load_config
 from src.db import Lead
 from src.logging_setup import RunContext
+from src.maps_scraper import Business
+from src.run_weekly import GracefulShutdown, persist_lead_batch, score_business
+from src.scoring import BufferedScoringCache, ScoringResult, evaluate_with_isolation
 
 
 def test_run_context_tracks_phase_duration_and_reason_histogram():
@@ -98,3 +103,106 @@ def test_top_yield_city_category_report_ranks_quality_first(test_database):
     assert combos[0]["city"] == "Austin, TX"
     assert combos[0]["category"] == "plumber"
     assert combos[0]["quality_lead_count"] == 2
+
+
+def test_score_business_reuses_site_result_within_run():
+    config = load_config()
+    run_ctx = RunContext(logging.getLogger("test_obs"))
+    result = ScoringResult(
+        url="https://chain.example.com",
+        score=60,
+        reasons=["missing_viewport"],
+        http_status=200,
+        response_time_ms=100,
+        final_url="https://chain.example.com",
+        error=None,
+    )
+    businesses = [
+        Business(
+            place_id=f"p{i}",
+            cid=None,
+            name=f"Chain {i}",
+            website=website,
+            address=None,
+            phone="555-0100",
+            review_count=3,
+            city="Austin, TX",
+            category=category,
+        )
+        for i, (website, category) in enumerate([
+            ("https://chain.example.com", "plumber"),
+            ("https://www.chain.example.com/", "electrician"),
+        ])
+    ]
+    site_results = {}
+
+    with patch("src.scoring.evaluate_with_isolation", return_value=result) as mock_eval:
+        leads = [
+            score_business(b, None, config, run_ctx, site_results) for b in businesses
+        ]
+
+    assert mock_eval.call_count == 1
+    assert [lead.score for lead in leads] == [60, 60]
+    assert all(lead.first_seen == lead.last_seen for lead in leads)
+    assert leads[1].website == "https://www.chain.example.com/"
+    assert run_ctx.stats["websites_checked"] == 1
+    assert run_ctx.stats["urls_deduped"] == 1
+
+
+def test_graceful_shutdown_stops_new_scoring(monkeypatch):
+    monkeypatch.setattr("src.run_weekly.signal.signal", lambda *args: None)
+    shutdown = GracefulShutdown()
+    assert shutdown.check() is False
+    assert shutdown.wait(0) is False
+
+    shutdown._handler(15, None)
+
+    assert shutdown.check() is True
+    assert shutdown.wait(5) is True
+    business = Business(
+        place_id="p1",
+        cid=None,
+        name="Late",
+        website="https://late.example.com",
+        address=None,
+        phone=None,
+        review_count=None,
+        city="Austin, TX",
+        category="plumber",
+    )
+    run_ctx = RunContext(logging.getLogger("test_obs"))
+    with patch("src.scoring.evaluate_with_isolation") as mock_eval:
+        lead = score_business(business, None, load_config(), run_ctx, shutdown=shutdown)
+    assert lead is None
+    mock_eval.assert_not_called()
+
+
+def test_scoring_cache_writes_flush_with_the_lead_batch(test_database, lead_factory, scoring_config):
+    config = load_config()
+    run_ctx = RunContext(logging.getLogger("test_obs"))
+    score_cache = BufferedScoringCache(test_database)
+    result = ScoringResult(
+        url="https://biz.example.com",
+        score=55,
+        reasons=["no_viewport"],
+        http_status=200,
+        response_time_ms=80,
+        final_url="https://biz.example.com/",
+        error=None,
+    )
+
+    with patch("src.scoring.evaluate_website", return_value=result):
+        evaluate_with_isolation("https://biz.example.com", config=scoring_config, cache=score_cache)
+    # Buffered, not yet written.
+    assert test_database.get_cached_score("https://biz.example.com", 30) is None
+
+    leads = persist_lead_batch(
+        [lead_factory(place_id="p1", website="https://biz.example.com")],
+        test_database, config, run_ctx, score_cache=score_cache,
+    )
+
+    assert [lead.place_id for lead in leads] == ["p1"]
+    cached = test_database.get_cached_score("https://biz.example.com", 30)
+    assert cached["score"] == 55
+    assert cached["reasons"] == ["no_viewport"]
+    assert score_cache.drain() == []
@@ -4,7 +4,6 @@ Tests for owner/decision-maker name extraction from website HTML.
 
 import pytest
 from unittest.mock import Mock, patch
-from bs4 import BeautifulSoup
 
 from src.contact_finder import (
     _extract_owner_from_jsonld,
@@ -106,49 +105,49 @@ _JSONLD_NO_PERSON = """<script type="application/ld+json">
 class TestJsonldOwnerExtraction:
     """Tests for _extract_owner_from_jsonld()."""
 
-    def test_extracts_person_type(self):
-        soup = BeautifulSoup(_JSONLD_PERSON, "html.parser")
+    def test_extracts_person_type(self, make_soup):
+        soup = make_soup(_JSONLD_PERSON)
         result = _extract_owner_from_jsonld(soup)
         assert result is not None
         assert result[0] == "Jane Doe"
         assert result[1] == 0.90
 
-    def test_extracts_org_founder_object(self):
-        soup = BeautifulSoup(_JSONLD_ORG_FOUNDER, "html.parser")
+    def test_extracts_org_founder_object(self, make_soup):
+        soup = make_soup(_JSONLD_ORG_FOUNDER)
         result = _extract_owner_from_jsonld(soup)
         assert result is not None
         assert result[0] == "Bob Roberts"
         assert result[1] == 0.90
 
-    def test_extracts_org_founder_string(self):
-        soup = BeautifulSoup(_JSONLD_ORG_FOUNDER_STRING, "html.parser")
+    def test_extracts_org_founder_string(self, make_soup):
+        soup = make_soup(_JSONLD_ORG_FOUNDER_STRING)
         result = _extract_owner_from_jsonld(soup)
         assert result is not None
         assert result[0] == "Alice Anderson"
         assert result[1] == 0.85
 
-    def test_extracts_org_author(self):
-        soup = BeautifulSoup(_JSONLD_ORG_AUTHOR, "html.parser")
+    def test_extracts_org_author(self, make_soup):
+        soup = make_soup(_JSONLD_ORG_AUTHOR)
         result = _extract_owner_from_jsonld(soup)
         assert result is not None
         assert result[0] == "Charlie Chen"
         assert result[1] == 0.80
 
-    def test_no_person_returns_none(self):
-        soup = BeautifulSoup(_JSONLD_NO_PERSON, "html.parser")
+    def test_no_person_returns_none(self, make_soup):
+        soup = make_soup(_JSONLD_NO_PERSON)
         result = _extract_owner_from_jsonld(soup)
         assert result is None
 
-    def test_multiple_scripts_returns_first_match(self):
+    def test_multiple_scripts_returns_first_match(self, make_soup):
         html = _JSONLD_NO_PERSON + _JSONLD_PERSON
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         result = _extract_owner_from_jsonld(soup)
         assert result is not None
         assert result[0] == "Jane Doe"
 
-    def test_invalid_json_handled_gracefully(self):
+    def test_invalid_json_handled_gracefully(self, make_soup):
         html = '<script type="application/ld+json">{invalid json}</script>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         result = _extract_owner_from_jsonld(soup)
         assert result is None
 
@@ -191,54 +190,54 @@ _HTML_ABOUT_OWNER = """<html><body>
 class TestPatternOwnerExtraction:
     """Tests for _extract_owner_from_patterns()."""
 
-    def test_extracts_owner_labeled(self):
-        soup = BeautifulSoup(_HTML_OWNER_LABEL, "html.parser")
+    def test_extracts_owner_labeled(self, make_soup):
+        soup = make_soup(_HTML_OWNER_LABEL)
         result = _extract_owner_from_patterns(_HTML_OWNER_LABEL, soup)
         assert result is not None
         assert result[0] == "John Smith"
         assert result[1] >= 0.80
 
-    def test_extracts_founder_labeled(self):
-        soup = BeautifulSoup(_HTML_FOUNDER_LABEL, "html.parser")
+    def test_extracts_founder_labeled(self, make_soup):
+        soup = make_soup(_HTML_FOUNDER_LABEL)
         result = _extract_owner_from_patterns(_HTML_FOUNDER_LABEL, soup)
         assert result is not None
         assert result[0] == "Mary Johnson"
 
-    def test_extracts_ceo_labeled(self):
-        soup = BeautifulSoup(_HTML_CEO_LABEL, "html.parser")
+    def test_extracts_ceo_labeled(self, make_soup):
+        soup = make_soup(_HTML_CEO_LABEL)
         result = _extract_owner_from_patterns(_HTML_CEO_LABEL, soup)
         assert result is not None
         assert result[0] == "Robert Williams"
 
-    def test_extracts_meet_the_owner(self):
-        soup = BeautifulSoup(_HTML_MEET_OWNER, "html.parser")
+    def test_extracts_meet_the_owner(self, make_soup):
+        soup = make_soup(_HTML_MEET_OWNER)
         result = _extract_owner_from_patterns(_HTML_MEET_OWNER, soup)
         assert result is not None
         assert result[0] == "Sarah Davis"
 
-    def test_extracts_name_comma_role(self):
-        soup = BeautifulSoup(_HTML_NAME_ROLE, "html.parser")
+    def test_extracts_name_comma_role(self, make_soup):
+        soup = make_soup(_HTML_NAME_ROLE)
         result = _extract_owner_from_patterns(_HTML_NAME_ROLE, soup)
         assert result is not None
         assert result[0] == "Tom Brown"
 
-    def test_extracts_author_meta(self):
-        soup = BeautifulSoup(_HTML_AUTHOR_META, "html.parser")
+    def test_extracts_author_meta(self, make_soup):
+        soup = make_soup(_HTML_AUTHOR_META)
         result = _extract_owner_from_patterns(_HTML_AUTHOR_META, soup)
         assert result is not None
         assert result[0] == "David Wilson"
         assert result[1] == 0.60
 
-    def test_no_owner_in_plain_page(self):
+    def test_no_owner_in_plain_page(self, make_soup):
         html = "<html><body><p>Welcome to our business.</p></body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         result = _extract_owner_from_patterns(html, soup)
         assert result is None
 
-    def test_filters_false_positive_names(self):
+    def test_filters_false_positive_names(self, make_soup):
         """A role label followed by a non-name phrase should be filtered."""
         html = "<html><body><p>Owner: Contact Us for more information.</p></body></html>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         result = _extract_owner_from_patterns(html, soup)
         assert result is None
 
@@ -250,48 +249,48 @@ class TestPatternOwnerExtraction:
 class TestFindAboutPage:
     """Tests for _find_about_page_url()."""
 
-    def test_finds_about_page(self):
+    def test_finds_about_page(self, make_soup):
         html = """<html><body>
         <a href="/about">About</a>
         <a href="/contact">Contact</a>
         </body></html>"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/about"
 
-    def test_finds_about_us(self):
+    def test_finds_about_us(self, make_soup):
         html = '<a href="/about-us">About Us</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/about-us"
 
-    def test_finds_team_page(self):
+    def test_finds_team_page(self, make_soup):
         html = '<a href="/our-team">Our Team</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/our-team"
 
-    def test_finds_meet_the_team(self):
+    def test_finds_meet_the_team(self, make_soup):
         html = '<a href="/meet-the-team">Meet the Team</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/meet-the-team"
 
-    def test_finds_leadership_page(self):
+    def test_finds_leadership_page(self, make_soup):
         html = '<a href="/leadership">Leadership</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/leadership"
 
-    def test_finds_founder_page(self):
+    def test_finds_founder_page(self, make_soup):
         html = '<a href="/founder">Founder</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url == "https://example.com/founder"
 
-    def test_no_about_page_returns_none(self):
+    def test_no_about_page_returns_none(self, make_soup):
         html = '<a href="/services">Services</a><a href="/contact">Contact</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_about_page_url(soup, "https://example.com")
         assert url is None
 
@@ -362,9 +361,9 @@ class TestFindOwnerName:
         result = find_owner_name("https://example.com")
         assert result is None
 
-    def test_works_with_preexisting_soup(self):
+    def test_works_with_preexisting_soup(self, make_soup):
         """When soup is provided, no HTTP request is made."""
-        soup = BeautifulSoup(_JSONLD_PERSON, "html.parser")
+        soup = make_soup(_JSONLD_PERSON)
         result = find_owner_name(
             "https://example.com", soup=soup
         )
@@ -429,3 +428,22 @@ class TestContactInfoIncludesOwner:
         assert result is not None
         assert result.email == "hello@biz.com"
         assert result.owner_name is None
+
+    @patch("src.contact_finder.requests.Session.get")
+    def test_about_page_fetched_once_for_owner_and_email(self, mock_get):
+        homepage = Mock()
+        homepage.text = '<html><body><a href="/about">About Us</a></body></html>'
+        homepage.raise_for_status = Mock()
+
+        about_page = Mock()
+        about_page.text = "<p>Owner: Michael Brown. Reach us at mike@brownplumbing.com</p>"
+        about_page.raise_for_status = Mock()
+
+        mock_get.side_effect = [homepage, about_page]
+
+        result = find_contact_email("https://brownplumbing.com")
+        assert result is not None
+        assert result.email == "mike@brownplumbing.com"
+        assert result.source == "contact_page"
+        assert result.owner_name == "Michael Brown"
+        assert mock_get.call_count == 2
@@ -216,6 +216,11 @@ class TestExpandedGenericTitlePatterns:
         assert not _is_generic_title("Joe's Heating & Cooling - HVAC Services")
         assert not _is_generic_title("Denver Family Dentistry | Dr. Smith")
 
+    def test_punctuation_and_case_ignored(self):
+        assert _is_generic_title("  WELCOME! ")
+        assert _is_generic_title("Page Not Found...")
+        assert not _is_generic_title("Café Home")
+
     def test_none_not_generic(self):
         assert not _is_generic_title(None)
 
@@ -502,7 +507,7 @@ class TestBrokenImageIntegration:
     """Integration tests for broken image detection."""
 
     @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_broken_image_flagged(self, mock_head, mock_fetch, scoring_config):
         scoring_config.broken_image_check_enabled = True
         mock_head.return_value = Mock(status_code=404)
@@ -518,7 +523,7 @@ class TestBrokenImageIntegration:
         assert result.score >= scoring_config.weight_broken_image
 
     @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_working_images_not_flagged(self, mock_head, mock_fetch, scoring_config):
         scoring_config.broken_image_check_enabled = True
         mock_head.return_value = Mock(status_code=200)
@@ -533,7 +538,7 @@ class TestBrokenImageIntegration:
         assert not any("broken_image" in r for r in result.reasons)
 
     @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_broken_images_disabled_by_default(self, mock_head, mock_fetch, scoring_config):
         """Broken image check should be off by default (perf concern)."""
         assert not scoring_config.broken_image_check_enabled
@@ -556,7 +561,7 @@ class TestDeadSocialLinkIntegration:
     """Integration tests for dead social link detection."""
 
     @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_dead_facebook_link_flagged(self, mock_head, mock_fetch, scoring_config):
         scoring_config.dead_social_check_enabled = True
         mock_head.return_value = Mock(status_code=404)
@@ -575,7 +580,7 @@ class TestDeadSocialLinkIntegration:
         assert result.score >= scoring_config.weight_dead_social_link
 
     @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_dead_social_check_disabled_by_default(self, mock_head, mock_fetch, scoring_config):
         """Dead social check should be off by default (perf concern)."""
         assert not scoring_config.dead_social_check_enabled
@@ -843,15 +848,131 @@ class TestPlaywrightResourceManagement:
             "to ensure Playwright is properly cleaned up on every exit path."
         )
 
-    def test_fetch_with_playwright_uses_sync_playwright_context_manager(self):
-        """_fetch_with_playwright must also use context manager pattern."""
+    def test_playwright_fallback_worker_uses_sync_playwright_context_manager(self):
+        """The shared fallback browser thread must use the context manager pattern."""
         import inspect
         import src.scoring as scoring_module
 
-        source = inspect.getsource(scoring_module._fetch_with_playwright)
+        source = inspect.getsource(scoring_module._playwright_worker)
         assert "with sync_playwright()" in source, (
-            "_fetch_with_playwright must use `with sync_playwright()` context manager."
+            "_playwright_worker must use `with sync_playwright()` context manager."
         )
+        assert "browser.close()" in source, "shared browser must be closed on shutdown"
+
+    def test_fallback_browser_is_launched_once(self):
+        """Fallback fetches reuse one browser and open a context per URL."""
+        from unittest.mock import MagicMock
+        import src.scoring as scoring_module
+
+        playwright = MagicMock()
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        page = browser.new_context.return_value.new_page.return_value
+        page.goto.return_value.status = 200
+        page.url = "https://example.com/"
+        page.content.return_value = "<html><body>ok</body></html>"
+        manager = MagicMock()
+        manager.__enter__.return_value = playwright
+
+        config = ScoringConfig()
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            first, _ = scoring_module._fetch_with_playwright("https://example.com", config)
+            second, _ = scoring_module._fetch_with_playwright("https://example.org", config)
+            scoring_module._stop_playwright_worker()
+
+        assert first.status_code == 200 and second.status_code == 200
+        assert playwright.chromium.launch.call_count == 1
+        assert browser.new_context.call_count == 2
+        assert browser.new_context.return_value.close.call_count == 2
+        browser.close.assert_called_once()
+        assert not scoring_module._PW_WORKERS
+
+    def test_hung_fallback_times_out_and_replaces_worker(self, monkeypatch):
+        """A fetch stuck past its budget is abandoned; later fetches still run."""
+        import threading
+        from unittest.mock import MagicMock
+        import src.scoring as scoring_module
+
+        monkeypatch.setattr(scoring_module, "_PW_SLACK_SECONDS", 0.0)
+        monkeypatch.setattr(scoring_module, "_PW_POLL_SECONDS", 0.02)
+        release = threading.Event()
+        calls = []
+
+        def goto(url, **kwargs):
+            calls.append(url)
+            if url.endswith("hung.example"):
+                release.wait(5)
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        playwright = MagicMock()
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        page = browser.new_context.return_value.new_page.return_value
+        page.goto.side_effect = goto
+        page.url = "https://ok.example/"
+        page.content.return_value = "<html><body>ok</body></html>"
+        manager = MagicMock()
+        manager.__enter__.return_value = playwright
+
+        config = ScoringConfig(playwright_fallback_timeout_ms=100)
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            hung, error = scoring_module._fetch_with_playwright("https://hung.example", config)
+            ok, ok_error = scoring_module._fetch_with_playwright("https://ok.example", config)
+            release.set()
+            scoring_module._stop_playwright_worker()
+
+        assert hung is None and error.startswith("playwright_timeout:")
+        assert ok_error is None and ok.status_code == 200
+        assert playwright.chromium.launch.call_count == 2
+
+    def test_fallbacks_run_concurrently_on_separate_browsers(self):
+        """Two scoring threads falling back at once don't queue behind each other."""
+        import threading
+        from unittest.mock import MagicMock
+        import src.scoring as scoring_module
+
+        both_navigating = threading.Barrier(2, timeout=5)
+
+        def goto(url, **kwargs):
+            # Serialized fallbacks would leave this barrier waiting for a peer.
+            both_navigating.wait()
+            response = MagicMock()
+            response.status = 200
+            return response
+
+        playwright = MagicMock()
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        page = browser.new_context.return_value.new_page.return_value
+        page.goto.side_effect = goto
+        page.url = "https://example.com/"
+        page.content.return_value = "<html><body>ok</body></html>"
+        manager = MagicMock()
+        manager.__enter__.return_value = playwright
+
+        config = ScoringConfig(playwright_fallback_workers=2)
+        results = {}
+
+        def fallback(url):
+            results[url] = scoring_module._fetch_with_playwright(url, config)
+
+        with patch("playwright.sync_api.sync_playwright", return_value=manager):
+            threads = [
+                threading.Thread(target=fallback, args=(url,))
+                for url in ("https://a.example", "https://b.example")
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(10)
+            scoring_module._stop_playwright_worker()
+
+        assert all(error is None for _, error in results.values()), results
+        assert len(results) == 2
+        assert playwright.chromium.launch.call_count == 2
+        assert not scoring_module._PW_WORKERS
 
     def test_scraper_finally_closes_context_and_browser(self):
         """Finally block must close context and browser."""
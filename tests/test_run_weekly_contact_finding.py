@@ -0,0 +1,53 @@
+import logging
+from unittest.mock import Mock
+
+from src.config import load_config
+from src.contact_finder import ContactInfo
+from src.logging_setup import RunContext
+from src.run_weekly import run_contact_finding_phase
+
+
+def test_contact_finding_phase_records_concurrent_results(
+    test_database, lead_factory, monkeypatch
+):
+    import src.run_weekly as run_weekly_mod
+
+    for i in range(5):
+        test_database.upsert_lead(
+            lead_factory(place_id=f"place_{i}", website=f"https://biz{i}.example")
+        )
+
+    sessions = set()
+    parsers = set()
+
+    def fake_find(website, session=None, html_parser=None):
+        sessions.add(session)
+        parsers.add(html_parser)
+        if website.endswith("biz0.example"):
+            return None, "fetch failed"
+        host = website.split("//")[1]
+        return ContactInfo(
+            email=f"owner@{host}", source="mailto", confidence=0.9, owner_name="Pat"
+        ), None
+
+    monkeypatch.setattr(run_weekly_mod, "find_contact_with_isolation", fake_find)
+
+    cfg = load_config()
+    cfg.outreach.enabled = True
+    cfg.outreach.contact_workers = 3
+    cfg.outreach.contact_html_parser = "html.parser"
+    run_ctx = RunContext(logging.getLogger("test_contact_finding"))
+    shutdown = Mock(check=Mock(return_value=False))
+
+    found = run_contact_finding_phase(cfg, test_database, run_ctx, shutdown)
+
+    assert found == 4
+    # Every lookup shares one session whose pools are sized for the workers.
+    (session,) = sessions
+    adapter = session.get_adapter("https://biz1.example")
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_connections >= 3
+    assert parsers == {"html.parser"}
+    assert test_database.get_contact("place_0") is None
+    for i in range(1, 5):
+        assert test_database.get_contact(f"place_{i}")["email"] == f"owner@biz{i}.example"
@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from pathlib import Path
 
 from src.db import Lead
 from src.logging_setup import RunContext
@@ -43,13 +44,8 @@ def test_export_csv_phase_writes_csv_from_scraped_leads(tmp_path, monkeypatch):
     )
 
     assert len(paths) == 1
-    csv_path = tmp_path / csv_path_basename(paths[0])
+    csv_path = tmp_path / Path(paths[0]).name
     assert csv_path.exists()
     content = csv_path.read_text(encoding="utf-8")
     assert "Test Business" in content
 
-
-def csv_path_basename(path_str: str) -> str:
-    # Keep this test platform-agnostic.
-    return path_str.split("/")[-1]
-
@@ -2,14 +2,25 @@
 Tests for the website scoring module.
 """
 
+import dataclasses
+import io
+import socket
+import threading
+import time
+from collections import OrderedDict
+
 import pytest
+import requests
 from unittest.mock import Mock, patch
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from requests.structures import CaseInsensitiveDict
 
 from src.scoring import (
     ScoringResult,
+    SimpleResponse,
     _extract_copyright_year,
     _check_parked_domain,
+    _check_bot_protection,
     _check_diy_builder,
     _check_mobile_friendly,
     _check_outdated_tech,
@@ -17,30 +28,54 @@ from src.scoring import (
     _normalize_url,
     evaluate_website,
     evaluate_with_isolation,
+    evaluate_many,
     _detect_wordpress,
     _detect_ecommerce_platform,
     _count_render_blocking,
+    _read_capped_body,
+    _head_probe,
+    _response_text,
+    _get_session,
+    _connect_resolved,
+    _resolve_host,
+    _dns_resolves,
+    _status_penalty,
+    _extract_title,
+    _check_broken_images,
+    _parse_last_modified_years,
+    _analyze_page,
+    _analysis_window,
+    _has_email,
+    _EMAIL_RE,
 )
 from src.config import ScoringConfig
 
 
-class TestNormalizeUrl:
-    """Tests for URL normalization."""
+@pytest.fixture
+def scoring_config(base_scoring_config):
+    """Per-test scoring config with the Playwright fallback off for unit tests."""
+    return dataclasses.replace(base_scoring_config, playwright_fallback_enabled=False)
 
-    def test_adds_https_to_bare_domain(self):
-        assert _normalize_url("example.com") == "https://example.com"
 
-    def test_preserves_existing_https(self):
-        assert _normalize_url("https://example.com") == "https://example.com"
+@pytest.fixture
+def mock_fetch():
+    """Stub fetch_website; tests set return_value to a (response, error) pair."""
+    with patch("src.scoring.fetch_website") as mock:
+        yield mock
 
-    def test_preserves_existing_http(self):
-        assert _normalize_url("http://example.com") == "http://example.com"
 
-    def test_handles_empty_string(self):
-        assert _normalize_url("") == ""
+class TestNormalizeUrl:
+    """Tests for URL normalization."""
 
-    def test_handles_none(self):
-        assert _normalize_url(None) is None
+    @pytest.mark.parametrize("url,expected", [
+        ("example.com", "https://example.com"),
+        ("https://example.com", "https://example.com"),
+        ("http://example.com", "http://example.com"),
+        ("", ""),
+        (None, None),
+    ])
+    def test_normalize_url(self, url, expected):
+        assert _normalize_url(url) == expected
 
 
 class TestCopyrightYearExtraction:
@@ -68,6 +103,10 @@ class TestCopyrightYearExtraction:
         result = _extract_copyright_year(html)
         assert result in [2015, 2022]  # Implementation may vary
 
+    def test_mixed_patterns_return_latest_year(self):
+        html = "<footer>Copyright \u00a9 2016 Acme. (c) 2018. All rights reserved, 2019</footer>"
+        assert _extract_copyright_year(html) == 2019
+
     def test_returns_none_when_no_copyright(self):
         html = "<footer>Contact us at 555-1234</footer>"
         assert _extract_copyright_year(html) is None
@@ -85,6 +124,22 @@ class TestCopyrightYearExtraction:
         # The sample has 2018 in the footer
         assert _extract_copyright_year(sample_html_outdated) == 2018
 
+    def test_footer_year_wins_over_body_year(self):
+        html = "<p>Copyright 2023 news</p>" + "<p>filler</p>" * 2000 + "<footer>\u00a9 2016</footer>"
+        assert _extract_copyright_year(html) == 2016
+
+    def test_footer_year_wins_within_short_page(self):
+        html = "<p>Copyright 2023 news</p><footer>\u00a9 2016 Acme</footer>"
+        assert _extract_copyright_year(html) == 2016
+
+    def test_falls_back_to_tail_when_footer_has_no_year(self):
+        html = "<div>COPYRIGHT 2017 Acme</div><footer>Contact us</footer>"
+        assert _extract_copyright_year(html) == 2017
+
+    def test_falls_back_to_full_page(self):
+        html = "<p>Copyright 2015 Company</p>" + "<p>filler</p>" * 2000
+        assert _extract_copyright_year(html) == 2015
+
 
 class TestParkedDomainDetection:
     """Tests for parked domain detection."""
@@ -103,12 +158,51 @@ class TestParkedDomainDetection:
     def test_does_not_flag_normal_business(self, sample_html_modern):
         assert _check_parked_domain(sample_html_modern) is False
 
+    def test_uses_precomputed_lowercase(self):
+        html = "<h1>Buy This Domain</h1>"
+        assert _check_parked_domain(html, html.lower()) is True
+
     def test_detects_coming_soon_as_under_construction(self):
         html = "<h1>Website Coming Soon</h1><p>Under construction</p>"
         from src.scoring import _detect_under_construction
         assert _detect_under_construction(html) is True
 
 
+class TestBotProtectionDetection:
+    """Tests for bot protection detection."""
+
+    def test_single_indicator_with_block_status(self):
+        assert _check_bot_protection("<p>Checking your browser...</p>", 503) is True
+
+    def test_single_indicator_with_ok_status(self):
+        assert _check_bot_protection("<p>Powered by Cloudflare</p>", 200) is False
+
+    def test_two_indicators_with_ok_status(self):
+        html = "<p>Attention Required! | Cloudflare</p>"
+        assert _check_bot_protection(html, 200) is True
+
+    def test_no_indicators(self):
+        assert _check_bot_protection("<p>Welcome</p>", 403) is False
+
+
+class TestMinimalPatterns:
+    """Tests for pruning redundant any()-style indicators."""
+
+    def test_drops_patterns_containing_shorter_ones(self):
+        from src.scoring import _minimal_patterns
+        patterns = ["coming soon", "website coming soon", "stay tuned", "coming"]
+        assert _minimal_patterns(patterns) == ("stay tuned", "coming")
+
+    def test_pruned_lists_detect_every_original_pattern(self):
+        from src.scoring import (
+            PARKED_INDICATORS, UNDER_CONSTRUCTION_PATTERNS, _detect_under_construction,
+        )
+        for pattern in PARKED_INDICATORS:
+            assert _check_parked_domain(f"<p>{pattern}</p>") is True
+        for pattern in UNDER_CONSTRUCTION_PATTERNS:
+            assert _detect_under_construction(f"<p>{pattern}</p>") is True
+
+
 class TestDIYBuilderDetection:
     """Tests for DIY website builder detection."""
 
@@ -134,6 +228,11 @@ class TestDIYBuilderDetection:
         result = _check_diy_builder(sample_html_modern, "https://example.com")
         assert result is None
 
+    def test_url_match_takes_precedence_over_html(self):
+        html = "<a href='https://www.wix.com'>Made with Wix</a>"
+        result = _check_diy_builder(html, "https://Studio.Webflow.io/")
+        assert result == "webflow"
+
 
 class TestMobileFriendliness:
     """Tests for mobile-friendliness detection."""
@@ -176,25 +275,14 @@ class TestOutdatedTech:
         outdated = _check_outdated_tech(sample_html_flash)
         assert "flash" in outdated
 
-    def test_detects_frames(self):
-        html = "<frameset><frame src='nav.html'><frame src='content.html'></frameset>"
-        outdated = _check_outdated_tech(html)
-        assert "frames" in outdated
-
-    def test_detects_marquee(self):
-        html = "<marquee>Scrolling text!</marquee>"
-        outdated = _check_outdated_tech(html)
-        assert "marquee" in outdated
-
-    def test_detects_blink(self):
-        html = "<blink>Blinking text!</blink>"
-        outdated = _check_outdated_tech(html)
-        assert "blink_tag" in outdated
-
-    def test_detects_old_jquery(self):
-        html = '<script src="jquery-1.12.4.min.js"></script>'
-        outdated = _check_outdated_tech(html)
-        assert "old_jquery" in outdated
+    @pytest.mark.parametrize("html,flag", [
+        ("<frameset><frame src='nav.html'><frame src='content.html'></frameset>", "frames"),
+        ("<marquee>Scrolling text!</marquee>", "marquee"),
+        ("<blink>Blinking text!</blink>", "blink_tag"),
+        ('<script src="jquery-1.12.4.min.js"></script>', "old_jquery"),
+    ])
+    def test_detects_legacy_markup(self, html, flag):
+        assert flag in _check_outdated_tech(html)
 
     def test_no_outdated_tech_in_modern_site(self, sample_html_modern):
         outdated = _check_outdated_tech(sample_html_modern)
@@ -204,29 +292,22 @@ class TestOutdatedTech:
 class TestSocialUrlDetection:
     """Tests for social-only URL detection."""
 
-    def test_detects_facebook(self):
-        assert _is_social_url("https://www.facebook.com/mybusiness") is True
-
-    def test_detects_instagram(self):
-        assert _is_social_url("https://instagram.com/mybusiness") is True
-
-    def test_detects_twitter(self):
-        assert _is_social_url("https://twitter.com/mybusiness") is True
-
-    def test_detects_x_com(self):
-        assert _is_social_url("https://x.com/mybusiness") is True
-
-    def test_detects_linkedin(self):
-        assert _is_social_url("https://linkedin.com/company/mybusiness") is True
-
-    def test_does_not_flag_regular_url(self):
-        assert _is_social_url("https://mybusiness.com") is False
-
-    def test_handles_empty_url(self):
-        assert _is_social_url("") is False
-
-    def test_handles_none(self):
-        assert _is_social_url(None) is False
+    @pytest.mark.parametrize("url,expected", [
+        ("https://www.facebook.com/mybusiness", True),
+        ("https://instagram.com/mybusiness", True),
+        ("https://twitter.com/mybusiness", True),
+        ("https://x.com/mybusiness", True),
+        ("https://linkedin.com/company/mybusiness", True),
+        ("https://m.facebook.com/mybusiness", True),
+        ("https://Facebook.com:443/mybusiness", True),
+        ("https://mybusiness.com", False),
+        ("https://box.com/share", False),
+        ("https://notfacebook.com", False),
+        ("", False),
+        (None, False),
+    ])
+    def test_is_social_url(self, url, expected):
+        assert _is_social_url(url) is expected
 
 
 class TestScoringWeights:
@@ -265,12 +346,6 @@ class TestScoringWeights:
 class TestEvaluateWebsite:
     """Integration tests for evaluate_website function."""
 
-    @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
-
-    @patch("src.scoring.fetch_website")
     def test_scores_ssl_error(self, mock_fetch, scoring_config):
         mock_fetch.return_value = (None, "ssl_error: certificate verify failed")
 
@@ -280,7 +355,6 @@ class TestEvaluateWebsite:
         assert "ssl_error" in result.reasons
         assert result.error is not None
 
-    @patch("src.scoring.fetch_website")
     def test_scores_timeout(self, mock_fetch, scoring_config):
         mock_fetch.return_value = (None, "timeout")
 
@@ -291,7 +365,6 @@ class TestEvaluateWebsite:
         # capped to unverified_score_cap (39) when include_unverified_leads=False
         assert result.score == scoring_config.unverified_score_cap
 
-    @patch("src.scoring.fetch_website")
     def test_scores_timeout_uncapped(self, mock_fetch, scoring_config):
         """When unverified leads are included, timeout gets full weight."""
         scoring_config.include_unverified_leads = True
@@ -302,12 +375,12 @@ class TestEvaluateWebsite:
         assert result.score >= scoring_config.weight_timeout
         assert "timeout" in result.reasons
 
-    @patch("src.scoring.fetch_website")
     def test_scores_parked_domain(self, mock_fetch, scoring_config, sample_html_parked):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_parked
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_parked,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -315,12 +388,12 @@ class TestEvaluateWebsite:
         assert result.score >= scoring_config.weight_parked_domain
         assert "parked_domain" in result.reasons
 
-    @patch("src.scoring.fetch_website")
     def test_scores_5xx_error(self, mock_fetch, scoring_config):
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.url = "https://example.com"
-        mock_response.text = "<html><body>Internal Server Error</body></html>"
+        mock_response = SimpleResponse(
+            status_code=500,
+            url="https://example.com",
+            text="<html><body>Internal Server Error</body></html>",
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -328,12 +401,12 @@ class TestEvaluateWebsite:
         assert result.score >= scoring_config.weight_5xx_error
         assert "server_error_500" in result.reasons
 
-    @patch("src.scoring.fetch_website")
     def test_scores_outdated_copyright(self, mock_fetch, scoring_config, sample_html_outdated):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_outdated
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_outdated,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -341,24 +414,24 @@ class TestEvaluateWebsite:
         assert result.score >= scoring_config.weight_outdated_copyright
         assert any("copyright" in r for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
     def test_scores_missing_viewport(self, mock_fetch, scoring_config, sample_html_no_viewport):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_no_viewport
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_no_viewport,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
 
         assert "no_viewport" in result.reasons
 
-    @patch("src.scoring.fetch_website")
     def test_scores_http_only(self, mock_fetch, scoring_config, sample_html_modern):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "http://example.com"  # HTTP, not HTTPS
-        mock_response.text = sample_html_modern
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="http://example.com",  # HTTP, not HTTPS
+            text=sample_html_modern,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("http://example.com", config=scoring_config)
@@ -366,12 +439,12 @@ class TestEvaluateWebsite:
         assert result.score >= scoring_config.weight_http_only
         assert "no_https" in result.reasons
 
-    @patch("src.scoring.fetch_website")
     def test_modern_site_scores_low(self, mock_fetch, scoring_config, sample_html_modern):
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_modern
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_modern,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -426,28 +499,412 @@ class TestEvaluateWithIsolation:
         assert result == expected
 
 
-class TestScoreThreshold:
-    """Tests for score threshold behavior."""
+class TestStatusPenalty:
+    """Tests for the HTTP status scoring table."""
+
+    @pytest.mark.parametrize("status,weight_attr,reason", [
+        (404, "weight_not_found_or_forbidden", "http_404"),
+        (403, "weight_not_found_or_forbidden", "http_403"),
+        (410, "weight_client_error", "client_error_410"),
+        (503, "weight_5xx_error", "server_error_503"),
+    ])
+    def test_error_statuses(self, scoring_config, status, weight_attr, reason):
+        assert _status_penalty(status, scoring_config) == (
+            getattr(scoring_config, weight_attr), reason
+        )
+
+    @pytest.mark.parametrize("status", [200, 204, 301, 399, 600])
+    def test_non_error_statuses(self, scoring_config, status):
+        assert _status_penalty(status, scoring_config) is None
+
+
+class TestEvaluateMany:
+    """Tests for concurrent multi-site evaluation."""
+
+    def test_results_keep_input_order(self):
+        urls = ["https://a.com", "https://b.com", "https://c.com"]
+
+        def fake_eval(url, config, retry_config):
+            return ScoringResult(url, len(url), [], 200, 10, url, None)
+
+        with patch("src.scoring.evaluate_with_isolation", side_effect=fake_eval):
+            results = evaluate_many(urls, max_workers=3)
+
+        assert [r.url for r in results] == urls
+
+    def test_limits_concurrency_per_host(self):
+        active = {}
+        peak = {}
+        lock = threading.Lock()
+
+        def fake_eval(url, config, retry_config):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return ScoringResult(url, 0, [], 200, 10, url, None)
+
+        urls = [f"https://shared.com/{i}" for i in range(6)] + ["https://other.com"]
+        with patch("src.scoring.evaluate_with_isolation", side_effect=fake_eval):
+            results = evaluate_many(urls, max_workers=7, max_per_host=2)
+
+        assert len(results) == 7
+        assert peak["shared.com"] <= 2
+
+    def test_duplicate_sites_are_evaluated_once(self):
+        def fake_eval(url, config, retry_config):
+            return ScoringResult(url, 40, [], 200, 10, url, None)
+
+        urls = ["https://a.com", "https://www.a.com/", "https://b.com", "https://a.com"]
+        with patch("src.scoring.evaluate_with_isolation", side_effect=fake_eval) as mock_eval:
+            results = evaluate_many(urls, max_workers=4)
+
+        assert mock_eval.call_count == 2
+        assert len(results) == 4
+        assert results[0] is results[1] is results[3]
+        assert results[2].url == "https://b.com"
+
+    def test_empty_input(self):
+        assert evaluate_many([]) == []
+
+
+class TestScoringCache:
+    """Tests for cross-run reuse of scoring results."""
+
+    def _result(self, **overrides) -> ScoringResult:
+        fields = dict(
+            url="https://example.com",
+            score=55,
+            reasons=["no_viewport", "missing_h1"],
+            http_status=200,
+            response_time_ms=120,
+            final_url="https://example.com/",
+            error=None,
+        )
+        fields.update(overrides)
+        return ScoringResult(**fields)
+
+    @patch("src.scoring.evaluate_website")
+    def test_second_lookup_hits_cache(self, mock_evaluate, scoring_config, test_database):
+        mock_evaluate.return_value = self._result()
+
+        first = evaluate_with_isolation("https://www.example.com/", config=scoring_config, cache=test_database)
+        second = evaluate_with_isolation("example.com", config=scoring_config, cache=test_database)
+
+        assert mock_evaluate.call_count == 1
+        assert second.score == first.score
+        assert second.reasons == first.reasons
+        assert second.http_status == 200
+
+    @patch("src.scoring.evaluate_website")
+    def test_fetch_errors_are_not_cached(self, mock_evaluate, scoring_config, test_database):
+        mock_evaluate.return_value = self._result(
+            score=39, reasons=["timeout", "unverified"], http_status=None, error="timeout"
+        )
+
+        evaluate_with_isolation("https://example.com", config=scoring_config, cache=test_database)
+        evaluate_with_isolation("https://example.com", config=scoring_config, cache=test_database)
+
+        assert mock_evaluate.call_count == 2
+
+    @patch("src.scoring.evaluate_website")
+    def test_phone_change_misses_cache(self, mock_evaluate, scoring_config, test_database):
+        mock_evaluate.return_value = self._result()
+
+        evaluate_with_isolation(
+            "https://example.com", config=scoring_config, expected_phone="555-0100", cache=test_database
+        )
+        evaluate_with_isolation(
+            "https://example.com", config=scoring_config, expected_phone="555-0199", cache=test_database
+        )
+
+        assert mock_evaluate.call_count == 2
+
+    @patch("src.scoring.evaluate_website")
+    def test_zero_ttl_disables_cache(self, mock_evaluate, scoring_config, test_database):
+        scoring_config.cache_ttl_days = 0
+        mock_evaluate.return_value = self._result()
+
+        evaluate_with_isolation("https://example.com", config=scoring_config, cache=test_database)
+        evaluate_with_isolation("https://example.com", config=scoring_config, cache=test_database)
+
+        assert mock_evaluate.call_count == 2
+
+    def test_cleanup_removes_only_expired_rows(self, test_database):
+        for url in ("old.example", "new.example"):
+            test_database.cache_score(url, 40, ["no_ssl"], 200, 90, f"https://{url}/")
+        with test_database._connect() as conn:
+            conn.execute(
+                "UPDATE scoring_cache SET fetched_at = ? WHERE url = 'old.example'",
+                (datetime.utcnow() - timedelta(days=30),),
+            )
+
+        assert test_database.cleanup_scoring_cache(7) == 1
+        assert test_database.get_cached_score("old.example", 365) is None
+        assert test_database.get_cached_score("new.example", 7) is not None
+
+
+class TestCappedBodyRead:
+    """Tests for the streamed, size-capped body read."""
+
+    def _streamed_response(self, body: bytes) -> requests.Response:
+        response = requests.Response()
+        response.raw = io.BytesIO(body)
+        response.encoding = "utf-8"
+        return response
+
+    def test_truncates_body_at_cap(self):
+        response = self._streamed_response(b"a" * 50000)
+        _read_capped_body(response, 20000)
+        assert len(response.content) == 20000
+        assert response.text == "a" * 20000
+
+    def test_small_body_read_in_full(self):
+        response = self._streamed_response(b"<html>ok</html>")
+        _read_capped_body(response, 20000)
+        assert response.text == "<html>ok</html>"
+
+    def test_zero_cap_reads_everything(self):
+        response = self._streamed_response(b"b" * 40000)
+        _read_capped_body(response, 0)
+        assert len(response.content) == 40000
+
+    def test_empty_body_skips_decode(self, scoring_config):
+        response = Mock()
+        response.status_code = 200
+        response.url = "https://example.com"
+        response.headers = {"Content-Length": "0"}
+        type(response).text = property(lambda self: pytest.fail("body should not be decoded"))
+
+        result = evaluate_website("https://example.com", config=scoring_config, response=response)
+
+        assert "empty_page" in result.reasons
+
+
+    def test_undeclared_charset_uses_meta_tag(self):
+        response = self._streamed_response('<meta charset="iso-8859-1"><p>Caf\xe9</p>'.encode("latin-1"))
+        response.encoding = None
+        _read_capped_body(response, 20000)
+        assert "Caf\xe9" in _response_text(response)
+
+    def test_undeclared_charset_defaults_to_utf8(self):
+        response = self._streamed_response("<p>Caf\xe9</p>".encode("utf-8"))
+        response.encoding = None
+        _read_capped_body(response, 20000)
+        with patch.object(
+            requests.Response, "apparent_encoding",
+            new_callable=lambda: property(lambda self: pytest.fail("charset detection ran")),
+        ):
+            assert _response_text(response) == "<p>Caf\xe9</p>"
+
+    def test_text_default_latin1_yields_to_meta_charset(self):
+        response = self._streamed_response('<meta charset="utf-8"><p>Caf\xe9</p>'.encode("utf-8"))
+        response.headers["Content-Type"] = "text/html"
+        response.encoding = "ISO-8859-1"  # requests' default for text/* without charset
+        _read_capped_body(response, 20000)
+        assert "Caf\xe9" in _response_text(response)
+
+    def test_declared_latin1_is_kept(self):
+        response = self._streamed_response('<meta charset="utf-8"><p>Caf\xe9</p>'.encode("latin-1"))
+        response.headers["Content-Type"] = "text/html; charset=ISO-8859-1"
+        response.encoding = "ISO-8859-1"
+        _read_capped_body(response, 20000)
+        assert response.encoding == "ISO-8859-1"
+        assert "Caf\xe9" in _response_text(response)
+
+
+class TestSharedSession:
+    """Tests for the pooled scoring session."""
+
+    def test_pool_sized_for_concurrent_workers(self):
+        adapter = _get_session().get_adapter("https://example.com")
+        assert adapter._pool_maxsize >= 16
+        assert adapter._pool_connections >= 16
+
+
+class TestDnsCache:
+    """Tests for the cached resolver used by raw-socket checks."""
 
     @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr("src.scoring._DNS_CACHE", OrderedDict())
+
+    def test_resolution_is_reused(self):
+        addrinfo = [(2, 1, 6, "", ("93.184.216.34", 0))]
+        with patch("src.scoring.socket.getaddrinfo", return_value=addrinfo) as mock_gai:
+            assert _dns_resolves("Example.com") is True
+            assert _dns_resolves("example.com") is True
+        assert mock_gai.call_count == 1
+
+    def test_nxdomain_is_cached(self):
+        with patch(
+            "src.scoring.socket.getaddrinfo", side_effect=socket.gaierror("nxdomain")
+        ) as mock_gai:
+            assert _dns_resolves("missing.invalid") is False
+            assert _dns_resolves("missing.invalid") is False
+        assert mock_gai.call_count == 1
+
+    def test_nxdomain_raises_a_fresh_error_each_time(self):
+        with patch(
+            "src.scoring.socket.getaddrinfo",
+            side_effect=socket.gaierror(socket.EAI_NONAME, "Name or service not known"),
+        ):
+            errors = []
+            for _ in range(2):
+                with pytest.raises(socket.gaierror) as excinfo:
+                    _resolve_host("missing.invalid")
+                errors.append(excinfo.value)
+        assert errors[0] is not errors[1]
+        assert errors[1].errno == socket.EAI_NONAME
+
+    def test_dns_check_and_socket_connect_share_one_lookup(self):
+        addrinfo = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        with patch("src.scoring.socket.getaddrinfo", return_value=addrinfo) as mock_gai, \
+                patch("src.scoring.socket.socket") as mock_socket:
+            assert _dns_resolves("example.com") is True
+            _connect_resolved("example.com", 443, 5.0)
+        assert mock_gai.call_count == 1
+        mock_socket.return_value.connect.assert_called_once_with(("93.184.216.34", 443))
+
+    def test_expired_entry_is_refreshed(self, monkeypatch):
+        monkeypatch.setattr("src.scoring._DNS_CACHE_TTL_SECONDS", 0)
+        addrinfo = [(2, 1, 6, "", ("93.184.216.34", 0))]
+        with patch("src.scoring.socket.getaddrinfo", return_value=addrinfo) as mock_gai:
+            _dns_resolves("example.com")
+            _dns_resolves("example.com")
+        assert mock_gai.call_count == 2
+
+    def test_transient_failure_is_not_cached(self):
+        addrinfo = [(2, 1, 6, "", ("93.184.216.34", 0))]
+        with patch(
+            "src.scoring.socket.getaddrinfo",
+            side_effect=[socket.gaierror(socket.EAI_AGAIN, "try again"), addrinfo],
+        ) as mock_gai:
+            assert _dns_resolves("example.com") is False
+            assert _dns_resolves("example.com") is True
+        assert mock_gai.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, monkeypatch):
+        monkeypatch.setattr("src.scoring._DNS_CACHE_MAX_ENTRIES", 2)
+        addrinfo = [(2, 1, 6, "", ("93.184.216.34", 0))]
+        with patch("src.scoring.socket.getaddrinfo", return_value=addrinfo) as mock_gai:
+            _dns_resolves("a.com")
+            _dns_resolves("b.com")
+            _dns_resolves("a.com")
+            _dns_resolves("c.com")
+            _dns_resolves("a.com")
+            _dns_resolves("b.com")
+        assert mock_gai.call_count == 4
+
+
+class TestHeadProbe:
+    """Tests for the optional HEAD-before-GET probe."""
+
+    def _session(self, status_code: int, content_type: str = "text/html") -> Mock:
+        session = Mock()
+        session.head.return_value = Mock(
+            status_code=status_code, headers={"Content-Type": content_type}
+        )
+        return session
+
+    def _response(self, status_code: int, body: bytes = b"", content_type: str = "text/html") -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.url = "https://example.com/"
+        response.headers["Content-Type"] = content_type
+        response.raw = io.BytesIO(body)
+        response.encoding = "utf-8"
+        return response
+
+    def test_returns_head_for_terminal_status(self, scoring_config):
+        session = self._session(502)
+        probe = _head_probe(session, "https://example.com", scoring_config)
+        assert probe is session.head.return_value
+        assert probe.head_only is True
+
+    def test_returns_head_for_non_html(self, scoring_config):
+        session = self._session(200, "application/pdf")
+        assert _head_probe(session, "https://example.com", scoring_config).head_only is True
+
+    def test_not_found_needs_get(self, scoring_config):
+        for status in (404, 410):
+            session = self._session(status)
+            assert _head_probe(session, "https://example.com", scoring_config) is None
+
+    def test_not_found_page_scores_the_same_with_probe_on_or_off(self, scoring_config):
+        page = (
+            b"<html><head><title>Page not found</title></head>"
+            b"<body><p>Sorry, we could not find that page on our site.</p></body></html>"
+        )
+        scoring_config.allow_scheme_fallback = False
+        results = {}
+        for enabled in (False, True):
+            scoring_config.head_probe_enabled = enabled
+            session = Mock()
+            session.head.return_value = self._response(404)
+            session.get.return_value = self._response(404, page)
+            with patch("src.scoring._get_session", return_value=session):
+                results[enabled] = evaluate_website("https://example.com", config=scoring_config)
+
+        assert "http_404" in results[False].reasons
+        assert "empty_page" not in results[True].reasons
+        assert results[True].reasons == results[False].reasons
+        assert results[True].score == results[False].score
+
+    def test_head_only_response_scores_status_without_content_checks(self, scoring_config):
+        scoring_config.head_probe_enabled = True
+        scoring_config.allow_scheme_fallback = False
+        session = Mock()
+        session.head.return_value = self._response(502)
+
+        with patch("src.scoring._get_session", return_value=session):
+            result = evaluate_website("https://example.com", config=scoring_config)
+
+        session.get.assert_not_called()
+        assert result.http_status == 502
+        assert "empty_page" not in result.reasons
+        assert not any(r.startswith("missing_") for r in result.reasons)
+
+    def test_html_page_needs_get(self, scoring_config):
+        session = self._session(200, "text/html; charset=utf-8")
+        assert _head_probe(session, "https://example.com", scoring_config) is None
+
+    def test_bot_wall_statuses_need_get(self, scoring_config):
+        for status in (403, 405, 503, 522):
+            session = self._session(status)
+            assert _head_probe(session, "https://example.com", scoring_config) is None
+
+    def test_failed_probe_falls_back_to_get(self, scoring_config):
+        session = Mock()
+        session.head.side_effect = requests.exceptions.ConnectionError("refused")
+        assert _head_probe(session, "https://example.com", scoring_config) is None
+
+    def test_redirect_loop_is_raised(self, scoring_config):
+        session = Mock()
+        session.head.side_effect = requests.exceptions.TooManyRedirects()
+        with pytest.raises(requests.exceptions.TooManyRedirects):
+            _head_probe(session, "https://example.com", scoring_config)
+
+
+class TestScoreThreshold:
+    """Tests for score threshold behavior."""
 
-    @patch("src.scoring.fetch_website")
     def test_parked_domain_exceeds_threshold(self, mock_fetch, scoring_config, sample_html_parked):
         """A parked domain should score >= 40 (threshold)."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_parked
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_parked,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
 
         assert result.score >= scoring_config.min_score_to_include
 
-    @patch("src.scoring.fetch_website")
     def test_timeout_capped_below_threshold(self, mock_fetch, scoring_config):
         """Timeout is in unverified_reasons, so it gets capped below threshold by default."""
         mock_fetch.return_value = (None, "timeout")
@@ -458,7 +915,6 @@ class TestScoreThreshold:
         assert result.score == scoring_config.unverified_score_cap
         assert result.score < scoring_config.min_score_to_include
 
-    @patch("src.scoring.fetch_website")
     def test_timeout_exceeds_threshold_when_unverified_included(self, mock_fetch, scoring_config):
         """When including unverified leads, timeout exceeds threshold."""
         scoring_config.include_unverified_leads = True
@@ -468,13 +924,13 @@ class TestScoreThreshold:
 
         assert result.score >= scoring_config.min_score_to_include
 
-    @patch("src.scoring.fetch_website")
     def test_wix_now_exceeds_threshold(self, mock_fetch, scoring_config, sample_html_wix):
         """A Wix site alone should now exceed the threshold (prime rebuild opportunity)."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = sample_html_wix
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=sample_html_wix,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -484,43 +940,20 @@ class TestScoreThreshold:
         assert result.score >= scoring_config.min_score_to_include
 
 
-_BASE_HTML = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="A great business">
-    <title>Business Name</title>
-</head>
-<body>
-    <h1>Welcome</h1>
-    <p>We do great work.</p>
-    <p>Call us: (555) 123-4567</p>
-    <p>Email: <a href="mailto:info@example.com">info@example.com</a></p>
-    <footer><p>© 2026 Business Name. All rights reserved.</p></footer>
-</body>
-</html>"""
-
-
 class TestMarketingSignalScoring:
     """Tests for marketing signal detection and scoring."""
 
-    @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
-
-    @patch("src.scoring.fetch_website")
-    def test_gtm_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_gtm_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """Google Tag Manager detection should add weight and reason."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             '<script src="https://www.googletagmanager.com/gtm.js?id=GTM-123"></script></head>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -528,17 +961,17 @@ class TestMarketingSignalScoring:
         assert "has_gtm" in result.reasons
         assert result.score == scoring_config.weight_has_gtm
 
-    @patch("src.scoring.fetch_website")
-    def test_fb_pixel_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_fb_pixel_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """Facebook Pixel detection should add weight and reason."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             '<script>!function(f,b,e,v,n,t,s){if(f.fbq)return;n=f.fbq=function(){};fbq("init","123");</script></head>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -546,17 +979,17 @@ class TestMarketingSignalScoring:
         assert "has_fb_pixel" in result.reasons
         assert result.score == scoring_config.weight_has_fb_pixel
 
-    @patch("src.scoring.fetch_website")
-    def test_gclid_in_html_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_gclid_in_html_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """gclid in HTML should add weight and reason."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<a href="https://example.com/landing?gclid=abc123">Click</a></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -564,13 +997,13 @@ class TestMarketingSignalScoring:
         assert "has_gclid" in result.reasons
         assert result.score == scoring_config.weight_has_gclid
 
-    @patch("src.scoring.fetch_website")
-    def test_gclid_in_final_url_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_gclid_in_final_url_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """gclid in final URL should add weight and reason."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com/landing?gclid=abc123"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com/landing?gclid=abc123",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -578,10 +1011,9 @@ class TestMarketingSignalScoring:
         assert "has_gclid" in result.reasons
         assert result.score == scoring_config.weight_has_gclid
 
-    @patch("src.scoring.fetch_website")
-    def test_multiple_marketing_signals_stack(self, mock_fetch, scoring_config):
+    def test_multiple_marketing_signals_stack(self, mock_fetch, scoring_config, base_html):
         """Multiple marketing signals should stack their weights."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             (
                 '<script src="https://www.googletagmanager.com/gtm.js?id=GTM-123"></script>'
@@ -589,10 +1021,11 @@ class TestMarketingSignalScoring:
                 '</head>'
             )
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -602,13 +1035,13 @@ class TestMarketingSignalScoring:
         expected = scoring_config.weight_has_gtm + scoring_config.weight_has_fb_pixel
         assert result.score == expected
 
-    @patch("src.scoring.fetch_website")
-    def test_no_marketing_signals_no_extra_score(self, mock_fetch, scoring_config):
+    def test_no_marketing_signals_no_extra_score(self, mock_fetch, scoring_config, base_html):
         """A clean site should not have marketing reasons or extra score."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -622,20 +1055,15 @@ class TestMarketingSignalScoring:
 class TestSslExpiryScoring:
     """Tests for SSL certificate expiry scoring."""
 
-    @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
-
-    @patch("src.scoring.fetch_website")
     @patch("src.scoring._check_ssl_expiry")
-    def test_ssl_expiring_soon_adds_weight_and_reason(self, mock_ssl_check, mock_fetch, scoring_config):
+    def test_ssl_expiring_soon_adds_weight_and_reason(self, mock_ssl_check, mock_fetch, scoring_config, base_html):
         """An SSL cert expiring within threshold should add weight and reason."""
         mock_ssl_check.return_value = 12
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -643,15 +1071,15 @@ class TestSslExpiryScoring:
         assert "ssl_expires_12_days" in result.reasons
         assert result.score == scoring_config.weight_ssl_expiry
 
-    @patch("src.scoring.fetch_website")
     @patch("src.scoring._check_ssl_expiry")
-    def test_ssl_not_expiring_no_score(self, mock_ssl_check, mock_fetch, scoring_config):
+    def test_ssl_not_expiring_no_score(self, mock_ssl_check, mock_fetch, scoring_config, base_html):
         """An SSL cert with plenty of time left should not add score."""
         mock_ssl_check.return_value = 90
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -659,14 +1087,14 @@ class TestSslExpiryScoring:
         assert not any(r.startswith("ssl_expires_") for r in result.reasons)
         assert result.score == 0
 
-    @patch("src.scoring.fetch_website")
     @patch("src.scoring._check_ssl_expiry")
-    def test_http_site_skips_ssl_check(self, mock_ssl_check, mock_fetch, scoring_config):
+    def test_http_site_skips_ssl_check(self, mock_ssl_check, mock_fetch, scoring_config, base_html):
         """HTTP-only sites should not trigger SSL expiry checks."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "http://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="http://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("http://example.com", config=scoring_config)
@@ -674,15 +1102,15 @@ class TestSslExpiryScoring:
         mock_ssl_check.assert_not_called()
         assert not any(r.startswith("ssl_expires_") for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
     @patch("src.scoring._check_ssl_expiry")
-    def test_ssl_check_failure_is_graceful(self, mock_ssl_check, mock_fetch, scoring_config):
+    def test_ssl_check_failure_is_graceful(self, mock_ssl_check, mock_fetch, scoring_config, base_html):
         """If SSL check fails, scoring should continue without error."""
         mock_ssl_check.return_value = None
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -695,29 +1123,29 @@ class TestBrokenImageScoring:
     """Tests for broken image detection and scoring."""
 
     @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
+    def enable_broken_image_check(self, scoring_config):
+        """Make sure the sampled image probe runs regardless of env defaults."""
         scoring_config.broken_image_check_enabled = True
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_disabled_broken_image_check_skips_head_requests(
         self,
         mock_head,
         mock_fetch,
         scoring_config,
+        base_html,
     ):
         """Launch config should be able to skip sampled image probes."""
         scoring_config.broken_image_check_enabled = False
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<img src="/photo.jpg" alt="photo"></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -725,19 +1153,19 @@ class TestBrokenImageScoring:
         mock_head.assert_not_called()
         assert not any(r.startswith("broken_image_") for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_one_broken_image_adds_weight_and_reason(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_one_broken_image_adds_weight_and_reason(self, mock_head, mock_fetch, scoring_config, base_html):
         """A single broken image should add weight and a reason."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<img src="/photo.jpg" alt="photo"></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -745,19 +1173,19 @@ class TestBrokenImageScoring:
         assert any(r.startswith("broken_image_") for r in result.reasons)
         assert result.score == scoring_config.weight_broken_image
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_multiple_broken_images_stack(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_multiple_broken_images_stack(self, mock_head, mock_fetch, scoring_config, base_html):
         """Multiple broken images should stack their weights."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<img src="/a.jpg"><img src="/b.jpg"></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -766,19 +1194,19 @@ class TestBrokenImageScoring:
         assert len(broken_reasons) == 2
         assert result.score == 2 * scoring_config.weight_broken_image
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_working_images_add_no_score(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_working_images_add_no_score(self, mock_head, mock_fetch, scoring_config, base_html):
         """Images that return 200 should not add score."""
         mock_head.return_value = Mock(status_code=200)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<img src="/photo.jpg" alt="photo"></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -786,14 +1214,14 @@ class TestBrokenImageScoring:
         assert not any(r.startswith("broken_image_") for r in result.reasons)
         assert result.score == 0
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_no_images_no_score(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_no_images_no_score(self, mock_head, mock_fetch, scoring_config, base_html):
         """HTML with no images should not trigger image checks."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -801,19 +1229,19 @@ class TestBrokenImageScoring:
         mock_head.assert_not_called()
         assert result.score == 0
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_data_uri_images_skipped(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_data_uri_images_skipped(self, mock_head, mock_fetch, scoring_config, base_html):
         """Data URI images should be skipped."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<img src="data:image/png;base64,abc123"><img src="/photo.jpg"></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -827,22 +1255,17 @@ class TestBrokenImageScoring:
 class TestContactInfoScoring:
     """Tests for contact info detection and scoring."""
 
-    @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
-
-    @patch("src.scoring.fetch_website")
-    def test_missing_email_adds_weight(self, mock_fetch, scoring_config):
+    def test_missing_email_adds_weight(self, mock_fetch, scoring_config, base_html):
         """HTML with no email should add missing_email reason and weight."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             '<a href="mailto:info@example.com">info@example.com</a>',
             '<span>Contact us online</span>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -850,14 +1273,14 @@ class TestContactInfoScoring:
         assert "missing_email" in result.reasons
         assert result.score == scoring_config.weight_missing_email
 
-    @patch("src.scoring.fetch_website")
-    def test_missing_phone_adds_weight(self, mock_fetch, scoring_config):
+    def test_missing_phone_adds_weight(self, mock_fetch, scoring_config, base_html):
         """HTML with no phone should add missing_phone reason and weight."""
-        html = _BASE_HTML.replace("(555) 123-4567", "our office")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        html = base_html.replace("(555) 123-4567", "our office")
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -865,14 +1288,14 @@ class TestContactInfoScoring:
         assert "missing_phone" in result.reasons
         assert result.score == scoring_config.weight_missing_phone
 
-    @patch("src.scoring.fetch_website")
-    def test_phone_mismatch_adds_weight(self, mock_fetch, scoring_config):
+    def test_phone_mismatch_adds_weight(self, mock_fetch, scoring_config, base_html):
         """If expected phone differs from website phone, add phone_mismatch."""
-        html = _BASE_HTML.replace("(555) 123-4567", "(555) 999-8888")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        html = base_html.replace("(555) 123-4567", "(555) 999-8888")
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website(
@@ -882,13 +1305,13 @@ class TestContactInfoScoring:
         assert "phone_mismatch" in result.reasons
         assert result.score == scoring_config.weight_phone_mismatch
 
-    @patch("src.scoring.fetch_website")
-    def test_phone_match_no_mismatch(self, mock_fetch, scoring_config):
+    def test_phone_match_no_mismatch(self, mock_fetch, scoring_config, base_html):
         """If expected phone matches website phone, no phone_mismatch."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = _BASE_HTML
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=base_html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website(
@@ -899,17 +1322,39 @@ class TestContactInfoScoring:
         assert "missing_phone" not in result.reasons
         assert result.score == 0
 
-    @patch("src.scoring.fetch_website")
-    def test_missing_both_contact_signals_stack(self, mock_fetch, scoring_config):
+    def test_contact_block_in_middle_of_long_page(self, mock_fetch, scoring_config, base_html):
+        """Email and phone past the analysis window still count as present."""
+        filler = "<p>We do great work.</p>\n" * 15_000
+        html = base_html.replace(
+            "    <p>Call us:", filler + "    <p>Call us:"
+        ).replace("    <footer>", filler + "    <footer>")
+        assert "(555) 123-4567" not in _analysis_window(html)
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
+        mock_fetch.return_value = (mock_response, None)
+
+        result = evaluate_website(
+            "https://example.com", config=scoring_config, expected_phone="(555) 123-4567"
+        )
+
+        assert "missing_email" not in result.reasons
+        assert "missing_phone" not in result.reasons
+        assert "phone_mismatch" not in result.reasons
+
+    def test_missing_both_contact_signals_stack(self, mock_fetch, scoring_config, base_html):
         """Missing both email and phone should stack weights."""
-        html = _BASE_HTML.replace("(555) 123-4567", "our office").replace(
+        html = base_html.replace("(555) 123-4567", "our office").replace(
             '<a href="mailto:info@example.com">info@example.com</a>',
             '<span>Contact us online</span>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -919,14 +1364,14 @@ class TestContactInfoScoring:
         expected = scoring_config.weight_missing_email + scoring_config.weight_missing_phone
         assert result.score == expected
 
-    @patch("src.scoring.fetch_website")
-    def test_no_expected_phone_skips_mismatch_check(self, mock_fetch, scoring_config):
+    def test_no_expected_phone_skips_mismatch_check(self, mock_fetch, scoring_config, base_html):
         """If no expected_phone provided, phone_mismatch should not be checked."""
-        html = _BASE_HTML.replace("(555) 123-4567", "(555) 999-8888")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        html = base_html.replace("(555) 123-4567", "(555) 999-8888")
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -940,29 +1385,29 @@ class TestDeadSocialLinkScoring:
     """Tests for dead social link detection and scoring."""
 
     @pytest.fixture(autouse=True)
-    def disable_playwright(self, scoring_config):
-        """Disable playwright fallback for unit tests."""
-        scoring_config.playwright_fallback_enabled = False
+    def enable_dead_social_check(self, scoring_config):
+        """Make sure social link probes run regardless of env defaults."""
         scoring_config.dead_social_check_enabled = True
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
+    @patch("src.scoring.requests.Session.head")
     def test_disabled_dead_social_check_skips_head_requests(
         self,
         mock_head,
         mock_fetch,
         scoring_config,
+        base_html,
     ):
         """Launch config should be able to skip social-link probes."""
         scoring_config.dead_social_check_enabled = False
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<a href="https://facebook.com/oldpage">Facebook</a></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -970,19 +1415,19 @@ class TestDeadSocialLinkScoring:
         mock_head.assert_not_called()
         assert not any(r.startswith("dead_social_link_") for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_one_dead_social_link_adds_weight(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_one_dead_social_link_adds_weight(self, mock_head, mock_fetch, scoring_config, base_html):
         """A single dead social link should add weight and a reason."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<a href="https://facebook.com/oldpage">Facebook</a></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -990,12 +1435,11 @@ class TestDeadSocialLinkScoring:
         assert any(r.startswith("dead_social_link_") for r in result.reasons)
         assert result.score == scoring_config.weight_dead_social_link
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_multiple_dead_social_links_stack(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_multiple_dead_social_links_stack(self, mock_head, mock_fetch, scoring_config, base_html):
         """Multiple dead social links should stack their weights."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             (
                 '<a href="https://facebook.com/old">FB</a>'
@@ -1003,10 +1447,11 @@ class TestDeadSocialLinkScoring:
                 '</body>'
             )
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1015,19 +1460,19 @@ class TestDeadSocialLinkScoring:
         assert len(dead_reasons) == 2
         assert result.score == 2 * scoring_config.weight_dead_social_link
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_working_social_link_no_score(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_working_social_link_no_score(self, mock_head, mock_fetch, scoring_config, base_html):
         """A working social link should not add score."""
         mock_head.return_value = Mock(status_code=200)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<a href="https://facebook.com/working">Facebook</a></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1035,19 +1480,19 @@ class TestDeadSocialLinkScoring:
         assert not any(r.startswith("dead_social_link_") for r in result.reasons)
         assert result.score == 0
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_non_social_links_ignored(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_non_social_links_ignored(self, mock_head, mock_fetch, scoring_config, base_html):
         """Non-social links should not be checked."""
         mock_head.return_value = Mock(status_code=404)
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</body>",
             '<a href="https://example.com/about">About</a></body>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1055,19 +1500,19 @@ class TestDeadSocialLinkScoring:
         mock_head.assert_not_called()
         assert not any(r.startswith("dead_social_link_") for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
-    @patch("src.scoring.requests.head")
-    def test_respects_max_check_limit(self, mock_head, mock_fetch, scoring_config):
+    @patch("src.scoring.requests.Session.head")
+    def test_respects_max_check_limit(self, mock_head, mock_fetch, scoring_config, base_html):
         """Only up to dead_social_max_check links should be checked."""
         mock_head.return_value = Mock(status_code=404)
         social_links = ""
         for i in range(10):
             social_links += f'<a href="https://facebook.com/page{i}">FB{i}</a>'
-        html = _BASE_HTML.replace("</body>", social_links + "</body>")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        html = base_html.replace("</body>", social_links + "</body>")
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1112,10 +1557,9 @@ class TestWordPressDetection:
         assert is_wp is False
         assert version is None
 
-    @patch("src.scoring.fetch_website")
-    def test_outdated_wp_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_outdated_wp_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """An outdated WordPress site should add wp_outdated reason and weight."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             (
                 '<meta name="generator" content="WordPress 5.8.3">'
@@ -1123,10 +1567,11 @@ class TestWordPressDetection:
                 '</head>'
             )
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1135,10 +1580,9 @@ class TestWordPressDetection:
         assert any(r.startswith("wp_outdated_") for r in result.reasons)
         assert result.score >= scoring_config.weight_wordpress_outdated
 
-    @patch("src.scoring.fetch_website")
-    def test_modern_wp_no_outdated_flag(self, mock_fetch, scoring_config):
+    def test_modern_wp_no_outdated_flag(self, mock_fetch, scoring_config, base_html):
         """A modern WP site should get the wp tag but no outdated penalty."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             (
                 '<meta name="generator" content="WordPress 6.5.2">'
@@ -1146,10 +1590,11 @@ class TestWordPressDetection:
                 '</head>'
             )
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1189,17 +1634,17 @@ class TestEcommerceDetection:
         result = _detect_ecommerce_platform("<html></html>", "https://example.com")
         assert result is None
 
-    @patch("src.scoring.fetch_website")
-    def test_ecommerce_adds_weight_and_reason(self, mock_fetch, scoring_config):
+    def test_ecommerce_adds_weight_and_reason(self, mock_fetch, scoring_config, base_html):
         """E-commerce platform detection should add reason and weight."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             '<script src="https://cdn.shopify.com/shopify.js"></script></head>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1236,6 +1681,15 @@ class TestRenderBlockingDetection:
         count = _count_render_blocking(html)
         assert count == 1
 
+    def test_resources_after_head_not_counted(self):
+        html = """<html><HEAD><script src="a.js"></script></HEAD>
+        <body><script src="b.js"></script><link rel="stylesheet" href="c.css"></body>
+        </html>"""
+        assert _count_render_blocking(html) == 1
+
+    def test_unclosed_head_returns_zero(self):
+        assert _count_render_blocking('<html><head><script src="a.js"></script>') == 0
+
     def test_no_head_returns_zero(self):
         html = "<html><body>No head!</body></html>"
         count = _count_render_blocking(html)
@@ -1245,32 +1699,32 @@ class TestRenderBlockingDetection:
         count = _count_render_blocking("")
         assert count == 0
 
-    @patch("src.scoring.fetch_website")
-    def test_render_blocking_below_threshold_no_score(self, mock_fetch, scoring_config):
+    def test_render_blocking_below_threshold_no_score(self, mock_fetch, scoring_config, base_html):
         """Few blocking resources should not add score."""
-        html = _BASE_HTML.replace(
+        html = base_html.replace(
             "</head>",
             '<script src="app.js"></script></head>'
         )
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
 
         assert not any(r.startswith("render_blocking_") for r in result.reasons)
 
-    @patch("src.scoring.fetch_website")
-    def test_many_blocking_resources_adds_weight(self, mock_fetch, scoring_config):
+    def test_many_blocking_resources_adds_weight(self, mock_fetch, scoring_config, base_html):
         """Many blocking resources should add render_blocking reason."""
         scripts = "".join(f'<script src="script{i}.js"></script>' for i in range(6))
-        html = _BASE_HTML.replace("</head>", scripts + "</head>")
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.url = "https://example.com"
-        mock_response.text = html
+        html = base_html.replace("</head>", scripts + "</head>")
+        mock_response = SimpleResponse(
+            status_code=200,
+            url="https://example.com",
+            text=html,
+        )
         mock_fetch.return_value = (mock_response, None)
 
         result = evaluate_website("https://example.com", config=scoring_config)
@@ -1280,6 +1734,109 @@ class TestRenderBlockingDetection:
         assert result.score >= scoring_config.weight_render_blocking
 
 
+class TestLastModified:
+    """Tests for Last-Modified header age parsing."""
+
+    NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_parses_http_date(self):
+        headers = {"Last-Modified": "Sun, 01 Jan 2023 00:00:00 GMT"}
+        assert _parse_last_modified_years(headers, self.NOW) == pytest.approx(365 / 365.25)
+
+    def test_reads_requests_header_mapping(self):
+        headers = CaseInsensitiveDict({"last-modified": "Sun, 01 Jan 2023 00:00:00 GMT"})
+        assert _parse_last_modified_years(headers, self.NOW) == pytest.approx(365 / 365.25)
+
+    def test_malformed_header_is_ignored(self):
+        assert _parse_last_modified_years({"Last-Modified": "yesterday"}, self.NOW) is None
+
+
+class TestAnalyzePage:
+    """Tests for the combined page content analysis."""
+
+    def test_collects_signals_from_outdated_page(self, sample_html_outdated):
+        page = _analyze_page(
+            sample_html_outdated, sample_html_outdated.lower(), "https://joes.example.com", 2024
+        )
+        assert page.copyright_year == 2018
+        assert page.has_h1 is True
+        assert page.has_viewport is False
+        assert page.parked is False
+        assert page.diy_builder is None
+
+    def test_collects_signals_from_wix_page(self, sample_html_wix):
+        page = _analyze_page(sample_html_wix, sample_html_wix.lower(), "https://example.com", 2024)
+        assert page.diy_builder == "wix"
+        assert page.has_viewport is True
+        assert page.has_h1 is False
+        assert page.has_meta_description is False
+
+
+class TestAnalysisWindow:
+    """Tests for trimming oversized pages before analysis."""
+
+    def test_small_page_is_untouched(self, sample_html_modern):
+        assert _analysis_window(sample_html_modern) is sample_html_modern
+
+    def test_large_page_keeps_head_and_footer(self):
+        html = "<head><title>Shop</title></head>" + "x" * 2_000_000 + "<footer>\u00a9 2016</footer>"
+        window = _analysis_window(html)
+        assert len(window) < 300_000
+        assert window.startswith("<head><title>Shop</title></head>")
+        assert _extract_copyright_year(window) == 2016
+
+
+class TestHasEmail:
+    """_has_email must agree with a full _EMAIL_RE search."""
+
+    @pytest.mark.parametrize("html", [
+        "",
+        "info@example.com",
+        "<a href='mailto:info@example.com'>",
+        "@example.com",
+        "call us @ example.com",
+        "a@b.c",
+        "a@@example.com",
+        "\u00e9@example.com",
+        "@media screen { body { color: red } }",
+        "first.last+tag@sub.example.co.uk",
+        "foo@bar",
+    ])
+    def test_matches_regex(self, html):
+        assert _has_email(html) is (_EMAIL_RE.search(html) is not None)
+
+
+class TestHostileHtml:
+    """Pathological markup must not trigger regex backtracking blowups."""
+
+    def _assert_fast(self, fn, html):
+        start = time.perf_counter()
+        fn(html)
+        assert time.perf_counter() - start < 1.0
+
+    def test_unclosed_title_tags(self):
+        self._assert_fast(_extract_title, "<title>" * 20000)
+
+    def test_repeated_rights_reserved_without_year(self):
+        self._assert_fast(_extract_copyright_year, "all rights reserved " * 10000)
+
+    def test_unclosed_head_and_link_tags(self):
+        self._assert_fast(_count_render_blocking, "<head " * 20000)
+        self._assert_fast(_count_render_blocking, "<head>" + "<link " * 20000)
+
+    def test_unclosed_img_tags(self):
+        self._assert_fast(lambda html: _check_broken_images(html, "https://x.com"), "<img a " * 20000)
+
+    def test_long_page_without_email(self):
+        self._assert_fast(_has_email, "word " * 200000 + "@media")
+
+    def test_title_with_angle_bracket_in_text(self):
+        assert _extract_title("<title>A < B Plumbing</title>") == "A < B Plumbing"
+
+    def test_title_without_close_tag(self):
+        assert _extract_title("<title>Home") is None
+
+
 class TestCompositeTiering:
     """Tests for composite lead tiering with signal awareness."""
 
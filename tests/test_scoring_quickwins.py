@@ -1,11 +1,8 @@
-import sys
-from pathlib import Path
-import unittest
+import dataclasses
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.append(str(PROJECT_ROOT))
+import pytest
 
-from src.scoring import evaluate_website, ScoringConfig
+from src.scoring import evaluate_website
 
 
 class _Elapsed:
@@ -51,93 +48,98 @@ BASE_HTML = f"""
 </html>
 """
 
+VIEWPORT_TAG = '<meta name="viewport" content="width=device-width, initial-scale=1">'
+DESCRIBED_HTML = BASE_HTML.replace(
+    VIEWPORT_TAG,
+    '<meta name="description" content="Example business site">' + VIEWPORT_TAG,
+)
 
-class ScoringQuickWinTests(unittest.TestCase):
-    def test_scores_slow_response(self) -> None:
-        config = ScoringConfig(
-            slow_response_ms_threshold=200,
-            weight_slow_response=20,
-        )
-        response = _Response(text=BASE_HTML, elapsed_seconds=0.5)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("slow_response_500ms", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_slow_response)
-
-    def test_scores_redirect_chain(self) -> None:
-        config = ScoringConfig(
-            redirect_chain_length_threshold=3,
-            weight_redirect_chain=15,
-        )
-        response = _Response(text=BASE_HTML, history=[object(), object(), object()])
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("redirect_chain_3", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_redirect_chain)
-
-    def test_scores_last_modified_age(self) -> None:
-        config = ScoringConfig(
-            last_modified_years_threshold=2,
-            weight_last_modified_stale=20,
-        )
-        headers = {"Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}
-        response = _Response(text=BASE_HTML, headers=headers)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertTrue(any(reason.startswith("last_modified_") for reason in result.reasons))
-        self.assertGreaterEqual(result.score, config.weight_last_modified_stale)
-
-    def test_scores_missing_meta_description(self) -> None:
-        config = ScoringConfig(weight_missing_meta_description=10)
-        html = BASE_HTML.replace('<meta name="viewport"', '<meta name="viewport"')  # no description
-        response = _Response(text=html)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("missing_meta_description", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_missing_meta_description)
-
-    def test_scores_missing_h1(self) -> None:
-        config = ScoringConfig(weight_missing_h1=8)
-        html = BASE_HTML.replace("<h1>Example</h1>", "<div>No H1</div>")
-        response = _Response(text=html)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("missing_h1", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_missing_h1)
 
-    def test_scores_generic_title(self) -> None:
-        config = ScoringConfig(weight_generic_title=10)
-        html = BASE_HTML.replace("<title>Example</title>", "<title>Home</title>")
-        response = _Response(text=html)
+@pytest.fixture
+def score(base_scoring_config):
+    """Evaluate a canned response under the default config plus overrides."""
+    def _score(response: _Response, **overrides):
+        config = dataclasses.replace(base_scoring_config, **overrides)
         result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("generic_title", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_generic_title)
-
-    def test_scores_under_construction(self) -> None:
-        config = ScoringConfig(weight_under_construction=70)
-        html = BASE_HTML.replace("<h1>Example</h1>", "<h1>Under Construction</h1>")
-        response = _Response(text=html)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("under_construction", result.reasons)
-        self.assertGreaterEqual(result.score, config.weight_under_construction)
-
-    def test_scores_client_4xx_uses_configured_weight(self) -> None:
-        config = ScoringConfig(weight_client_error=31)
-        html = BASE_HTML.replace(
-            '<meta name="viewport" content="width=device-width, initial-scale=1">',
-            '<meta name="description" content="Example business site"><meta name="viewport" content="width=device-width, initial-scale=1">',
-        )
-        response = _Response(status_code=429, text=html)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("client_error_429", result.reasons)
-        self.assertEqual(result.score, config.weight_client_error)
-
-    def test_scores_403_404_uses_configured_weight(self) -> None:
-        config = ScoringConfig(weight_not_found_or_forbidden=47)
-        html = BASE_HTML.replace(
-            '<meta name="viewport" content="width=device-width, initial-scale=1">',
-            '<meta name="description" content="Example business site"><meta name="viewport" content="width=device-width, initial-scale=1">',
-        )
-        response = _Response(status_code=404, text=html)
-        result = evaluate_website("https://example.com", config=config, response=response)
-        self.assertIn("http_404", result.reasons)
-        self.assertEqual(result.score, config.weight_not_found_or_forbidden)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        return result, config
+    return _score
+
+
+@pytest.mark.parametrize(
+    ("response_kwargs", "overrides", "expected_reason", "weight_attr"),
+    [
+        (
+            {"elapsed_seconds": 0.5},
+            {"slow_response_ms_threshold": 200, "weight_slow_response": 20},
+            "slow_response_500ms",
+            "weight_slow_response",
+        ),
+        (
+            {"history": [object(), object(), object()]},
+            {"redirect_chain_length_threshold": 3, "weight_redirect_chain": 15},
+            "redirect_chain_3",
+            "weight_redirect_chain",
+        ),
+        (
+            {},
+            {"weight_missing_meta_description": 10},
+            "missing_meta_description",
+            "weight_missing_meta_description",
+        ),
+        (
+            {"text": BASE_HTML.replace("<h1>Example</h1>", "<div>No H1</div>")},
+            {"weight_missing_h1": 8},
+            "missing_h1",
+            "weight_missing_h1",
+        ),
+        (
+            {"text": BASE_HTML.replace("<title>Example</title>", "<title>Home</title>")},
+            {"weight_generic_title": 10},
+            "generic_title",
+            "weight_generic_title",
+        ),
+        (
+            {"text": BASE_HTML.replace("<h1>Example</h1>", "<h1>Under Construction</h1>")},
+            {"weight_under_construction": 70},
+            "under_construction",
+            "weight_under_construction",
+        ),
+    ],
+    ids=[
+        "slow_response",
+        "redirect_chain",
+        "missing_meta_description",
+        "missing_h1",
+        "generic_title",
+        "under_construction",
+    ],
+)
+def test_scores_signal(score, response_kwargs, overrides, expected_reason, weight_attr):
+    response = _Response(**{"text": BASE_HTML, **response_kwargs})
+    result, config = score(response, **overrides)
+    assert expected_reason in result.reasons
+    assert result.score >= getattr(config, weight_attr)
+
+
+def test_scores_last_modified_age(score):
+    headers = {"Last-Modified": "Wed, 01 Jan 2020 00:00:00 GMT"}
+    result, config = score(
+        _Response(text=BASE_HTML, headers=headers),
+        last_modified_years_threshold=2,
+        weight_last_modified_stale=20,
+    )
+    assert any(reason.startswith("last_modified_") for reason in result.reasons)
+    assert result.score >= config.weight_last_modified_stale
+
+
+@pytest.mark.parametrize(
+    ("status_code", "overrides", "expected_reason", "weight_attr"),
+    [
+        (429, {"weight_client_error": 31}, "client_error_429", "weight_client_error"),
+        (404, {"weight_not_found_or_forbidden": 47}, "http_404", "weight_not_found_or_forbidden"),
+    ],
+)
+def test_scores_status_uses_configured_weight(score, status_code, overrides, expected_reason, weight_attr):
+    result, config = score(_Response(status_code=status_code, text=DESCRIBED_HTML), **overrides)
+    assert expected_reason in result.reasons
+    assert result.score == getattr(config, weight_attr)
@@ -1,4 +1,9 @@
 import asyncio
+import gzip
+import json
+
+import pytest
+from fastapi import BackgroundTasks
 
 from src.config import Config, PortalConfig, SMTPConfig
 from src.portal_auth import generate_portal_token
@@ -42,9 +47,7 @@ def test_portal_download_rejects_export_owned_by_other_subscriber(
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
     token = generate_portal_token("alice@example.com", config.portal.secret)
-    response = asyncio.run(
-        tracking.portal_download(bob_csv.name, token=token)
-    )
+    response = tracking.portal_download(bob_csv.name, token=token)
 
     assert response.status_code == 404
 
@@ -78,9 +81,7 @@ def test_portal_download_rejects_sibling_path_with_output_prefix(
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
     token = generate_portal_token("alice@example.com", config.portal.secret)
-    response = asyncio.run(
-        tracking.portal_download("../output-archive/alice.csv", token=token)
-    )
+    response = tracking.portal_download("../output-archive/alice.csv", token=token)
 
     assert response.status_code == 400
 
@@ -109,7 +110,7 @@ def test_dashboard_disabled_when_no_token_configured(
     monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
-    response = asyncio.run(tracking.dashboard(_make_request(), token="anything"))
+    response = tracking.dashboard(_make_request(), token="anything")
     assert response.status_code == 403
 
 
@@ -125,7 +126,7 @@ def test_dashboard_rejects_wrong_token(
     monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
-    response = asyncio.run(tracking.dashboard(_make_request(), token="wrong"))
+    response = tracking.dashboard(_make_request(), token="wrong")
     assert response.status_code == 403
 
 
@@ -141,7 +142,7 @@ def test_dashboard_allows_correct_token(
     monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
-    response = asyncio.run(tracking.dashboard(_make_request(), token="s3cret"))
+    response = tracking.dashboard(_make_request(), token="s3cret")
     assert response.status_code == 200
 
 
@@ -158,7 +159,7 @@ def test_unsubscribe_endpoint_suppresses_contact_email(
     monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
     monkeypatch.setattr(tracking, "load_config", lambda: config)
 
-    response = asyncio.run(tracking.unsubscribe("place1", _make_request()))
+    response = tracking.unsubscribe("place1", _make_request())
 
     assert response.status_code == 200
     assert test_database.is_unsubscribed("place1") is True
@@ -212,15 +213,14 @@ def test_cta_submit_within_limit_records_inquiry(test_database, monkeypatch):
     monkeypatch.setattr(tracking, "_cta_submit_limiter", SlidingWindowLimiter())
     monkeypatch.setattr(tracking, "_send_inquiry_notifications", lambda *a, **k: None)
 
-    response = asyncio.run(
-        tracking.track_cta_submit(
-            "place1",
-            _make_request(),
-            name="Jane Owner",
-            email="jane@biz.com",
-            phone="555-0100",
-            notes="Interested in a rebuild.",
-        )
+    response = tracking.track_cta_submit(
+        "place1",
+        _make_request(),
+        BackgroundTasks(),
+        name="Jane Owner",
+        email="jane@biz.com",
+        phone="555-0100",
+        notes="Interested in a rebuild.",
     )
 
     assert response.status_code == 200
@@ -249,20 +249,20 @@ def test_cta_submit_blocks_after_limit_exceeded(test_database, monkeypatch):
     )
 
     request = _make_request()
+    tasks = BackgroundTasks()
     for _ in range(tracking.CTA_SUBMIT_MAX_PER_WINDOW):
-        response = asyncio.run(
-            tracking.track_cta_submit(
-                "place1", request, name="A", email="a@biz.com", phone="", notes=""
-            )
+        response = tracking.track_cta_submit(
+            "place1", request, tasks, name="A", email="a@biz.com", phone="", notes=""
         )
         assert response.status_code == 200
 
-    blocked_response = asyncio.run(
-        tracking.track_cta_submit(
-            "place1", request, name="B", email="b@biz.com", phone="", notes=""
-        )
+    blocked_response = tracking.track_cta_submit(
+        "place1", request, tasks, name="B", email="b@biz.com", phone="", notes=""
     )
     assert blocked_response.status_code == 429
+    # Notifications are deferred until after the response is sent.
+    assert notify_calls == []
+    asyncio.run(tasks())
 
     with test_database._connect() as conn:
         rows = conn.execute(
@@ -284,10 +284,8 @@ def test_cta_submit_truncates_overlong_fields(test_database, monkeypatch):
     huge_name = "x" * 5000
     huge_notes = "y" * 10000
 
-    asyncio.run(
-        tracking.track_cta_submit(
-            "place1", _make_request(), name=huge_name, email="", phone="", notes=huge_notes
-        )
+    tracking.track_cta_submit(
+        "place1", _make_request(), BackgroundTasks(), name=huge_name, email="", phone="", notes=huge_notes
     )
 
     with test_database._connect() as conn:
@@ -296,3 +294,357 @@ def test_cta_submit_truncates_overlong_fields(test_database, monkeypatch):
         ).fetchone()
     assert len(row["name"]) == tracking.CTA_FIELD_MAX_LENGTH
     assert len(row["notes"]) == tracking.CTA_NOTES_MAX_LENGTH
+
+
+def test_unsubscribe_page_is_gzipped_when_accepted(test_database, monkeypatch):
+    config = Config(smtp=SMTPConfig(from_email="support@example.com"))
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "load_config", lambda: config)
+    monkeypatch.setattr(tracking, "_static_pages", {})
+    request = _make_request()
+    request.headers = {"accept-encoding": "gzip, deflate"}
+
+    plain = tracking.unsubscribe("place1", _make_request())
+    compressed = tracking.unsubscribe("place2", request)
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert gzip.decompress(compressed.body) == plain.body
+    assert b"support@example.com" in plain.body
+    assert len(tracking._static_pages) == 1
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("*", True),
+        ("", False),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, deflate", False),
+        ("*;q=0.5, gzip;q=0", False),
+        ("identity, x-gzipped", False),
+    ],
+)
+def test_accepts_gzip_parses_codings(header, expected):
+    assert tracking._accepts_gzip(header) is expected
+
+
+def test_unsubscribe_page_is_plain_when_gzip_refused(test_database, monkeypatch):
+    config = Config(smtp=SMTPConfig(from_email="support@example.com"))
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "load_config", lambda: config)
+    monkeypatch.setattr(tracking, "_static_pages", {})
+    request = _make_request()
+    request.headers = {"accept-encoding": "gzip;q=0, identity"}
+
+    response = tracking.unsubscribe("place1", request)
+
+    assert "content-encoding" not in response.headers
+    assert b"support@example.com" in response.body
+
+
+def test_lifespan_opens_and_closes_database(database_config, monkeypatch):
+    config = Config(database=database_config)
+    loads = []
+    monkeypatch.setattr(tracking, "load_config", lambda: loads.append(1) or config)
+    monkeypatch.setattr(tracking, "_db", None)
+    monkeypatch.setattr(tracking, "_config", None)
+
+    async def run():
+        async with tracking.lifespan(tracking.app):
+            db = tracking._db
+            assert db is not None
+            assert tracking._get_db() is db
+            assert tracking._get_config() is config
+            assert tracking._get_config() is config
+            assert len(loads) == 1
+        assert tracking._db is None
+        assert tracking._config is None
+
+    asyncio.run(run())
+
+
+def test_event_buffer_writes_in_batches(test_database, monkeypatch):
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "_engagement_event_limiter", SlidingWindowLimiter())
+    buffer = tracking._EventBuffer()
+    monkeypatch.setattr(tracking, "_event_buffer", buffer)
+    writes = []
+    original = test_database.record_events_bulk
+    monkeypatch.setattr(
+        test_database, "record_events_bulk", lambda events: writes.append(len(events)) or original(events)
+    )
+
+    buffer.start(batch_size=100, interval_seconds=60)
+    for i in range(3):
+        tracking._record_event(f"place{i}", "email_opened", _make_request())
+    assert test_database.get_events_for_lead("place0") == []
+    buffer.stop()
+
+    assert writes == [3]
+    assert len(test_database.get_events_for_lead("place2")) == 1
+
+
+def test_track_open_returns_shared_pixel(test_database, monkeypatch):
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "_engagement_event_limiter", SlidingWindowLimiter())
+
+    first = tracking.track_open("place1", _make_request("1.1.1.1"))
+    second = tracking.track_open("place2", _make_request("1.1.1.1"))
+
+    assert first is second
+    assert first.body == tracking.TRACKING_PIXEL
+    assert first.headers["content-length"] == str(len(tracking.TRACKING_PIXEL))
+    assert first.background is None
+    assert len(test_database.get_events_for_lead("place2")) == 1
+
+
+def test_io_endpoints_run_off_the_event_loop():
+    """Endpoints doing blocking SQLite/file I/O must be plain defs so FastAPI
+    runs them in its threadpool instead of stalling the event loop."""
+    import inspect
+
+    for handler in (
+        tracking.track_open,
+        tracking.view_audit,
+        tracking.track_cta_form,
+        tracking.track_cta_submit,
+        tracking.unsubscribe,
+        tracking.portal,
+        tracking.portal_download,
+        tracking.dashboard,
+    ):
+        assert not inspect.iscoroutinefunction(handler), handler.__name__
+
+
+def test_view_audit_revalidates_with_etag(tmp_path, test_database, monkeypatch):
+    audits_dir = tmp_path / "audits"
+    audits_dir.mkdir()
+    (audits_dir / "place1.html").write_text("<html>audit</html>", encoding="utf-8")
+    monkeypatch.setattr(tracking, "AUDITS_DIR", audits_dir)
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "_engagement_event_limiter", SlidingWindowLimiter())
+
+    first = tracking.view_audit("place1", _make_request("1.1.1.1"))
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "private, max-age=60"
+
+    request = _make_request("2.2.2.2")
+    request.headers = {"if-none-match": f'W/"stale", {etag}'}
+    second = tracking.view_audit("place1", request)
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.body == b""
+    assert len(test_database.get_events_for_lead("place1")) == 2
+
+
+def test_view_audit_missing_report_is_404(tmp_path, test_database, monkeypatch):
+    monkeypatch.setattr(tracking, "AUDITS_DIR", tmp_path)
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "load_config", lambda: Config(smtp=SMTPConfig(from_email="s@example.com")))
+
+    response = tracking.view_audit("missing", _make_request())
+
+    assert response.status_code == 404
+
+
+def test_audit_listing_is_cached_until_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracking, "AUDITS_DIR", tmp_path)
+    monkeypatch.setattr(tracking, "_audit_listing", (None, 0.0, frozenset()))
+
+    assert tracking._audit_names() == frozenset()
+    (tmp_path / "place1.html").write_text("<html></html>", encoding="utf-8")
+    assert "place1.html" not in tracking._audit_names()
+
+    monkeypatch.setattr(tracking, "AUDIT_LISTING_TTL_SECONDS", 0)
+    assert "place1.html" in tracking._audit_names()
+
+
+def test_inquiry_notifications_share_one_smtp_session(test_database, monkeypatch):
+    from unittest.mock import MagicMock
+
+    from src import delivery
+    from src.config import RetryConfig
+    from src.gumroad import Subscriber
+
+    config = Config(
+        smtp=SMTPConfig(from_email="s@example.com", use_tls=True),
+        retry=RetryConfig(max_retries=2, base_delay_seconds=0, jitter=False),
+    )
+    monkeypatch.setattr(tracking, "_get_config", lambda: config)
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "_pro_subscribers_cache", (0.0, []))
+    monkeypatch.setattr(
+        tracking, "get_subscribers_with_isolation",
+        lambda *a, **k: ([
+            Subscriber(
+                email=f"pro{i}@example.com", subscriber_id=str(i),
+                created_at="2024-01-01", status="active", tier="pro",
+            )
+            for i in range(3)
+        ], None),
+    )
+    server = MagicMock()
+    sent = []
+
+    def send_message(msg):
+        # Drop the connection once, after the first message went out.
+        if len(sent) == 1 and not getattr(send_message, "failed", False):
+            send_message.failed = True
+            raise ConnectionError("dropped")
+        sent.append(msg["To"])
+
+    server.send_message.side_effect = send_message
+    smtp = MagicMock()
+    smtp.return_value.__enter__.return_value = server
+    monkeypatch.setattr(delivery.smtplib, "SMTP", smtp)
+
+    tracking._send_inquiry_notifications("place1", "Bob", "bob@example.com", "555", "")
+
+    assert sent == ["pro0@example.com", "pro1@example.com", "pro2@example.com"]
+    assert smtp.call_count == 2
+    assert server.login.call_count == 2
+
+
+def test_cta_form_render_is_cached_per_place_and_name(test_database, monkeypatch):
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    tracking._cta_form_html.cache_clear()
+    renders = []
+    real_render = tracking._render_template
+    monkeypatch.setattr(
+        tracking, "_render_template",
+        lambda name, **ctx: renders.append(ctx) or real_render(name, **ctx),
+    )
+
+    first = tracking.track_cta_form("place1", _make_request())
+    second = tracking.track_cta_form("place1", _make_request())
+    tracking.track_cta_form("place2", _make_request())
+
+    assert first.body == second.body
+    assert b"/track/place1/cta" in first.body
+    assert first.headers["cache-control"] == tracking.CTA_FORM_CACHE_CONTROL
+    assert [ctx["action_url"] for ctx in renders] == ["/track/place1/cta", "/track/place2/cta"]
+    tracking._cta_form_html.cache_clear()
+
+
+def test_health_payload_is_reused_within_a_second(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(tracking.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(tracking, "_health_snapshot", (0.0, None))
+
+    first = asyncio.run(tracking.health())
+    clock[0] += 0.5
+    assert asyncio.run(tracking.health()) is first
+    clock[0] += 1.0
+    third = asyncio.run(tracking.health())
+
+    assert third is not first
+    assert third.media_type == "application/json"
+    assert json.loads(third.body)["status"] == "ok"
+
+
+def test_portal_token_verification_is_memoized_until_expiry(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    tracking._verify_portal_token_cached.cache_clear()
+    calls = []
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+    def fake_verify(token, secret):
+        calls.append(token)
+        return ("alice@example.com", expires_at)
+
+    monkeypatch.setattr(tracking, "verify_portal_token", fake_verify)
+
+    assert tracking._verify_portal_token("tok", "secret")[0] == "alice@example.com"
+    assert tracking._verify_portal_token("tok", "secret")[0] == "alice@example.com"
+    assert calls == ["tok"]
+
+    class _Later(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(minutes=10)
+
+    # The cached entry is still served, but its expiry is re-checked.
+    monkeypatch.setattr(tracking, "datetime", _Later)
+    assert tracking._verify_portal_token("tok", "secret") is None
+    assert calls == ["tok"]
+    tracking._verify_portal_token_cached.cache_clear()
+
+
+def test_portal_download_serves_own_export_with_cache_header(
+    tmp_path,
+    test_database,
+    monkeypatch,
+):
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    csv_path = output_dir / "alice.csv"
+    csv_path.write_text("name\nalice\n", encoding="utf-8")
+    test_database.record_export("run-1", "alice@example.com", 1, str(csv_path), tier="basic")
+
+    config = Config(
+        portal=PortalConfig(secret="portal-secret", base_url="https://portal.example"),
+        smtp=SMTPConfig(from_email="support@example.com"),
+    )
+    monkeypatch.setattr(tracking, "OUTPUT_DIR", output_dir)
+    monkeypatch.setattr(tracking, "_get_db", lambda: test_database)
+    monkeypatch.setattr(tracking, "load_config", lambda: config)
+    token = generate_portal_token("alice@example.com", config.portal.secret)
+
+    response = tracking.portal_download("alice.csv", token=token)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == tracking.EXPORT_CACHE_CONTROL
+
+    for bad in (".hidden.csv", "sub/alice.csv", "..\\alice.csv"):
+        assert tracking.portal_download(bad, token=token).status_code == 400
+
+
+def test_pro_subscribers_are_cached_and_failures_are_not(monkeypatch):
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(tracking, "_pro_subscribers_cache", (0.0, []))
+    responses = [
+        ([], "gumroad down"),
+        ([SimpleNamespace(tier="pro"), SimpleNamespace(tier="basic")], None),
+    ]
+    calls = []
+
+    def fake_fetch(*args):
+        calls.append(args)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    monkeypatch.setattr(tracking, "get_subscribers_with_isolation", fake_fetch)
+    config = Config()
+
+    assert tracking._pro_subscribers(config) == []
+    first = tracking._pro_subscribers(config)
+    second = tracking._pro_subscribers(config)
+
+    assert [s.tier for s in first] == ["pro"]
+    assert second is first
+    assert len(calls) == 2
+
+
+def test_portal_export_links_are_url_quoted():
+    exports = [
+        {"csv_path": "/srv/output/leads a&b.csv", "sent_at": "2026-01-01", "tier": "pro"},
+        {"csv_path": None, "sent_at": "2026-01-02"},
+    ]
+
+    items = tracking._build_portal_exports(exports, "abc+/=")
+
+    assert items[0]["filename"] == "leads a&b.csv"
+    assert items[0]["link"] == "/portal/download/leads%20a%26b.csv?token=abc%2B%2F%3D"
+    assert items[1] == {
+        "sent_at": "2026-01-02",
+        "export_type": "",
+        "tier": "",
+        "lead_count": "",
+        "filename": "n/a",
+        "link": "",
+    }
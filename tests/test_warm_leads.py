@@ -9,6 +9,7 @@ Tests for the warm lead system components:
 """
 
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -24,7 +25,7 @@ from src.audit_generator import (
     generate_audit_html,
     get_issues_json,
 )
-from src.config import OutreachConfig, DeliveryConfig
+from src.config import OutreachConfig, DeliveryConfig, load_config, validate_config
 from src.db import Lead
 from src.contact_finder import (
     ContactInfo,
@@ -33,7 +34,9 @@ from src.contact_finder import (
     _extract_mailto,
     _extract_via_regex,
     _find_contact_page_url,
+    _get_session,
     _is_valid_email,
+    select_html_parser,
 )
 
 
@@ -87,6 +90,35 @@ class TestParseReasons:
         assert len(issues) == 1
         assert "Wix" in issues[0]["title"]
 
+    def test_list_input_matches_string(self):
+        assert _parse_reasons(["ssl_error", "no_https"]) == _parse_reasons(
+            "ssl_error,no_https"
+        )
+
+    def test_callers_get_independent_issues(self):
+        first = _parse_reasons("ssl_error,no_https")
+        first[0]["title"] = "changed"
+        first.pop()
+        second = _parse_reasons("ssl_error,no_https")
+        assert len(second) == 2
+        assert second[0]["title"] == "SSL Certificate Error"
+        assert ISSUE_DESCRIPTIONS["ssl_error"]["title"] == "SSL Certificate Error"
+
+    def test_copyright_age_follows_current_year(self):
+        with patch("src.audit_generator.datetime") as mock_datetime:
+            mock_datetime.now.return_value.year = 2025
+            before = _parse_reasons("copyright_2018")[0]["description"]
+            mock_datetime.now.return_value.year = 2026
+            after = _parse_reasons("copyright_2018")[0]["description"]
+        assert "7 years out of date" in before
+        assert "8 years out of date" in after
+
+    def test_unknown_reason_warns_on_every_call(self):
+        with patch("src.audit_generator.logger") as mock_logger:
+            _parse_reasons("mystery_reason")
+            _parse_reasons("mystery_reason")
+        assert mock_logger.warning.call_count == 2
+
     def test_diy_builder_unknown(self):
         assert _parse_diy_builder("diy_unknown_builder") is None
 
@@ -154,6 +186,55 @@ class TestGetIssuesJson:
 # ============================================================
 
 
+class TestSelectHtmlParser:
+    """Tests for the CONTACT_HTML_PARSER opt-in."""
+
+    def test_defaults_to_html_parser(self):
+        with patch.dict("sys.modules", {"lxml": MagicMock()}):
+            assert select_html_parser() == "html.parser"
+
+    def test_lxml_when_requested_and_installed(self):
+        with patch.dict("sys.modules", {"lxml": MagicMock()}):
+            assert select_html_parser("lxml") == "lxml"
+
+    def test_falls_back_when_lxml_missing(self):
+        with patch.dict("sys.modules", {"lxml": None}):
+            assert select_html_parser("lxml") == "html.parser"
+
+    def test_config_reads_env(self, monkeypatch):
+        monkeypatch.setenv("CONTACT_HTML_PARSER", " LXML ")
+        assert OutreachConfig().contact_html_parser == "lxml"
+
+    def test_validate_rejects_unknown_parser(self, monkeypatch):
+        monkeypatch.setenv("CONTACT_HTML_PARSER", "html5lib")
+        errors = validate_config(
+            load_config(), require_gumroad=False, require_smtp=False
+        )
+        assert any("CONTACT_HTML_PARSER" in e for e in errors)
+
+
+class TestContactSession:
+    """Tests for the shared contact-finder session."""
+
+    def test_concurrent_first_use_builds_one_session(self, monkeypatch):
+        monkeypatch.setattr("src.contact_finder._SESSION", None)
+        barrier = threading.Barrier(8)
+        sessions = []
+
+        def worker():
+            barrier.wait()
+            sessions.append(_get_session())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(sessions) == 8
+        assert len({id(s) for s in sessions}) == 1
+
+
 class TestCleanEmail:
     """Tests for _clean_email()."""
 
@@ -166,6 +247,9 @@ class TestCleanEmail:
     def test_strips_query_params(self):
         assert _clean_email("test@example.com?subject=Hi") == "test@example.com"
 
+    def test_strips_uppercase_mailto_and_query(self):
+        assert _clean_email(" MAILTO:Owner@Biz.com?Subject=Hi ") == "owner@biz.com"
+
 
 class TestIsValidEmail:
     """Tests for _is_valid_email()."""
@@ -192,91 +276,86 @@ class TestIsValidEmail:
 class TestExtractFromJsonld:
     """Tests for _extract_from_jsonld()."""
 
-    def test_direct_email(self):
-        from bs4 import BeautifulSoup
-
+    def test_direct_email(self, make_soup):
         html = """
         <script type="application/ld+json">
         {"@type": "LocalBusiness", "email": "info@business.com"}
         </script>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_from_jsonld(soup) == "info@business.com"
 
-    def test_contact_point_email(self):
-        from bs4 import BeautifulSoup
-
+    def test_contact_point_email(self, make_soup):
         html = """
         <script type="application/ld+json">
         {"@type": "LocalBusiness", "contactPoint": {"email": "support@biz.com"}}
         </script>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_from_jsonld(soup) == "support@biz.com"
 
-    def test_no_jsonld(self):
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup("<html><body>No JSON-LD</body></html>", "html.parser")
+    def test_no_jsonld(self, make_soup):
+        soup = make_soup("<html><body>No JSON-LD</body></html>")
         assert _extract_from_jsonld(soup) is None
 
-    def test_invalid_json(self):
-        from bs4 import BeautifulSoup
-
+    def test_invalid_json(self, make_soup):
         html = '<script type="application/ld+json">not valid json</script>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_from_jsonld(soup) is None
 
 
 class TestExtractMailto:
     """Tests for _extract_mailto()."""
 
-    def test_mailto_link(self):
-        from bs4 import BeautifulSoup
-
+    def test_mailto_link(self, make_soup):
         html = '<a href="mailto:hello@business.com">Email Us</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_mailto(soup) == "hello@business.com"
 
-    def test_mailto_with_query(self):
-        from bs4 import BeautifulSoup
-
+    def test_mailto_with_query(self, make_soup):
         html = '<a href="mailto:info@biz.com?subject=Hello">Contact</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_mailto(soup) == "info@biz.com"
 
-    def test_no_mailto(self):
-        from bs4 import BeautifulSoup
+    def test_skips_invalid_mailto_and_matches_uppercase_scheme(self, make_soup):
+        html = (
+            '<a href="/mailto:fake@biz.com">Page</a>'
+            '<a href="mailto:you@example.com">Template</a>'
+            '<a href="MAILTO:Owner@Biz.com">Owner</a>'
+        )
+        soup = make_soup(html)
+        assert _extract_mailto(soup) == "owner@biz.com"
 
+    def test_no_mailto(self, make_soup):
         html = '<a href="https://example.com">Link</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _extract_mailto(soup) is None
 
 
 class TestFindContactPageUrl:
     """Tests for _find_contact_page_url()."""
 
-    def test_finds_contact_page(self):
-        from bs4 import BeautifulSoup
-
+    def test_finds_contact_page(self, make_soup):
         html = '<nav><a href="/contact">Contact Us</a></nav>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_contact_page_url(soup, "https://example.com")
         assert url == "https://example.com/contact"
 
-    def test_finds_about_page(self):
-        from bs4 import BeautifulSoup
-
+    def test_finds_about_page(self, make_soup):
         html = '<a href="/about-us">About</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         url = _find_contact_page_url(soup, "https://example.com")
         assert url == "https://example.com/about-us"
 
-    def test_no_contact_page(self):
-        from bs4 import BeautifulSoup
+    def test_matches_case_insensitively_and_keeps_original_href(self, make_soup):
+        html = '<a href="/services">Services</a><a href="/Contact-Us">Contact</a>'
+        soup = make_soup(html)
+        url = _find_contact_page_url(soup, "https://example.com")
+        assert url == "https://example.com/Contact-Us"
 
+    def test_no_contact_page(self, make_soup):
         html = '<a href="/services">Services</a>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         assert _find_contact_page_url(soup, "https://example.com") is None
 
 
@@ -294,6 +373,19 @@ class TestExtractViaRegex:
     def test_no_email(self):
         assert _extract_via_regex("<p>No email here</p>") is None
 
+    def test_returns_first_valid_after_false_positive(self):
+        html = "<p>user@example.com or sales@realbusiness.com</p>"
+        assert _extract_via_regex(html) == "sales@realbusiness.com"
+
+    def test_prefers_site_domain(self):
+        html = "<p>Built by dev@agency.net. Email office@realbusiness.com</p>"
+        assert _extract_via_regex(html, "realbusiness.com") == "office@realbusiness.com"
+        assert _extract_via_regex(html) == "dev@agency.net"
+
+    def test_falls_back_to_first_valid_off_domain(self):
+        html = "<p>Email owner@gmail.com or dev@agency.net</p>"
+        assert _extract_via_regex(html, "realbusiness.com") == "owner@gmail.com"
+
 
 # ============================================================
 # Database Extension Tests
@@ -338,6 +430,16 @@ class TestDatabaseWarmLeadMethods:
         assert len(events) == 1
         assert events[0]["event_type"] == "page_view"
 
+    def test_record_events_bulk(self, test_database):
+        now = datetime.utcnow()
+        written = test_database.record_events_bulk([
+            ("place1", "page_view", "127.0.0.1", "Mozilla/5.0", now),
+            ("place1", "cta_click", "127.0.0.1", "Mozilla/5.0", now),
+        ])
+        assert written == 2
+        assert test_database.record_events_bulk([]) == 0
+        assert test_database.get_engagement_score("place1") == 75
+
     def test_engagement_score_page_view(self, test_database):
         test_database.record_event("place1", "page_view")
         assert test_database.get_engagement_score("place1") == 25
@@ -353,6 +455,14 @@ class TestDatabaseWarmLeadMethods:
         # 25 + 25 + 50 = 100
         assert test_database.get_engagement_score("place1") == 100
 
+    def test_engagement_score_without_events_is_zero(self, test_database):
+        assert test_database.get_engagement_score("place1") == 0
+
+    def test_engagement_score_ignores_unweighted_events(self, test_database):
+        test_database.record_event("place1", "email_opened")
+        test_database.record_event("place1", "bounce")
+        assert test_database.get_engagement_score("place1") == 5
+
     def test_engagement_score_unsubscribed(self, test_database):
         test_database.record_event("place1", "page_view")
         test_database.add_unsubscribe("place1", "test@biz.com")
@@ -363,6 +473,16 @@ class TestDatabaseWarmLeadMethods:
         assert test_database.is_unsubscribed("place1") is True
         assert test_database.is_unsubscribed("place2") is False
 
+    def test_unsubscribe_place_suppresses_contact_email(self, test_database):
+        test_database.record_contact("place1", " Owner@Biz.com ", "mailto", 0.9)
+        assert test_database.unsubscribe_place("place1") == " Owner@Biz.com "
+        assert test_database.is_unsubscribed("place1") is True
+        assert test_database.is_suppressed("owner@biz.com") is True
+
+    def test_unsubscribe_place_without_contact(self, test_database):
+        assert test_database.unsubscribe_place("place2") == ""
+        assert test_database.is_unsubscribed("place2") is True
+
     def test_get_warm_leads_empty(self, test_database):
         leads = test_database.get_warm_leads()
         assert leads == []
@@ -455,6 +575,45 @@ class TestDatabaseWarmLeadMethods:
         assert all(l["place_id"] != "place_warm_shared" for l in warm)
 
 
+    def test_get_warm_leads_scores_filters_and_sorts(self, test_database):
+        events = {
+            "place_cold": ["email_opened"],
+            "place_warm": ["page_view"],
+            "place_hot": ["page_view", "cta_click"],
+        }
+        for place_id, event_types in events.items():
+            test_database.upsert_lead(Lead(
+                place_id=place_id,
+                cid=None,
+                name=place_id,
+                website=f"https://{place_id}.example",
+                address=None,
+                phone=None,
+                city="Austin, TX",
+                category="plumber",
+                score=80,
+                reasons=["no_https"],
+                first_seen=datetime.utcnow(),
+                last_seen=datetime.utcnow(),
+            ))
+            test_database.record_audit(
+                place_id, "https://track.example/audit/x", "/tmp/x.html", "[]"
+            )
+            email = f"{place_id}@biz.com"
+            test_database.record_contact(place_id, email, "mailto", 0.9)
+            test_database.record_outreach(
+                place_id, email, "https://track.example/audit/x", True
+            )
+            for event_type in event_types:
+                test_database.record_event(place_id, event_type)
+
+        warm = test_database.get_warm_leads(min_engagement_score=25)
+        assert [(l["place_id"], l["engagement_score"]) for l in warm] == [
+            ("place_hot", 75),
+            ("place_warm", 25),
+        ]
+
+
 # ============================================================
 # Outreach Tests
 # ============================================================
@@ -498,6 +657,101 @@ class TestOutreachFormatting:
 # ============================================================
 
 
+class TestWarmLeadDelivery:
+    """Tests for warm lead CSV generation and delivery."""
+
+    def test_rows_follow_columns_and_sanitize(self, tmp_path):
+        import csv
+        import io
+
+        from src.warm_delivery import WARM_CSV_COLUMNS, generate_warm_lead_csv
+
+        leads = [
+            {
+                "name": "=HYPERLINK(\"x\")",
+                "website": "https://a.example.com",
+                "score": 72,
+                "engagement_score": 30,
+                "reasons": "ssl_error,facebook_pixel",
+            },
+            {"name": "Plain Co", "score": None, "reasons": "", "lead_tier": "basic"},
+        ]
+        content, path = generate_warm_lead_csv(leads, output_path=tmp_path / "warm.csv")
+
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert path.read_bytes().decode("utf-8") == content
+        assert list(rows[0].keys()) == WARM_CSV_COLUMNS
+        assert len(rows) == 2
+        assert rows[0]["name"].startswith("'")
+        assert rows[0]["reasons"] == "ssl_error,facebook_pixel"
+        assert rows[0]["lead_tier"]
+        assert rows[1]["lead_tier"] == "basic"
+        assert rows[1]["has_marketing_pixel"] == "no"
+
+    def test_deliver_encodes_attachment_once(self, tmp_path):
+        from types import SimpleNamespace
+
+        from src import warm_delivery
+        from src.config import Config
+
+        subscribers = [
+            SimpleNamespace(email=f"s{i}@example.com", full_name=None) for i in range(3)
+        ]
+        leads = [{"name": "Plain Co", "score": 60, "reasons": "ssl_error"}]
+        sent = []
+        real_build = warm_delivery.build_csv_attachment
+
+        with patch.object(
+            warm_delivery, "generate_warm_lead_csv",
+            return_value=("name\r\nPlain Co\r\n", tmp_path / "warm.csv"),
+        ), patch.object(
+            warm_delivery, "build_csv_attachment", side_effect=real_build,
+        ) as mock_build, patch.object(
+            warm_delivery, "send_email", side_effect=lambda msg, *a: sent.append(msg),
+        ):
+            results = warm_delivery.deliver_warm_leads(subscribers, leads, Config())
+
+        assert mock_build.call_count == 1
+        assert all(r["success"] for r in results)
+        parts = [msg.get_payload()[1] for msg in sent]
+        assert all(part is parts[0] for part in parts)
+        for msg in sent:
+            assert 'filename="warm.csv"' in msg.as_string()
+        assert parts[0].get_payload(decode=True) == b"name\r\nPlain Co\r\n"
+
+    def test_deliver_sends_concurrently_in_subscriber_order(self, tmp_path):
+        import threading
+        from types import SimpleNamespace
+
+        from src import warm_delivery
+        from src.config import Config
+
+        config = Config()
+        config.smtp.parallelism = 4
+        subscribers = [
+            SimpleNamespace(email=f"s{i}@example.com", full_name=None) for i in range(4)
+        ]
+        barrier = threading.Barrier(4, timeout=5)
+
+        def fake_send(msg, *args):
+            # Only returns once all four sends are in flight at the same time.
+            barrier.wait()
+            if msg["To"] == "s2@example.com":
+                raise ConnectionError("refused")
+
+        with patch.object(
+            warm_delivery, "generate_warm_lead_csv",
+            return_value=("name\r\n", tmp_path / "warm.csv"),
+        ), patch.object(warm_delivery, "send_email", side_effect=fake_send):
+            results = warm_delivery.deliver_warm_leads(
+                subscribers, [{"name": "A"}], config
+            )
+
+        assert [r["subscriber_email"] for r in results] == [s.email for s in subscribers]
+        assert [r["success"] for r in results] == [True, True, False, True]
+        assert results[2]["error"] == "refused"
+
+
 class TestWarmLeadConfig:
     """Tests for warm lead configuration classes."""
 